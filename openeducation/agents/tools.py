@@ -5,7 +5,7 @@ import json
 from typing import Any, Dict, List
 
 from ..config import AppConfig
-from ..utils.io import ensure_dir, write_json, read_json
+from ..utils.io import ensure_dir, write_cards, read_json
 from ..content.sources import ContentSource
 from ..models.content_block import ContentBlock
 from ..models.card import Card, CardType
@@ -161,7 +161,7 @@ def flashcard_agent(prompt: str, content_blocks: str) -> str:
             )
 
     output_path = os.path.join(os.path.dirname(content_blocks), "cards.json")
-    write_json(output_path, all_cards)
+    write_cards(output_path, all_cards)
     return output_path
 
 
@@ -9,6 +9,7 @@ import requests
 
 from ..llm.openai_wrapper import OpenAIWrapper
 from ..rag.embeddings import OpenAIEmbedding
+from ..utils.io import write_cards
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -755,8 +756,7 @@ class DockerAnkiManager:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         cards_file = Path(output_dir) / f"{deck_name}_cards.json"
 
-        with open(cards_file, 'w', encoding='utf-8') as f:
-            json.dump(all_flashcards, f, indent=2, ensure_ascii=False)
+        write_cards(cards_file, all_flashcards)
 
         return {
             "deck_name": deck_name,
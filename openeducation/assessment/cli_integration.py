@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Optional
 
 import typer
 
+from ..utils.io import list_json_files, read_json
 from .child_assessment import ChildAssessmentManager, ChildProfile
 
 app = typer.Typer(help="Child assessment and progress tracking")
@@ -331,7 +331,7 @@ def list_children(
         manager = ChildAssessmentManager(data_dir)
 
         # Get all profile files
-        profile_files = list(Path(data_dir).glob("profile_*.json"))
+        profile_files = list_json_files(data_dir, "profile_")
 
         if not profile_files:
             print("👶 No child profiles found")
@@ -340,7 +340,7 @@ def list_children(
         children = []
         for profile_file in profile_files:
             try:
-                profile_data = json.loads(profile_file.read_text())
+                profile_data = read_json(profile_file)
                 child = ChildProfile(**profile_data)
 
                 # Apply filters
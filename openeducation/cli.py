@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import shutil
 from typing import List
 
 import typer
@@ -26,7 +27,7 @@ from .qa.validate import validate_cards
 from .rag.embeddings import HashEmbedding
 from .scheduling.cli_integration import app as scheduling_app
 from .syllabus.cli_integration import app as syllabus_app
-from .utils.io import ensure_dir, read_json, write_json
+from .utils.io import ensure_dir, read_json, write_cards, write_json
 from .utils.report import licensing_report, manifest
 from .world_languages.cli_integration import app as world_languages_app
 
@@ -103,8 +104,7 @@ def generate(blocks_path: str, deck_id: str = "deck_main", max_cards: int = 64):
         for c in make_cards_rulebased(b, deck_id):
             cards.append(c.to_dict())
     out = os.path.join(os.path.dirname(blocks_path), "cards.json")
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(cards, f, ensure_ascii=False, indent=2)
+    write_cards(out, cards)
     print(out)
 
 
@@ -166,10 +166,29 @@ def report(config_path: str, run_dir: str = "data/runs/latest"):
 
 
 @app.command()
-def serve(host: str = "0.0.0.0", port: int = 8000):
+def serve(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = typer.Option(1, help="Worker processes; more than one runs under gunicorn when it is installed"),
+):
+    """Run the API server."""
+    if workers > 1 and shutil.which("gunicorn"):
+        # Replace this process so gunicorn receives signals directly
+        os.execvp(
+            "gunicorn",
+            [
+                "gunicorn",
+                "-k", "uvicorn.workers.UvicornWorker",
+                "-w", str(workers),
+                "-b", f"{host}:{port}",
+                "--preload",
+                "openeducation.serve:app",
+            ],
+        )
+
     import uvicorn
 
-    uvicorn.run("openeducation.serve:app", host=host, port=port, reload=False)
+    uvicorn.run("openeducation.serve:app", host=host, port=port, workers=workers, reload=False)
 
 # Add subcommands
 app.add_typer(syllabus_app, name="syllabus", help="Syllabus generation and management")
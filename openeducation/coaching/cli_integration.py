@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Optional
 
 import typer
 
+from ..utils.io import list_json_files, read_json
 from .practice_based_coaching import CoachingCycle, PracticeBasedCoachingManager
 
 app = typer.Typer(help="Practice Based Coaching and staff development")
@@ -272,7 +272,7 @@ def list_cycles(
         manager = PracticeBasedCoachingManager(data_dir)
 
         # Get all cycle files
-        cycle_files = list(Path(data_dir).glob("cycle_*.json"))
+        cycle_files = list_json_files(data_dir, "cycle_")
 
         if not cycle_files:
             print("📋 No coaching cycles found")
@@ -281,7 +281,7 @@ def list_cycles(
         cycles = []
         for cycle_file in cycle_files:
             try:
-                cycle_data = json.loads(cycle_file.read_text())
+                cycle_data = read_json(cycle_file)
                 cycle = CoachingCycle(**cycle_data)
 
                 # Apply filters
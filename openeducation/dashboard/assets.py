@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Dict
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+STATIC_DIR = "openeducation/dashboard/static"
+
+# A URL carrying the current content hash never changes meaning, so it can be
+# cached for a year; bare URLs must revalidate, which costs a 304 via the ETag
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_REVALIDATE = "no-cache"
+
+
+class CachedStatic(StaticFiles):
+    """StaticFiles serving content-hash ETags and Cache-Control headers.
+
+    Hashes are computed once at startup, so a restart is needed to pick up
+    edited assets (as with any deploy).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.versions = self._hash_files()
+
+    def _hash_files(self) -> Dict[str, str]:
+        versions: Dict[str, str] = {}
+        if self.directory is None or not os.path.isdir(self.directory):
+            return versions
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                full_path = os.path.join(root, name)
+                with open(full_path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()[:16]
+                rel_path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                versions[rel_path] = digest
+        return versions
+
+    def version(self, path: str) -> str:
+        """Content hash of a static file, for building ``?v=`` URLs."""
+        return self.versions.get(path, "")
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        rel_path = os.path.relpath(full_path, os.path.realpath(self.directory)).replace(os.sep, "/")
+        version = self.versions.get(rel_path)
+        if version is not None:
+            response.headers["etag"] = f'"{version}"'
+            requested = QueryParams(scope.get("query_string", b"")).get("v")
+            response.headers["cache-control"] = _IMMUTABLE if requested == version else _REVALIDATE
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+# Shared by the /static mount and the templates that link to it
+static_files = CachedStatic(directory=STATIC_DIR, check_dir=False)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Optional
 
 import typer
 
+from ..utils.io import list_json_files, read_json
 from .eld_core import ELDDomain, ELDManager, EnglishProficiencyLevel
 
 app = typer.Typer(help="English Language Development (ELD) instruction and support")
@@ -399,7 +399,7 @@ def list_profiles(
         manager = ELDManager(data_dir)
 
         # Get all profile files
-        profile_files = list(Path(data_dir).glob("eld_profile_*.json"))
+        profile_files = list_json_files(data_dir, "eld_profile_")
 
         if not profile_files:
             print("👶 No ELD profiles found")
@@ -408,7 +408,7 @@ def list_profiles(
         profiles = []
         for profile_file in profile_files:
             try:
-                profile_data = json.loads(profile_file.read_text())
+                profile_data = read_json(profile_file)
                 # Convert string level back to enum for filtering
                 profile_data["current_level"] = EnglishProficiencyLevel(profile_data["current_level"])
                 profile = manager._load_eld_profile_by_student(profile_data["student_id"])
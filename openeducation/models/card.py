@@ -50,6 +50,26 @@ class Card:
             tags=tags or [],
         )
 
+    @staticmethod
+    def basic_dict(
+        front: str,
+        back: str,
+        source_id: str = "",
+        deck_id: str = "",
+        tags: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Return ``Card.basic(...).to_dict()`` without building the Card."""
+        return {
+            "id": _id(front + back),
+            "deck_id": deck_id,
+            "front": front,
+            "back": back,
+            "card_type": CardType.BASIC.value,
+            "tags": tags or [],
+            "media": [],
+            "source_id": source_id,
+        }
+
     @classmethod
     def cloze(
         cls, text: str, extra: str, deck_id: str, source_id: str, tags: List[str] = []
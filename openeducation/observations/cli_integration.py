@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Optional
 
 import typer
 
+from ..utils.io import list_json_files, read_json
 from .observation_tools import ClassroomObservation, ObservationToolsManager
 
 app = typer.Typer(help="Classroom observation and data collection tools")
@@ -177,7 +177,7 @@ def list_observations(
         manager = ObservationToolsManager(data_dir)
 
         # Get all observation files
-        obs_files = list(Path(data_dir).glob("observation_*.json"))
+        obs_files = list_json_files(data_dir, "observation_")
 
         if not obs_files:
             print("📋 No observations found")
@@ -186,7 +186,7 @@ def list_observations(
         observations = []
         for obs_file in obs_files:
             try:
-                obs_data = json.loads(obs_file.read_text())
+                obs_data = read_json(obs_file)
                 observation = ClassroomObservation(**obs_data)
 
                 # Apply filters
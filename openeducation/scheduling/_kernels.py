@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..utils._jit import jit_or
+
+
+def _topic_means_loop(topic_idx: np.ndarray, lapses: np.ndarray, n_topics: int) -> np.ndarray:
+    """Single-pass group mean of 1 / (1 + lapses), written for numba."""
+    sums = np.zeros(n_topics)
+    counts = np.zeros(n_topics)
+    for i in range(topic_idx.shape[0]):
+        t = topic_idx[i]
+        sums[t] += 1.0 / (1.0 + lapses[i])
+        counts[t] += 1.0
+    return sums / counts
+
+
+def _topic_means_numpy(topic_idx: np.ndarray, lapses: np.ndarray, n_topics: int) -> np.ndarray:
+    """Vectorized fallback used when numba is unavailable."""
+    scores = 1.0 / (1.0 + lapses)
+    sums = np.bincount(topic_idx, weights=scores, minlength=n_topics)
+    counts = np.bincount(topic_idx, minlength=n_topics)
+    return sums / counts
+
+
+topic_means = jit_or(_topic_means_loop, _topic_means_numpy)
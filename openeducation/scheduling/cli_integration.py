@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
-
+import mmap
+import os
+import shlex
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional
+
+import click
+import orjson
 import typer
 
 from .progress_tracker import AnkiPerformance, ProgressTracker, StudySession
@@ -10,6 +18,21 @@ from .progress_tracker import AnkiPerformance, ProgressTracker, StudySession
 app = typer.Typer(help="Learning progress tracking and study management")
 
 
+@lru_cache(maxsize=None)
+def _get_tracker(data_dir: str) -> ProgressTracker:
+    """Share one tracker per data directory across commands run in-process."""
+    return ProgressTracker(data_dir)
+
+
+def _load_reviews(reviews_file: str) -> Any:
+    """Parse a reviews export straight from a read-only memory map."""
+    with open(reviews_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf, memoryview(buf) as view:
+            return orjson.loads(view)
+
+
 @app.command()
 def import_anki_reviews(
     syllabus_id: str = typer.Option(..., help="ID of the syllabus to associate with"),
@@ -19,16 +42,15 @@ def import_anki_reviews(
 ) -> None:
     """Import Anki review data from a JSON file."""
     try:
-        tracker = ProgressTracker(data_dir)
-        
-        with open(reviews_file, 'r', encoding='utf-8') as f:
-            reviews_data = json.load(f)
-
-        anki_reviews = [AnkiPerformance(**review) for review in reviews_data]
-        
-        tracker.import_anki_reviews(syllabus_id, student_id, anki_reviews)
-        
-        print(f"✅ Successfully imported {len(anki_reviews)} Anki reviews for syllabus '{syllabus_id}'.")
+        tracker = _get_tracker(data_dir)
+
+        # Build AnkiPerformance objects lazily as the tracker consumes them
+        reviews_data = _load_reviews(reviews_file)
+        anki_reviews = (AnkiPerformance(**review) for review in reviews_data)
+
+        count = tracker.import_anki_reviews(syllabus_id, student_id, anki_reviews)
+
+        print(f"✅ Successfully imported {count} Anki reviews for syllabus '{syllabus_id}'.")
         print(f"   Student ID: {student_id}")
 
     except FileNotFoundError:
@@ -50,13 +72,13 @@ def start_tracking(
 ) -> None:
     """Start tracking progress for a syllabus."""
     try:
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         progress = tracker.start_tracking(syllabus_id, student_id)
 
         print(f"✅ Started tracking progress for syllabus '{syllabus_id}'")
         print(f"   Student ID: {student_id}")
         print(f"   Start Date: {progress.start_date}")
-        print(f"   Progress file: {data_dir}/{syllabus_id}_{student_id}_progress.json")
+        print(f"   Progress file: {data_dir}/{syllabus_id}_{student_id}_progress.json.gz")
 
     except Exception as e:
         print(f"❌ Error starting progress tracking: {e}")
@@ -74,6 +96,7 @@ def log_session(
     difficulty_rating: Optional[int] = typer.Option(None, help="Difficulty rating (1-5)"),
     understanding_level: Optional[int] = typer.Option(None, help="Understanding level (1-5)"),
     notes: str = typer.Option("", help="Study session notes"),
+    deck: Optional[List[str]] = typer.Option(None, help="Anki deck studied in this session (repeatable)"),
     data_dir: str = typer.Option("data/progress", help="Progress data directory")
 ) -> None:
     """Log a completed study session."""
@@ -83,7 +106,7 @@ def log_session(
         if understanding_level and not (1 <= understanding_level <= 5):
             raise ValueError("Understanding level must be between 1 and 5")
 
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
 
         session = StudySession(
             id=f"{student_id}_{objective_id}_{unit_id}",
@@ -96,7 +119,8 @@ def log_session(
             completed=completed,
             notes=notes,
             difficulty_rating=difficulty_rating,
-            understanding_level=understanding_level
+            understanding_level=understanding_level,
+            deck_tags=set(deck or ())
         )
 
         tracker.log_session(session)
@@ -125,43 +149,45 @@ def get_report(
 ) -> None:
     """Get a comprehensive progress report."""
     try:
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         report = tracker.get_progress_report(syllabus_id, student_id)
 
         if "error" in report:
             print(f"❌ {report['error']}")
             raise typer.Exit(1)
 
-        print(f"📊 Progress Report for {syllabus_id}")
-        print(f"   Student: {student_id}")
-        print("=" * 60)
-
         overall = report["overall_progress"]
-        print("\n🎯 Overall Progress:")
-        print(f"   Completion Rate: {overall['completion_rate']}%")
-        print(f"   Sessions Completed: {overall['completed_sessions']}/{overall['total_sessions']}")
-        print(f"   Total Study Time: {overall['total_study_time']} minutes")
-        print(f"   Average Session Time: {overall['average_session_time']:.1f} minutes")
-        print(f"   Current Streak: {overall['current_streak']} days")
-
         metrics = report["performance_metrics"]
-        print("\n📈 Performance Metrics:")
-        print(f"   Average Difficulty: {metrics['average_difficulty']}/5")
-        print(f"   Average Understanding: {metrics['average_understanding']}/5")
-
-        print("\n📚 Unit Breakdown:")
-        for unit_id, unit_data in report["unit_breakdown"].items():
-            print(f"   {unit_id}: {unit_data['completion_rate']}% complete, {unit_data['total_time']} min")
+        lines = [
+            f"📊 Progress Report for {syllabus_id}",
+            f"   Student: {student_id}",
+            "=" * 60,
+            "\n🎯 Overall Progress:",
+            f"   Completion Rate: {overall['completion_rate']}%",
+            f"   Sessions Completed: {overall['completed_sessions']}/{overall['total_sessions']}",
+            f"   Total Study Time: {overall['total_study_time']} minutes",
+            f"   Average Session Time: {overall['average_session_time']:.1f} minutes",
+            f"   Current Streak: {overall['current_streak']} days",
+            "\n📈 Performance Metrics:",
+            f"   Average Difficulty: {metrics['average_difficulty']}/5",
+            f"   Average Understanding: {metrics['average_understanding']}/5",
+            "\n📚 Unit Breakdown:",
+        ]
+        lines.extend(
+            f"   {unit_id}: {unit_data['completion_rate']}% complete, {unit_data['total_time']} min"
+            for unit_id, unit_data in report["unit_breakdown"].items()
+        )
 
         if report["achievements"]:
-            print("\n🏆 Achievements:")
-            for achievement in report["achievements"]:
-                print(f"   ✓ {achievement}")
+            lines.append("\n🏆 Achievements:")
+            lines.extend(f"   ✓ {achievement}" for achievement in report["achievements"])
 
         if report["challenges"]:
-            print("\n⚠️  Challenges:")
-            for challenge in report["challenges"]:
-                print(f"   • {challenge}")
+            lines.append("\n⚠️  Challenges:")
+            lines.extend(f"   • {challenge}" for challenge in report["challenges"])
+
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error getting report: {e}")
@@ -176,31 +202,35 @@ def get_performance_report(
 ) -> None:
     """Generate a performance report with weak/strong topics."""
     try:
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         report = tracker.generate_performance_report(syllabus_id, student_id)
 
-        print(f"🚀 Performance Report for {report.student_id} on Syllabus '{report.syllabus_id}'")
-        print(f"   Report Date: {report.report_date}")
-        print("=" * 60)
-        
-        print(f"\n📈 Overall Completion Rate: {report.overall_completion_rate}%")
-        
+        lines = [
+            f"🚀 Performance Report for {report.student_id} on Syllabus '{report.syllabus_id}'",
+            f"   Report Date: {report.report_date}",
+            "=" * 60,
+            f"\n📈 Overall Completion Rate: {report.overall_completion_rate}%",
+        ]
+
         if report.weak_topics:
-            print("\n⚠️  Topics to Focus On:")
-            for topic, score in report.weak_topics.items():
-                print(f"   - {topic} (Performance Score: {score:.2f})")
-        
+            lines.append("\n⚠️  Topics to Focus On:")
+            lines.extend(
+                f"   - {topic} (Performance Score: {score:.2f})" for topic, score in report.weak_topics.items()
+            )
+
         if report.strong_topics:
-            print("\n✅ Strong Topics:")
-            for topic, score in report.strong_topics.items():
-                print(f"   - {topic} (Performance Score: {score:.2f})")
+            lines.append("\n✅ Strong Topics:")
+            lines.extend(
+                f"   - {topic} (Performance Score: {score:.2f})" for topic, score in report.strong_topics.items()
+            )
 
         if not report.weak_topics and not report.strong_topics:
-             print("\n📊 No specific weak or strong topics identified. Keep up the consistent work!")
+            lines.append("\n📊 No specific weak or strong topics identified. Keep up the consistent work!")
+
+        lines.append("\n📝 Detailed Feedback:")
+        lines.extend(f"   - {line}" for line in report.detailed_feedback)
 
-        print("\n📝 Detailed Feedback:")
-        for line in report.detailed_feedback:
-            print(f"   - {line}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error generating performance report: {e}")
@@ -216,7 +246,7 @@ def add_achievement(
 ) -> None:
     """Add an achievement to the student's progress."""
     try:
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         tracker.update_achievement(syllabus_id, student_id, achievement)
 
         print(f"✅ Achievement added: {achievement}")
@@ -237,7 +267,7 @@ def log_challenge(
 ) -> None:
     """Log a challenge or difficulty encountered."""
     try:
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         tracker.log_challenge(syllabus_id, student_id, challenge)
 
         print(f"✅ Challenge logged: {challenge}")
@@ -261,7 +291,7 @@ def generate_schedule(
         with open(syllabus_file.replace('.json', '_schedule.json'), 'r', encoding='utf-8') as f:
             schedule = json.load(f)
 
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         sessions = tracker.generate_study_schedule(schedule, student_id)
 
         print(f"📅 Generated {len(sessions)} study sessions for {student_id}")
@@ -299,7 +329,7 @@ def export_progress(
 ) -> None:
     """Export progress data to JSON format."""
     try:
-        tracker = ProgressTracker(data_dir)
+        tracker = _get_tracker(data_dir)
         report = tracker.get_progress_report(syllabus_id, student_id)
 
         if "error" in report:
@@ -326,5 +356,95 @@ def export_progress(
         raise typer.Exit(1)
 
 
+def _export_report(student_id: str, syllabus_id: str, data_dir: str, output_dir: str) -> Dict[str, Any]:
+    """Build and write one student's progress report (runs in a worker process)."""
+    report = ProgressTracker(data_dir).get_progress_report(syllabus_id, student_id)
+    if "error" in report:
+        return {"student_id": student_id, "error": report["error"]}
+
+    output_file = os.path.join(output_dir, f"{syllabus_id}_{student_id}_progress_export.json")
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return {"student_id": student_id, "output_file": output_file, **report["overall_progress"]}
+
+
+@app.command()
+def batch_report(
+    syllabus_id: str = typer.Option(..., help="ID of the syllabus"),
+    student_ids: List[str] = typer.Argument(..., help="Student identifiers to report on"),
+    output_dir: str = typer.Option(".", help="Directory for the exported reports"),
+    workers: Optional[int] = typer.Option(None, help="Worker processes (default: CPU count)"),
+    data_dir: str = typer.Option("data/progress", help="Progress data directory")
+) -> None:
+    """Export progress reports for many students in parallel."""
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Each student's report is independent, so fan out across processes
+        export = partial(_export_report, syllabus_id=syllabus_id, data_dir=data_dir, output_dir=output_dir)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(export, student_ids))
+
+        lines = [f"📦 Batch Report for {syllabus_id}: {len(results)} students", "=" * 60]
+        exported = 0
+        for result in results:
+            if "error" in result:
+                lines.append(f"   ❌ {result['student_id']}: {result['error']}")
+            else:
+                exported += 1
+                lines.append(
+                    f"   ✅ {result['student_id']}: {result['completion_rate']}% complete, "
+                    f"{result['total_study_time']} min -> {result['output_file']}"
+                )
+        lines.append(f"\n✅ Exported {exported}/{len(results)} reports to: {output_dir}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    except Exception as e:
+        print(f"❌ Error generating batch reports: {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def repl(
+    data_dir: str = typer.Option("data/progress", help="Progress data directory")
+) -> None:
+    """Run many tracking commands in one process, one per line of stdin.
+
+    Each line is either a JSON array of arguments or a shell-quoted command line,
+    e.g. ``["log-session", "--syllabus-id", "bio", ...]``. Blank lines and lines
+    starting with ``#`` are skipped. Commands share the same tracker and default
+    to this command's ``--data-dir``.
+    """
+    command = typer.main.get_command(app)
+    total = failed = 0
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        total += 1
+        try:
+            args = json.loads(line) if line.startswith("[") else shlex.split(line)
+            if args and args[0] == "repl":
+                raise ValueError("'repl' cannot be nested")
+            if "--data-dir" not in args:
+                args += ["--data-dir", data_dir]
+            exit_code = command.main(args, prog_name="repl", standalone_mode=False)
+        except click.ClickException as e:
+            print(f"❌ {e.format_message()}")
+            exit_code = 1
+        except ValueError as e:
+            print(f"❌ Invalid command line: {e}")
+            exit_code = 1
+
+        if exit_code:
+            failed += 1
+
+    print(f"\n✅ Ran {total - failed}/{total} commands")
+    if failed:
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
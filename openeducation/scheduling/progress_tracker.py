@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import gzip
+import os
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
-from ..utils.io import read_json, write_json
+import numpy as np
+import orjson
 
+from ._kernels import topic_means
 
-@dataclass
+# Subdirectory of data_dir holding cached progress reports; the leading dot keeps
+# it out of listings of the progress records themselves
+_REPORT_CACHE_DIR = ".report_cache"
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the set-valued fields orjson does not handle natively."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write a serialized buffer in one call, then swap it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+@dataclass(slots=True)
 class AnkiPerformance:
     """Detailed performance metrics for a single Anki card review."""
     card_id: str
@@ -19,7 +42,7 @@ class AnkiPerformance:
     review_history: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StudySession:
     """A single study session with objectives and progress."""
     id: str
@@ -36,6 +59,19 @@ class StudySession:
     difficulty_rating: Optional[int] = None  # 1-5 scale
     understanding_level: Optional[int] = None  # 1-5 scale
     anki_performance: List[AnkiPerformance] = field(default_factory=list)
+    deck_tags: Set[str] = field(default_factory=set)  # Anki decks studied in this session
+
+    def __post_init__(self) -> None:
+        self.deck_tags = set(self.deck_tags)  # saved as a JSON list
+
+
+@dataclass(slots=True)
+class UnitStats:
+    """Running totals for one syllabus unit, updated as sessions are logged."""
+    total_sessions: int = 0
+    completed_sessions: int = 0
+    total_time: int = 0  # minutes
+    objectives: Set[str] = field(default_factory=set)
 
 
 @dataclass
@@ -50,7 +86,7 @@ class PerformanceReport:
     detailed_feedback: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningProgress:
     """Overall learning progress tracking."""
     syllabus_id: str
@@ -62,9 +98,18 @@ class LearningProgress:
     total_study_time: int = 0  # minutes
     average_difficulty: Optional[float] = None
     average_understanding: Optional[float] = None
+    current_streak: int = 0  # consecutive study days ending on last_completed_date
+    last_completed_date: Optional[str] = None
     sessions: List[StudySession] = field(default_factory=list)
     achievements: List[str] = field(default_factory=list)
     challenges: List[str] = field(default_factory=list)
+    unit_stats: Dict[str, UnitStats] = field(default_factory=dict)
+    # Parsed form of last_completed_date; underscore fields are not serialized
+    _last_completed: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.last_completed_date:
+            self._last_completed = date.fromisoformat(self.last_completed_date)
 
 
 class ProgressTracker:
@@ -74,18 +119,38 @@ class ProgressTracker:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-    def import_anki_reviews(self, syllabus_id: str, student_id: str, anki_reviews: List[AnkiPerformance]) -> None:
-        """Import Anki review data and associate with study sessions."""
+    def import_anki_reviews(self, syllabus_id: str, student_id: str, anki_reviews: Iterable[AnkiPerformance]) -> int:
+        """Import Anki review data and associate with study sessions.
+
+        Reviews are consumed one at a time, so a generator can be passed to avoid
+        materializing the full list. Returns the number of reviews read.
+        """
         progress = self._load_progress(syllabus_id, student_id)
-        # Simple association: associate with the most recent session for the deck
+        # Associate each review with the most recent session that is tagged with
+        # its deck or mentions it in the notes. Reviews repeat a handful of deck
+        # names, so each name is resolved once and remembered.
+        sessions = progress.sessions[::-1]
+        latest = sessions[0] if sessions else None
+        deck_sessions: Dict[str, Optional[StudySession]] = {}
+
+        count = 0
         for review in anki_reviews:
-            for session in reversed(progress.sessions):
-                # This logic can be improved with more context
-                if review.deck_name in session.notes or syllabus_id in review.deck_name:
-                    session.anki_performance.append(review)
-                    break
+            count += 1
+            if latest is not None and syllabus_id in review.deck_name:
+                session = latest
+            else:
+                deck = review.deck_name
+                if deck in deck_sessions:
+                    session = deck_sessions[deck]
+                else:
+                    session = deck_sessions[deck] = next(
+                        (s for s in sessions if deck in s.deck_tags or deck in s.notes), None
+                    )
+            if session is not None:
+                session.anki_performance.append(review)
         progress.last_updated = datetime.now().isoformat()
         self._save_progress(progress)
+        return count
 
     def start_tracking(self, syllabus_id: str, student_id: str) -> LearningProgress:
         """Start tracking progress for a syllabus."""
@@ -106,11 +171,13 @@ class ProgressTracker:
 
         # Add session
         progress.sessions.append(session)
+        self._update_unit_stats(progress.unit_stats, session)
         progress.total_sessions += 1
         progress.last_updated = datetime.now().isoformat()
 
         if session.completed:
             progress.completed_sessions += 1
+            self._update_streak(progress, self._session_date(session))
 
         if session.duration_actual:
             progress.total_study_time += session.duration_actual
@@ -138,23 +205,23 @@ class ProgressTracker:
         # Calculate completion rate
         completion_rate = (progress.completed_sessions / progress.total_sessions * 100) if progress.total_sessions > 0 else 0
 
-        # Analyze Anki performance to find weak/strong topics
-        topic_performance = {}
+        # Analyze Anki performance to find weak/strong topics. Reviews are
+        # flattened into (topic, lapses) arrays and reduced in one kernel call;
+        # score is 1.0 for a card never lapsed and drops as lapses grow.
+        topic_ids: Dict[str, int] = {}
+        topic_idx: List[int] = []
+        lapses: List[int] = []
         for session in progress.sessions:
             if not session.anki_performance:
                 continue
 
-            topic_id = session.objective_id  # Assuming objective_id maps to a topic
-            if topic_id not in topic_performance:
-                topic_performance[topic_id] = []
-
+            topic = topic_ids.setdefault(session.objective_id, len(topic_ids))  # objective_id maps to a topic
             for card in session.anki_performance:
-                # Simple metric: high lapses = poor performance.
-                # Score: 1.0 = perfect, lower is worse.
-                score = 1.0 / (1 + card.lapses)
-                topic_performance[topic_id].append(score)
+                topic_idx.append(topic)
+                lapses.append(card.lapses)
 
-        avg_topic_scores = {topic: sum(scores) / len(scores) for topic, scores in topic_performance.items()}
+        means = topic_means(np.asarray(topic_idx, dtype=np.int64), np.asarray(lapses, dtype=np.int64), len(topic_ids))
+        avg_topic_scores = {topic: float(means[i]) for topic, i in topic_ids.items()}
         weak_topics = {topic: score for topic, score in avg_topic_scores.items() if score < 0.6}
         strong_topics = {topic: score for topic, score in avg_topic_scores.items() if score >= 0.8}
 
@@ -171,41 +238,52 @@ class ProgressTracker:
         )
 
     def get_progress_report(self, syllabus_id: str, student_id: str) -> Dict[str, Any]:
-        """Generate a comprehensive progress report."""
+        """Generate a comprehensive progress report.
+
+        Reports are cached in a hidden subdirectory of the data directory and
+        reused until the progress file is rewritten (or the day changes, since
+        the streak depends on today).
+        """
         try:
-            progress = self._load_progress(syllabus_id, student_id)
+            cache_key = self._report_cache_key(syllabus_id, student_id)
         except FileNotFoundError:
             return {"error": "No progress data found"}
 
+        cache_file = self.data_dir / _REPORT_CACHE_DIR / f"{syllabus_id}_{student_id}_report.json"
+        if cache_file.exists():
+            try:
+                cached = orjson.loads(cache_file.read_bytes())
+            except orjson.JSONDecodeError:
+                cached = {}
+            if cached.get("cache_key") == cache_key:
+                return cached["report"]
+
+        progress = self._load_progress(syllabus_id, student_id)
+        report = self._build_progress_report(progress)
+        cache_file.parent.mkdir(exist_ok=True)
+        (self.data_dir / cache_file.name).unlink(missing_ok=True)  # left by versions that cached beside the records
+        _write_bytes_atomic(cache_file, orjson.dumps({"cache_key": cache_key, "report": report}))
+        return report
+
+    def _report_cache_key(self, syllabus_id: str, student_id: str) -> str:
+        """Identify the current state of a progress file without parsing it."""
+        progress_file = self._progress_path(syllabus_id, student_id)
+        if not progress_file.exists():
+            progress_file = progress_file.with_suffix("")  # legacy uncompressed file
+        stat = progress_file.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}:{date.today().isoformat()}"
+
+    def _build_progress_report(self, progress: LearningProgress) -> Dict[str, Any]:
+        """Assemble the progress report from precomputed totals."""
         # Calculate completion rates
         completion_rate = (progress.completed_sessions / progress.total_sessions * 100) if progress.total_sessions > 0 else 0
 
-        # Group sessions by unit
-        unit_progress = {}
-        for session in progress.sessions:
-            if session.unit_id not in unit_progress:
-                unit_progress[session.unit_id] = {
-                    "total_sessions": 0,
-                    "completed_sessions": 0,
-                    "total_time": 0,
-                    "objectives": set()
-                }
-
-            unit_progress[session.unit_id]["total_sessions"] += 1
-            unit_progress[session.unit_id]["objectives"].add(session.objective_id)
-
-            if session.completed:
-                unit_progress[session.unit_id]["completed_sessions"] += 1
-
-            if session.duration_actual:
-                unit_progress[session.unit_id]["total_time"] += session.duration_actual
-
         # Calculate study streaks
-        streak = self._calculate_study_streak(progress.sessions)
+        streak = self._calculate_study_streak(progress)
 
         return {
-            "syllabus_id": syllabus_id,
-            "student_id": student_id,
+            "syllabus_id": progress.syllabus_id,
+            "student_id": progress.student_id,
             "overall_progress": {
                 "completion_rate": round(completion_rate, 1),
                 "total_sessions": progress.total_sessions,
@@ -220,11 +298,11 @@ class ProgressTracker:
             },
             "unit_breakdown": {
                 unit_id: {
-                    "completion_rate": round((stats["completed_sessions"] / stats["total_sessions"] * 100), 1),
-                    "total_time": stats["total_time"],
-                    "objectives_covered": len(stats["objectives"])
+                    "completion_rate": round((stats.completed_sessions / stats.total_sessions * 100), 1),
+                    "total_time": stats.total_time,
+                    "objectives_covered": len(stats.objectives)
                 }
-                for unit_id, stats in unit_progress.items()
+                for unit_id, stats in progress.unit_stats.items()
             },
             "achievements": progress.achievements,
             "challenges": progress.challenges,
@@ -234,15 +312,21 @@ class ProgressTracker:
     def generate_study_schedule(self, syllabus_schedule: Dict[str, Any], student_id: str) -> List[StudySession]:
         """Generate personalized study sessions from syllabus schedule."""
         sessions = []
+        # Loop invariants are looked up once rather than per objective
+        prefix = f"{student_id}_"
+        syllabus_id = syllabus_schedule["syllabus_id"]
 
         for unit in syllabus_schedule["schedule"]:
+            unit_id = unit["unit_id"]
             for objective in unit["objectives"]:
+                objective_id = objective["objective_id"]
+                start_date = objective["start_date"]
                 session = StudySession(
-                    id=f"{student_id}_{objective['objective_id']}_{objective['start_date']}",
-                    syllabus_id=syllabus_schedule["syllabus_id"],
-                    unit_id=unit["unit_id"],
-                    objective_id=objective["objective_id"],
-                    scheduled_date=objective["start_date"],
+                    id=f"{prefix}{objective_id}_{start_date}",
+                    syllabus_id=syllabus_id,
+                    unit_id=unit_id,
+                    objective_id=objective_id,
+                    scheduled_date=start_date,
                     duration_planned=objective["estimated_time"]
                 )
                 sessions.append(session)
@@ -269,6 +353,21 @@ class ProgressTracker:
         progress.last_updated = datetime.now().isoformat()
         self._save_progress(progress)
 
+    def _update_unit_stats(self, unit_stats: Dict[str, UnitStats], session: StudySession) -> None:
+        """Fold a single session into the per-unit running totals."""
+        stats = unit_stats.get(session.unit_id)
+        if stats is None:
+            stats = unit_stats[session.unit_id] = UnitStats()
+
+        stats.total_sessions += 1
+        stats.objectives.add(session.objective_id)
+
+        if session.completed:
+            stats.completed_sessions += 1
+
+        if session.duration_actual:
+            stats.total_time += session.duration_actual
+
     def _update_averages(self, progress: LearningProgress) -> None:
         """Update average performance metrics."""
         difficulty_ratings = [s.difficulty_rating for s in progress.sessions if s.difficulty_rating]
@@ -290,87 +389,92 @@ class ProgressTracker:
             feedback.append("Consistent effort is showing! Keep up the great work across all topics.")
         return feedback
 
-    def _calculate_study_streak(self, sessions: List[StudySession]) -> int:
-        """Calculate current study streak in days."""
-        if not sessions:
-            return 0
-
-        # Get completed sessions sorted by date
-        completed_sessions = [s for s in sessions if s.completed and s.actual_date]
-        if not completed_sessions:
-            return 0
-
-        completed_sessions.sort(key=lambda s: s.actual_date, reverse=True)
+    @staticmethod
+    def _session_date(session: StudySession) -> date:
+        """Day a session took place, defaulting to today when it was not recorded."""
+        if session.actual_date:
+            return datetime.fromisoformat(session.actual_date).date()
+        return datetime.now().date()
+
+    def _update_streak(self, progress: LearningProgress, session_date: date) -> None:
+        """Extend or restart the study streak for a newly completed session."""
+        if progress._last_completed is None:
+            progress.current_streak = 1
+        else:
+            gap = (session_date - progress._last_completed).days
+            if gap < 1:
+                # Same day, or a back-dated session: the streak is unchanged
+                return
+            progress.current_streak = progress.current_streak + 1 if gap == 1 else 1
 
-        streak = 0
-        current_date = datetime.now().date()
+        progress._last_completed = session_date
+        progress.last_completed_date = session_date.isoformat()
 
-        for session in completed_sessions:
-            session_date = datetime.fromisoformat(session.actual_date).date()
+    def _calculate_study_streak(self, progress: LearningProgress) -> int:
+        """Calculate current study streak in days."""
+        if progress._last_completed is None:
+            return 0
 
-            # If this session is from today or yesterday (allowing for one day gap)
-            if (current_date - session_date).days <= 1:
-                streak += 1
-                current_date = session_date - timedelta(days=1)
-            else:
-                break
+        # The streak is broken once a full day passes without a completed session
+        gap = (datetime.now().date() - progress._last_completed).days
+        return progress.current_streak if gap <= 1 else 0
 
-        return streak
+    def _progress_path(self, syllabus_id: str, student_id: str) -> Path:
+        """Path of the gzip-compressed progress file for a student."""
+        return self.data_dir / f"{syllabus_id}_{student_id}_progress.json.gz"
 
     def _load_progress(self, syllabus_id: str, student_id: str) -> LearningProgress:
         """Load progress data from file."""
-        progress_file = self.data_dir / f"{syllabus_id}_{student_id}_progress.json"
+        progress_file = self._progress_path(syllabus_id, student_id)
+        legacy_file = progress_file.with_suffix("")  # uncompressed *_progress.json
         if progress_file.exists():
-            data = read_json(str(progress_file))
-            return LearningProgress(**data)
+            raw = gzip.decompress(progress_file.read_bytes())
+        elif legacy_file.exists():
+            raw = legacy_file.read_bytes()
         else:
             raise FileNotFoundError(f"Progress file not found: {progress_file}")
+        return self._progress_from_dict(orjson.loads(raw))
+
+    def _progress_from_dict(self, data: Dict[str, Any]) -> LearningProgress:
+        """Rebuild LearningProgress and its nested dataclasses from saved JSON."""
+        data["sessions"] = [self._session_from_dict(s) for s in data.get("sessions", [])]
+        unit_stats = data.pop("unit_stats", None)
+        has_streak = "current_streak" in data
+        progress = LearningProgress(**data)
+
+        if not has_streak:
+            # Files written before the streak was persisted: replay it once,
+            # parsing each session's date a single time
+            completed_dates = sorted(
+                self._session_date(s) for s in progress.sessions if s.completed and s.actual_date
+            )
+            for session_date in completed_dates:
+                self._update_streak(progress, session_date)
 
-    def _save_progress(self, progress: LearningProgress) -> None:
-        """Save progress data to file."""
-        progress_file = self.data_dir / f"{progress.syllabus_id}_{progress.student_id}_progress.json"
+        if unit_stats is None:
+            # Files written before unit stats were persisted: build them once
+            for session in progress.sessions:
+                self._update_unit_stats(progress.unit_stats, session)
+        else:
+            progress.unit_stats = {
+                unit_id: UnitStats(**{**stats, "objectives": set(stats["objectives"])})
+                for unit_id, stats in unit_stats.items()
+            }
+        return progress
 
-        # Convert to dict for JSON serialization
-        data = {
-            "syllabus_id": progress.syllabus_id,
-            "student_id": progress.student_id,
-            "start_date": progress.start_date,
-            "last_updated": progress.last_updated,
-            "total_sessions": progress.total_sessions,
-            "completed_sessions": progress.completed_sessions,
-            "total_study_time": progress.total_study_time,
-            "average_difficulty": progress.average_difficulty,
-            "average_understanding": progress.average_understanding,
-            "sessions": [
-                {
-                    "id": s.id,
-                    "syllabus_id": s.syllabus_id,
-                    "unit_id": s.unit_id,
-                    "objective_id": s.objective_id,
-                    "scheduled_date": s.scheduled_date,
-                    "actual_date": s.actual_date,
-                    "duration_planned": s.duration_planned,
-                    "duration_actual": s.duration_actual,
-                    "completed": s.completed,
-                    "notes": s.notes,
-                    "resources_used": s.resources_used,
-                    "difficulty_rating": s.difficulty_rating,
-                    "understanding_level": s.understanding_level,
-                    "anki_performance": [
-                        {
-                            "card_id": p.card_id,
-                            "deck_name": p.deck_name,
-                            "lapses": p.lapses,
-                            "ease_factor": p.ease_factor,
-                            "review_date": p.review_date,
-                            "review_history": p.review_history,
-                        } for p in s.anki_performance
-                    ]
-                }
-                for s in progress.sessions
-            ],
-            "achievements": progress.achievements,
-            "challenges": progress.challenges,
-        }
+    @staticmethod
+    def _session_from_dict(data: Dict[str, Any]) -> StudySession:
+        """Rebuild a StudySession (and its Anki reviews) from saved JSON."""
+        anki_performance = [AnkiPerformance(**p) for p in data.pop("anki_performance", [])]
+        return StudySession(**data, anki_performance=anki_performance)
 
-        write_json(str(progress_file), data)
+    def _save_progress(self, progress: LearningProgress) -> None:
+        """Save progress data to file."""
+        progress_file = self._progress_path(progress.syllabus_id, progress.student_id)
+
+        # orjson serializes the dataclasses (sessions, reviews, unit stats) natively;
+        # level 1 gzip shrinks the verbose review history at negligible CPU cost.
+        # The temp-file swap means a crash mid-write never truncates the history.
+        data = orjson.dumps(progress, default=_json_default)
+        _write_bytes_atomic(progress_file, gzip.compress(data, compresslevel=1))
+        progress_file.with_suffix("").unlink(missing_ok=True)
@@ -1,43 +1,135 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Set
 
-from fastapi import FastAPI, HTTPException
-from fastapi.staticfiles import StaticFiles
+import anyio
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse
 
+from .dashboard.assets import static_files
 from .dashboard.routes import router as dashboard_router
-from .utils.io import read_json
+from .utils.io import cards_gzip_path, cards_summary_path, read_json
 
 app = FastAPI(title="OpenEducation API")
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="openeducation/dashboard/static"), name="static")
+app.mount("/static", static_files, name="static")
 
 # Include routers
 app.include_router(dashboard_router, tags=["Dashboard"])
 
 
+@dataclass
+class _Deck:
+    """Parsed cards.json plus the lookups derived from it."""
+    mtime_ns: int
+    cards: List[Dict[str, Any]]
+    index: Dict[str, Dict[str, Any]]  # id -> card, first card wins on duplicate ids
+    summary: Dict[str, Any]
+
+
+# cards_path -> most recently parsed version of that deck
+_DECKS: Dict[str, _Deck] = {}
+_MAX_DECKS = 32
+# Decks are parsed in worker threads; inserts and evictions must not interleave
+_DECKS_LOCK = threading.Lock()
+
+
+def _parse_deck(cards_path: str, mtime_ns: int) -> _Deck:
+    cards = read_json(cards_path)
+
+    # One pass collects the tag set and interns each tag, so a tag repeated
+    # across thousands of cards is held as a single string object
+    tags: Set[str] = set()
+    for c in cards:
+        card_tags = c.get("tags")
+        if card_tags:
+            c["tags"] = card_tags = [sys.intern(t) for t in card_tags]
+            tags.update(card_tags)
+
+    deck = _Deck(
+        mtime_ns=mtime_ns,
+        cards=cards,
+        index={c["id"]: c for c in reversed(cards)},
+        summary={"count": len(cards), "tags": sorted(tags)},
+    )
+    with _DECKS_LOCK:
+        if cards_path not in _DECKS and len(_DECKS) >= _MAX_DECKS:
+            _DECKS.pop(next(iter(_DECKS)))  # evict the oldest deck
+        _DECKS[cards_path] = deck
+    return deck
+
+
+def _stat_cards(run_dir: str, detail: str) -> tuple[str, int]:
+    """Return cards.json's path and mtime, or 404 if it does not exist."""
+    cards_path = os.path.join(run_dir, "cards.json")
+    try:
+        return cards_path, os.stat(cards_path).st_mtime_ns
+    except FileNotFoundError:
+        raise HTTPException(404, detail) from None
+
+
+def _is_fresh(derived_path: os.PathLike, cards_mtime_ns: int) -> bool:
+    """Whether a file derived from cards.json exists and is at least as new as it."""
+    try:
+        return os.stat(derived_path).st_mtime_ns >= cards_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+async def _get_deck(cards_path: str, mtime_ns: int) -> _Deck:
+    """Return the cached deck, parsing it in a worker thread only when it changed."""
+    deck = _DECKS.get(cards_path)
+    if deck is None or deck.mtime_ns != mtime_ns:
+        try:
+            deck = await anyio.to_thread.run_sync(_parse_deck, cards_path, mtime_ns)
+        except FileNotFoundError:  # removed since it was stat'ed
+            raise HTTPException(404, "No cards.json found") from None
+    return deck
+
+
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 
 @app.get("/deck/summary")
-def deck_summary(run_dir: str = "data/runs/latest"):
-    cards_path = os.path.join(run_dir, "cards.json")
-    if not os.path.exists(cards_path):
-        raise HTTPException(404, f"No cards.json found in {run_dir}")
-    cards = read_json(cards_path)
-    return {"count": len(cards), "tags": sorted({t for c in cards for t in c.get("tags", [])})}
+async def deck_summary(run_dir: str = "data/runs/latest"):
+    cards_path, mtime_ns = _stat_cards(run_dir, f"No cards.json found in {run_dir}")
+
+    # Prefer the summary written alongside cards.json, unless it is missing or stale
+    summary_path = cards_summary_path(cards_path)
+    if _is_fresh(summary_path, mtime_ns):
+        return FileResponse(summary_path, media_type="application/json")
+    return (await _get_deck(cards_path, mtime_ns)).summary
+
+
+@app.get("/deck/raw")
+async def deck_raw(request: Request, run_dir: str = "data/runs/latest"):
+    """Stream cards.json as-is; the server can sendfile() it without parsing.
+
+    Clients accepting gzip get the precompressed cards.json.gz when it is up to
+    date. FileResponse also sets Content-Length and honours Range requests, so
+    large decks can be resumed or fetched in parallel chunks.
+    """
+    cards_path, mtime_ns = _stat_cards(run_dir, f"No cards.json found in {run_dir}")
+    headers = {"Vary": "Accept-Encoding"}
+    gzip_path = cards_gzip_path(cards_path)
+    if "gzip" in request.headers.get("accept-encoding", "") and _is_fresh(gzip_path, mtime_ns):
+        headers["Content-Encoding"] = "gzip"
+        return FileResponse(gzip_path, media_type="application/json", headers=headers)
+    return FileResponse(cards_path, media_type="application/json", headers=headers)
 
 
 @app.get("/deck/card/{card_id}")
-def deck_card(card_id: str, run_dir: str = "data/runs/latest"):
-    cards_path = os.path.join(run_dir, "cards.json")
-    if not os.path.exists(cards_path):
-        raise HTTPException(404, "No cards.json found")
-    cards = read_json(cards_path)
-    for c in cards:
-        if c["id"] == card_id:
-            return c
-    raise HTTPException(404, f"Card {card_id} not found")
+async def deck_card(card_id: str, run_dir: str = "data/runs/latest"):
+    cards_path, mtime_ns = _stat_cards(run_dir, "No cards.json found")
+    deck = await _get_deck(cards_path, mtime_ns)
+    card = deck.index.get(card_id)
+    if card is None:
+        raise HTTPException(404, f"Card {card_id} not found")
+    return card
@@ -0,0 +1 @@
+"""Subject templates compiled from templates/*.json by scripts/gen_templates.py."""
@@ -0,0 +1,68 @@
+# Generated by scripts/gen_templates.py from templates/biliteracy_dual_language.json; do not edit.
+
+TEMPLATE = {'title': 'Biliteracy/Dual Language Program',
+ 'description': 'Development of proficiency in two languages with academic content.',
+ 'standards': ['WIDA', 'Common Core', 'Language Standards'],
+ 'materials': ['Dual language texts', 'Language learning software', 'Cultural resources'],
+ 'grading_policy': {'language_assessment': 25,
+                    'content_assessment': 35,
+                    'cultural_projects': 20,
+                    'participation': 20},
+ 'prerequisites': ['Basic proficiency in one language'],
+ 'learning_outcomes': ['Develop proficiency in two languages',
+                       'Understand cultural contexts and perspectives',
+                       'Apply academic content in multiple languages',
+                       'Value and respect linguistic diversity'],
+ 'units': [{'title': 'Language Fundamentals',
+            'description': 'Basic vocabulary, grammar, and communication in both languages.',
+            'assessment_methods': ['Language assessments',
+                                   'Conversational practice',
+                                   'Vocabulary quizzes'],
+            'resources': ['Language learning apps', 'Dual language dictionaries'],
+            'projects': ['Language immersion activity', 'Cultural presentation'],
+            'objectives': [{'title': 'Basic Communication',
+                            'description': 'Develop basic communication skills in both languages',
+                            'standard': 'BL.1',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Use basic vocabulary',
+                                                    'Form simple sentences']}]},
+           {'title': 'Academic Language Development',
+            'description': 'Academic vocabulary and concepts in both languages.',
+            'assessment_methods': ['Academic writing',
+                                   'Content discussions',
+                                   'Vocabulary building'],
+            'resources': ['Academic texts', 'Vocabulary builders', 'Language support tools'],
+            'projects': ['Academic presentation', 'Bilingual research project'],
+            'objectives': [{'title': 'Academic Vocabulary',
+                            'description': 'Build academic vocabulary in both languages',
+                            'standard': 'BL.2',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Use academic terms',
+                                                    'Explain concepts in both languages']}]},
+           {'title': 'Cultural Understanding',
+            'description': 'Cultural perspectives, traditions, and cross-cultural communication.',
+            'assessment_methods': ['Cultural analysis',
+                                   'Cross-cultural projects',
+                                   'Cultural presentations'],
+            'resources': ['Cultural materials', 'Multicultural literature', 'Media resources'],
+            'projects': ['Cultural exchange project', 'Multicultural festival'],
+            'objectives': [{'title': 'Cultural Perspectives',
+                            'description': 'Understand and appreciate different cultural '
+                                           'perspectives',
+                            'standard': 'BL.3',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Compare cultural practices',
+                                                    'Demonstrate cultural understanding']}]},
+           {'title': 'Advanced Biliteracy Skills',
+            'description': 'Advanced reading, writing, and thinking in both languages.',
+            'assessment_methods': ['Biliteracy assessments',
+                                   'Advanced projects',
+                                   'Portfolio reviews'],
+            'resources': ['Advanced texts', 'Writing support', 'Assessment tools'],
+            'projects': ['Biliteracy portfolio', 'Advanced research project'],
+            'objectives': [{'title': 'Advanced Biliteracy',
+                            'description': 'Demonstrate advanced proficiency in both languages',
+                            'standard': 'BL.4',
+                            'estimated_time': 120,
+                            'assessment_criteria': ['Read complex texts',
+                                                    'Write academic content in both languages']}]}]}
@@ -0,0 +1,68 @@
+# Generated by scripts/gen_templates.py from templates/classroom_management.json; do not edit.
+
+TEMPLATE = {'title': 'Classroom Management and Instructional Strategies',
+ 'description': 'Effective classroom management and evidence-based teaching strategies.',
+ 'standards': ['Teaching Standards', 'Classroom Management Standards'],
+ 'materials': ['Management resources', 'Strategy guides', 'Observation tools'],
+ 'grading_policy': {'management_plan': 25,
+                    'strategy_implementation': 25,
+                    'reflections': 20,
+                    'peer_observations': 15,
+                    'final_project': 15},
+ 'prerequisites': ['Education coursework', 'Classroom observation experience'],
+ 'learning_outcomes': ['Create positive classroom environments',
+                       'Implement effective management strategies',
+                       'Use evidence-based instructional methods',
+                       'Reflect on and improve teaching practice'],
+ 'units': [{'title': 'Classroom Environment and Culture',
+            'description': 'Creating positive, inclusive classroom environments.',
+            'assessment_methods': ['Environment plans', 'Culture assessments', 'Student feedback'],
+            'resources': ['Environment design tools', 'Culture building activities'],
+            'projects': ['Classroom design project', 'Culture building plan'],
+            'objectives': [{'title': 'Positive Environment',
+                            'description': 'Create and maintain positive classroom environments',
+                            'standard': 'CM.1',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Design classroom layout',
+                                                    'Establish classroom norms']}]},
+           {'title': 'Behavior Management',
+            'description': 'Preventing and addressing student behavior challenges.',
+            'assessment_methods': ['Management plans',
+                                   'Behavior scenarios',
+                                   'Strategy implementation'],
+            'resources': ['Behavior management guides',
+                          'Scenario training',
+                          'Intervention strategies'],
+            'projects': ['Behavior management plan', 'Intervention case study'],
+            'objectives': [{'title': 'Behavior Strategies',
+                            'description': 'Implement effective behavior management strategies',
+                            'standard': 'CM.2',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Develop behavior plans',
+                                                    'Apply intervention strategies']}]},
+           {'title': 'Instructional Strategies',
+            'description': 'Evidence-based teaching methods and strategies.',
+            'assessment_methods': ['Lesson planning',
+                                   'Strategy implementation',
+                                   'Student outcomes'],
+            'resources': ['Strategy guides', 'Lesson planning tools', 'Assessment methods'],
+            'projects': ['Strategy implementation project', 'Lesson study'],
+            'objectives': [{'title': 'Teaching Strategies',
+                            'description': 'Apply evidence-based instructional strategies',
+                            'standard': 'CM.3',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Implement strategies',
+                                                    'Assess student learning']}]},
+           {'title': 'Assessment and Reflection',
+            'description': 'Assessment design and reflective teaching practice.',
+            'assessment_methods': ['Assessment creation',
+                                   'Teaching reflections',
+                                   'Improvement plans'],
+            'resources': ['Assessment tools', 'Reflection guides', 'Data analysis tools'],
+            'projects': ['Assessment design project', 'Teaching portfolio'],
+            'objectives': [{'title': 'Reflective Practice',
+                            'description': 'Reflect on teaching practice and make improvements',
+                            'standard': 'CM.4',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Analyze teaching practice',
+                                                    'Develop improvement plans']}]}]}
@@ -0,0 +1,66 @@
+# Generated by scripts/gen_templates.py from templates/health_fitness.json; do not edit.
+
+TEMPLATE = {'title': 'Health and Fitness Education',
+ 'description': 'Comprehensive health education and physical fitness development.',
+ 'standards': ['National Health Standards', 'Physical Education Standards'],
+ 'materials': ['Fitness equipment', 'Health education resources', 'Assessment tools'],
+ 'grading_policy': {'fitness_assessments': 25,
+                    'health_projects': 25,
+                    'participation': 20,
+                    'knowledge_tests': 15,
+                    'reflections': 15},
+ 'prerequisites': ['Basic movement skills'],
+ 'learning_outcomes': ['Understand health concepts and behaviors',
+                       'Develop physical fitness and skills',
+                       'Make healthy lifestyle choices',
+                       'Understand mental and emotional health'],
+ 'units': [{'title': 'Personal Health and Wellness',
+            'description': 'Understanding personal health, nutrition, and wellness.',
+            'assessment_methods': ['Health assessments', 'Nutrition logs', 'Wellness plans'],
+            'resources': ['Health assessment tools', 'Nutrition guides', 'Wellness resources'],
+            'projects': ['Personal wellness plan', 'Nutrition analysis project'],
+            'objectives': [{'title': 'Health Concepts',
+                            'description': 'Understand basic health concepts and behaviors',
+                            'standard': 'HE.1',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Explain health concepts',
+                                                    'Identify healthy behaviors']}]},
+           {'title': 'Physical Fitness',
+            'description': 'Developing cardiovascular, muscular, and flexibility fitness.',
+            'assessment_methods': ['Fitness tests', 'Skill assessments', 'Progress tracking'],
+            'resources': ['Fitness equipment', 'Assessment tools', 'Training guides'],
+            'projects': ['Fitness improvement plan', 'Skill development project'],
+            'objectives': [{'title': 'Fitness Components',
+                            'description': 'Develop all components of physical fitness',
+                            'standard': 'HE.2',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Demonstrate fitness skills',
+                                                    'Show fitness improvement']}]},
+           {'title': 'Mental and Emotional Health',
+            'description': 'Understanding mental health, stress management, and emotional '
+                           'wellness.',
+            'assessment_methods': ['Mental health surveys',
+                                   'Stress management logs',
+                                   'Emotional awareness'],
+            'resources': ['Mental health resources',
+                          'Stress management tools',
+                          'Mindfulness activities'],
+            'projects': ['Mental health awareness project', 'Stress management plan'],
+            'objectives': [{'title': 'Emotional Wellness',
+                            'description': 'Understand and promote mental and emotional health',
+                            'standard': 'HE.3',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Identify mental health strategies',
+                                                    'Practice stress management']}]},
+           {'title': 'Health Education and Advocacy',
+            'description': 'Health education, disease prevention, and health advocacy.',
+            'assessment_methods': ['Health presentations', 'Advocacy projects', 'Health campaigns'],
+            'resources': ['Health education materials', 'Advocacy tools', 'Community resources'],
+            'projects': ['Health education campaign', 'Disease prevention project'],
+            'objectives': [{'title': 'Health Advocacy',
+                            'description': 'Promote health education and advocate for healthy '
+                                           'communities',
+                            'standard': 'HE.4',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Create health campaigns',
+                                                    'Advocate for health issues']}]}]}
@@ -0,0 +1,68 @@
+# Generated by scripts/gen_templates.py from templates/language_literacy.json; do not edit.
+
+TEMPLATE = {'title': 'Language Arts and Literacy',
+ 'description': 'Advanced reading, writing, speaking, and critical thinking skills.',
+ 'standards': ['Common Core ELA', 'Writing Standards'],
+ 'materials': ['Literature anthologies', 'Writing journals', 'Research databases'],
+ 'grading_policy': {'essays': 30,
+                    'reading_responses': 20,
+                    'presentations': 20,
+                    'tests': 15,
+                    'participation': 15},
+ 'prerequisites': ['Basic reading and writing skills'],
+ 'learning_outcomes': ['Analyze complex literary works',
+                       'Write clear and effective arguments',
+                       'Communicate effectively in various contexts',
+                       'Think critically about language and literature'],
+ 'units': [{'title': 'Literary Analysis and Interpretation',
+            'description': 'Close reading and analysis of literary texts from various genres.',
+            'assessment_methods': ['Literary analysis essays',
+                                   'Textual evidence',
+                                   'Discussion participation'],
+            'resources': ['Literary texts', 'Analysis guides', 'Discussion protocols'],
+            'projects': ['Literary analysis paper', 'Genre study project'],
+            'objectives': [{'title': 'Text Analysis',
+                            'description': 'Analyze literary texts using various critical '
+                                           'approaches',
+                            'standard': 'ELA.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Identify literary devices',
+                                                    'Support interpretations with evidence']}]},
+           {'title': 'Argumentative Writing',
+            'description': 'Developing and defending arguments through writing.',
+            'assessment_methods': ['Argumentative essays', 'Research papers', 'Peer review'],
+            'resources': ['Writing guides', 'Research databases', 'Citation tools'],
+            'projects': ['Research argument paper', 'Policy analysis essay'],
+            'objectives': [{'title': 'Argument Development',
+                            'description': 'Develop and defend arguments with evidence and '
+                                           'reasoning',
+                            'standard': 'ELA.2',
+                            'estimated_time': 120,
+                            'assessment_criteria': ['Present clear arguments',
+                                                    'Support claims with evidence']}]},
+           {'title': 'Public Speaking and Communication',
+            'description': 'Effective oral communication and presentation skills.',
+            'assessment_methods': ['Presentations', 'Debates', 'Discussion leadership'],
+            'resources': ['Presentation tools', 'Debate guides', 'Video recording'],
+            'projects': ['Major presentation', 'Debate tournament'],
+            'objectives': [{'title': 'Oral Communication',
+                            'description': 'Deliver effective oral presentations and participate '
+                                           'in discussions',
+                            'standard': 'ELA.3',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Deliver presentations',
+                                                    'Participate effectively in discussions']}]},
+           {'title': 'Research and Information Literacy',
+            'description': 'Conducting research and evaluating information sources.',
+            'assessment_methods': ['Research projects',
+                                   'Source evaluation',
+                                   'Information synthesis'],
+            'resources': ['Research databases', 'Citation guides', 'Information evaluation tools'],
+            'projects': ['Major research project', 'Information literacy portfolio'],
+            'objectives': [{'title': 'Research Skills',
+                            'description': 'Conduct effective research and evaluate information '
+                                           'sources',
+                            'standard': 'ELA.4',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Conduct thorough research',
+                                                    'Evaluate source credibility']}]}]}
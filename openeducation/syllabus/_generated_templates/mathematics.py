@@ -0,0 +1,65 @@
+# Generated by scripts/gen_templates.py from templates/mathematics.json; do not edit.
+
+TEMPLATE = {'title': 'Mathematics: Algebra and Beyond',
+ 'description': 'Advanced mathematical reasoning, problem-solving, and applications.',
+ 'standards': ['Common Core Math', 'Mathematical Practices'],
+ 'materials': ['Graphing calculator', 'Mathematics software', 'Manipulatives'],
+ 'grading_policy': {'problem_sets': 30, 'tests': 35, 'projects': 20, 'participation': 15},
+ 'prerequisites': ['Basic algebra', 'Geometry'],
+ 'learning_outcomes': ['Solve complex mathematical problems',
+                       'Apply mathematics to real-world situations',
+                       'Use technology effectively in mathematics',
+                       'Communicate mathematical reasoning clearly'],
+ 'units': [{'title': 'Advanced Algebra',
+            'description': 'Polynomial functions, rational expressions, and systems of equations.',
+            'assessment_methods': ['Problem solving', 'Equation solving', 'Function analysis'],
+            'resources': ['Graphing calculator', 'Algebra software'],
+            'projects': ['Mathematical modeling project', 'Function analysis study'],
+            'objectives': [{'title': 'Polynomial Functions',
+                            'description': 'Analyze and solve polynomial equations and '
+                                           'inequalities',
+                            'standard': 'Math.A.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Solve polynomial equations',
+                                                    'Graph polynomial functions']}]},
+           {'title': 'Trigonometry and Analytic Geometry',
+            'description': 'Trigonometric functions, identities, and coordinate geometry.',
+            'assessment_methods': ['Trigonometric proofs',
+                                   'Coordinate geometry',
+                                   'Modeling problems'],
+            'resources': ['Graphing software', 'Trigonometry tables'],
+            'projects': ['Trigonometric modeling', 'Geometry proofs'],
+            'objectives': [{'title': 'Trigonometric Functions',
+                            'description': 'Understand and apply trigonometric functions and '
+                                           'identities',
+                            'standard': 'Math.T.1',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Solve trigonometric equations',
+                                                    'Prove trigonometric identities']}]},
+           {'title': 'Statistics and Probability',
+            'description': 'Data analysis, statistical inference, and probability theory.',
+            'assessment_methods': ['Statistical analysis',
+                                   'Probability problems',
+                                   'Data interpretation'],
+            'resources': ['Statistics software', 'Data sets', 'Calculator'],
+            'projects': ['Statistical research project', 'Probability simulations'],
+            'objectives': [{'title': 'Statistical Analysis',
+                            'description': 'Apply statistical methods to analyze and interpret '
+                                           'data',
+                            'standard': 'Math.S.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Calculate statistics',
+                                                    'Interpret data patterns']}]},
+           {'title': 'Calculus Preparation',
+            'description': 'Limits, derivatives, and integrals - introduction to calculus.',
+            'assessment_methods': ['Limit problems',
+                                   'Derivative calculations',
+                                   'Integration problems'],
+            'resources': ['Graphing calculator', 'Calculus software'],
+            'projects': ['Rate of change analysis', 'Area calculations'],
+            'objectives': [{'title': 'Limits and Continuity',
+                            'description': 'Understand limits and continuity in functions',
+                            'standard': 'Math.C.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Evaluate limits',
+                                                    'Analyze function continuity']}]}]}
@@ -0,0 +1,69 @@
+# Generated by scripts/gen_templates.py from templates/science.json; do not edit.
+
+TEMPLATE = {'title': 'High School Science: Integrated Science',
+ 'description': 'Comprehensive study of scientific principles, methods, and applications across '
+                'multiple disciplines.',
+ 'standards': ['NGSS', 'Common Core'],
+ 'materials': ['Textbook', 'Lab equipment', 'Digital microscope', 'Science journal'],
+ 'grading_policy': {'labs': 30, 'tests': 35, 'homework': 20, 'projects': 15},
+ 'prerequisites': ['Basic math skills', 'Reading comprehension'],
+ 'learning_outcomes': ['Understand scientific method and inquiry',
+                       'Apply scientific principles to real-world problems',
+                       'Design and conduct scientific investigations',
+                       'Communicate scientific information effectively'],
+ 'units': [{'title': 'Introduction to Scientific Inquiry',
+            'description': 'Foundational principles of scientific method, hypothesis testing, and '
+                           'data analysis.',
+            'assessment_methods': ['Lab reports', 'Hypothesis testing', 'Data analysis'],
+            'resources': ['Scientific method worksheets', 'Lab safety guide'],
+            'projects': ['Design simple experiment'],
+            'objectives': [{'title': 'Scientific Method',
+                            'description': 'Understand and apply the steps of scientific inquiry',
+                            'standard': 'NGSS.SCI-HS.1',
+                            'estimated_time': 45,
+                            'assessment_criteria': ['Identify variables',
+                                                    'Form testable hypotheses']}]},
+           {'title': 'Chemistry Fundamentals',
+            'description': 'Atomic structure, chemical bonding, reactions, and stoichiometry.',
+            'assessment_methods': ['Lab experiments', 'Chemical calculations', 'Reaction analysis'],
+            'resources': ['Periodic table', 'Molecular model kit'],
+            'projects': ['Chemical reaction demonstrations'],
+            'objectives': [{'title': 'Atomic Structure',
+                            'description': 'Understand atomic structure and electron configuration',
+                            'standard': 'NGSS.SCI-HS.2',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Draw electron configurations',
+                                                    'Predict element properties']}]},
+           {'title': 'Biology: Life Systems',
+            'description': 'Cell structure, genetics, evolution, and ecology.',
+            'assessment_methods': ['Microscopy labs', 'Genetic crosses', 'Ecosystem analysis'],
+            'resources': ['Microscope', 'DNA model', 'Field guides'],
+            'projects': ['Ecosystem study', 'Genetic inheritance project'],
+            'objectives': [{'title': 'Cell Biology',
+                            'description': 'Understand cell structure and function',
+                            'standard': 'NGSS.SCI-HS.3',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Identify cell organelles',
+                                                    'Explain cellular processes']}]},
+           {'title': 'Physics: Forces and Motion',
+            'description': 'Mechanics, energy, waves, and electricity.',
+            'assessment_methods': ['Physics labs', 'Problem solving', 'Demonstrations'],
+            'resources': ['Physics equipment', 'Calculator', 'Video analysis software'],
+            'projects': ['Physics demonstration', 'Energy efficiency analysis'],
+            'objectives': [{'title': "Newton's Laws",
+                            'description': "Apply Newton's laws to real-world situations",
+                            'standard': 'NGSS.SCI-HS.4',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Solve force problems',
+                                                    'Design force experiments']}]},
+           {'title': 'Environmental Science',
+            'description': 'Ecosystems, sustainability, and environmental impact.',
+            'assessment_methods': ['Field studies', 'Impact assessments', 'Solution proposals'],
+            'resources': ['Environmental monitoring tools', 'GIS software'],
+            'projects': ['Environmental impact study', 'Sustainability plan'],
+            'objectives': [{'title': 'Ecosystem Dynamics',
+                            'description': 'Understand ecosystem interactions and energy flow',
+                            'standard': 'NGSS.SCI-HS.5',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Analyze food webs',
+                                                    'Predict environmental changes']}]}]}
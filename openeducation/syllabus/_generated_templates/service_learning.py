@@ -0,0 +1,62 @@
+# Generated by scripts/gen_templates.py from templates/service_learning.json; do not edit.
+
+TEMPLATE = {'title': 'Service Learning: Community Engagement and Leadership',
+ 'description': 'Hands-on learning through community service and civic engagement.',
+ 'standards': ['Service Learning Standards', 'Leadership Standards'],
+ 'materials': ['Service log books', 'Project planning tools', 'Community resources'],
+ 'grading_policy': {'service_hours': 30,
+                    'reflection_essays': 25,
+                    'project_planning': 20,
+                    'presentation': 15,
+                    'leadership': 10},
+ 'prerequisites': ['Community service interest', 'Basic communication skills'],
+ 'learning_outcomes': ['Develop leadership and teamwork skills',
+                       'Understand community needs and resources',
+                       'Apply academic knowledge to real-world problems',
+                       'Reflect on personal growth and social responsibility'],
+ 'units': [{'title': 'Service Learning Foundations',
+            'description': 'Understanding service learning principles and community needs.',
+            'assessment_methods': ['Needs assessment', 'Service plans', 'Reflection journals'],
+            'resources': ['Community directories', 'Service organization guides'],
+            'projects': ['Community needs assessment', 'Personal service plan'],
+            'objectives': [{'title': 'Service Learning Principles',
+                            'description': 'Understand the principles and benefits of service '
+                                           'learning',
+                            'standard': 'SL.1',
+                            'estimated_time': 45,
+                            'assessment_criteria': ['Explain service learning',
+                                                    'Identify community needs']}]},
+           {'title': 'Project Planning and Implementation',
+            'description': 'Planning and executing community service projects.',
+            'assessment_methods': ['Project proposals', 'Implementation logs', 'Progress reports'],
+            'resources': ['Project planning templates', 'Community partner contacts'],
+            'projects': ['Community service project', 'Leadership initiative'],
+            'objectives': [{'title': 'Project Management',
+                            'description': 'Plan and manage community service projects effectively',
+                            'standard': 'SL.2',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Create project plans',
+                                                    'Manage project execution']}]},
+           {'title': 'Leadership and Collaboration',
+            'description': 'Developing leadership skills and working in teams.',
+            'assessment_methods': ['Leadership assessments', 'Team evaluations', 'Peer reviews'],
+            'resources': ['Leadership development materials', 'Team building activities'],
+            'projects': ['Leadership workshop', 'Team collaboration project'],
+            'objectives': [{'title': 'Leadership Skills',
+                            'description': 'Develop and demonstrate leadership abilities',
+                            'standard': 'SL.3',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Demonstrate leadership',
+                                                    'Collaborate effectively']}]},
+           {'title': 'Reflection and Impact Assessment',
+            'description': 'Reflecting on service experiences and assessing impact.',
+            'assessment_methods': ['Reflection portfolios', 'Impact assessments', 'Presentations'],
+            'resources': ['Reflection guides', 'Impact assessment tools'],
+            'projects': ['Service impact study', 'Personal growth portfolio'],
+            'objectives': [{'title': 'Critical Reflection',
+                            'description': 'Reflect deeply on service experiences and personal '
+                                           'growth',
+                            'standard': 'SL.4',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Analyze experiences',
+                                                    'Assess personal growth']}]}]}
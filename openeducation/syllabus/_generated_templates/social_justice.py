@@ -0,0 +1,67 @@
+# Generated by scripts/gen_templates.py from templates/social_justice.json; do not edit.
+
+TEMPLATE = {'title': 'Social Justice Education',
+ 'description': 'Understanding inequality, promoting equity, and advocating for justice.',
+ 'standards': ['Social Justice Standards', 'Civic Engagement'],
+ 'materials': ['Social justice texts', 'Documentary films', 'Case studies'],
+ 'grading_policy': {'research_projects': 30,
+                    'activism_projects': 25,
+                    'reflections': 20,
+                    'discussions': 15,
+                    'participation': 10},
+ 'prerequisites': ['Open mind', 'Respect for diverse perspectives'],
+ 'learning_outcomes': ['Understand systemic inequality and injustice',
+                       'Analyze power dynamics and privilege',
+                       'Develop strategies for social change',
+                       'Advocate effectively for justice'],
+ 'units': [{'title': 'Understanding Inequality',
+            'description': 'Exploring different forms of inequality and their root causes.',
+            'assessment_methods': ['Issue analysis', 'Inequality mapping', 'Personal reflections'],
+            'resources': ['Inequality data', 'Personal narratives', 'Historical documents'],
+            'projects': ['Inequality analysis project', 'Privilege assessment'],
+            'objectives': [{'title': 'Types of Inequality',
+                            'description': 'Identify and analyze different forms of social '
+                                           'inequality',
+                            'standard': 'SJ.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Identify inequality types',
+                                                    'Explain root causes']}]},
+           {'title': 'Power and Privilege',
+            'description': 'Understanding power dynamics, privilege, and intersectionality.',
+            'assessment_methods': ['Privilege analysis',
+                                   'Power mapping',
+                                   'Intersectional analysis'],
+            'resources': ['Privilege exercises',
+                          'Power analysis tools',
+                          'Intersectionality frameworks'],
+            'projects': ['Privilege inventory', 'Power analysis project'],
+            'objectives': [{'title': 'Privilege Awareness',
+                            'description': 'Develop awareness of personal and systemic privilege',
+                            'standard': 'SJ.2',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Identify personal privilege',
+                                                    'Analyze power dynamics']}]},
+           {'title': 'Social Justice Movements',
+            'description': 'Historical and contemporary movements for social justice.',
+            'assessment_methods': ['Movement analysis',
+                                   'Activist biographies',
+                                   'Strategy evaluation'],
+            'resources': ['Movement histories', 'Activist writings', 'Documentary films'],
+            'projects': ['Movement timeline', 'Activist research project'],
+            'objectives': [{'title': 'Movement Analysis',
+                            'description': 'Analyze social justice movements and their strategies',
+                            'standard': 'SJ.3',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Explain movement goals',
+                                                    'Evaluate movement strategies']}]},
+           {'title': 'Taking Action',
+            'description': 'Developing and implementing strategies for social change.',
+            'assessment_methods': ['Action plans', 'Implementation logs', 'Impact assessment'],
+            'resources': ['Action planning guides', 'Community resources', 'Evaluation tools'],
+            'projects': ['Social action project', 'Advocacy campaign'],
+            'objectives': [{'title': 'Social Action',
+                            'description': 'Plan and implement effective social justice actions',
+                            'standard': 'SJ.4',
+                            'estimated_time': 120,
+                            'assessment_criteria': ['Develop action plans',
+                                                    'Implement social change']}]}]}
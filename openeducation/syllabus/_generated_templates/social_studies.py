@@ -0,0 +1,62 @@
+# Generated by scripts/gen_templates.py from templates/social_studies.json; do not edit.
+
+TEMPLATE = {'title': 'Social Studies: World History and Cultures',
+ 'description': 'Study of human societies, cultures, and historical development.',
+ 'standards': ['C3 Framework', 'Common Core'],
+ 'materials': ['Textbooks', 'Maps', 'Primary sources', 'Documentary films'],
+ 'grading_policy': {'essays': 30, 'projects': 25, 'tests': 25, 'participation': 20},
+ 'prerequisites': ['Basic reading and writing skills'],
+ 'learning_outcomes': ['Understand historical causation and continuity',
+                       'Analyze complex historical sources',
+                       'Evaluate historical interpretations',
+                       'Communicate historical arguments effectively'],
+ 'units': [{'title': 'Ancient Civilizations',
+            'description': 'Development of early human societies and civilizations.',
+            'assessment_methods': ['Document analysis',
+                                   'Timeline creation',
+                                   'Cultural comparisons'],
+            'resources': ['Primary source documents', 'Maps', 'Artifacts'],
+            'projects': ['Civilization comparison project', 'Ancient technology analysis'],
+            'objectives': [{'title': 'River Valley Civilizations',
+                            'description': 'Analyze the development of early civilizations',
+                            'standard': 'SS.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Compare civilizations',
+                                                    'Explain cultural achievements']}]},
+           {'title': 'World Religions and Philosophies',
+            'description': 'Major world religions and philosophical traditions.',
+            'assessment_methods': ['Comparative analysis',
+                                   'Philosophy debates',
+                                   'Ethical discussions'],
+            'resources': ['Religious texts', 'Philosophy readings', 'Discussion guides'],
+            'projects': ['Religious comparison', 'Philosophy symposium'],
+            'objectives': [{'title': 'Major World Religions',
+                            'description': 'Understand beliefs, practices, and cultural impact',
+                            'standard': 'SS.2',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Compare religious beliefs',
+                                                    'Analyze cultural impacts']}]},
+           {'title': 'Modern World History',
+            'description': 'Global interactions and modern historical developments.',
+            'assessment_methods': ['Primary source analysis',
+                                   'Historical debates',
+                                   'Research projects'],
+            'resources': ['Primary documents', 'Historical maps', 'Multimedia resources'],
+            'projects': ['Historical research paper', 'Modern conflicts analysis'],
+            'objectives': [{'title': 'Industrial Revolution',
+                            'description': 'Analyze causes and effects of industrialization',
+                            'standard': 'SS.3',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Explain economic changes',
+                                                    'Analyze social impacts']}]},
+           {'title': 'Contemporary Global Issues',
+            'description': 'Current global challenges and international relations.',
+            'assessment_methods': ['Policy analysis', 'Debates', 'Solution proposals'],
+            'resources': ['News sources', 'Policy documents', 'Global data'],
+            'projects': ['Global issue research', 'International relations simulation'],
+            'objectives': [{'title': 'Global Challenges',
+                            'description': 'Understand contemporary global issues and solutions',
+                            'standard': 'SS.4',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Analyze global problems',
+                                                    'Propose solutions']}]}]}
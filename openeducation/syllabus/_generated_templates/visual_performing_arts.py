@@ -0,0 +1,62 @@
+# Generated by scripts/gen_templates.py from templates/visual_performing_arts.json; do not edit.
+
+TEMPLATE = {'title': 'Visual and Performing Arts',
+ 'description': 'Creative expression through visual arts, music, theater, and digital media.',
+ 'standards': ['National Core Arts Standards', 'ISTE'],
+ 'materials': ['Art supplies', 'Musical instruments', 'Digital media tools', 'Performance space'],
+ 'grading_policy': {'projects': 40, 'performances': 30, 'critiques': 20, 'participation': 10},
+ 'prerequisites': ['Basic creativity skills'],
+ 'learning_outcomes': ['Create original artistic works',
+                       'Analyze and critique art',
+                       'Understand art history and cultural context',
+                       'Present and perform artistic works'],
+ 'units': [{'title': 'Visual Arts Fundamentals',
+            'description': 'Elements of art, principles of design, and basic techniques.',
+            'assessment_methods': ['Portfolio reviews',
+                                   'Technique demonstrations',
+                                   'Artist statements'],
+            'resources': ['Art supplies', 'Digital cameras', 'Art history books'],
+            'projects': ['Personal artwork series', 'Art technique exploration'],
+            'objectives': [{'title': 'Elements of Art',
+                            'description': 'Master the basic elements: line, shape, color, '
+                                           'texture, space',
+                            'standard': 'VA.1',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Create compositions',
+                                                    'Analyze artwork elements']}]},
+           {'title': 'Digital Media Arts',
+            'description': 'Digital photography, graphic design, and multimedia creation.',
+            'assessment_methods': ['Digital portfolios',
+                                   'Design critiques',
+                                   'Technical proficiency'],
+            'resources': ['Digital cameras', 'Design software', 'Tablets'],
+            'projects': ['Digital art series', 'Multimedia presentation'],
+            'objectives': [{'title': 'Digital Composition',
+                            'description': 'Create compelling digital compositions using various '
+                                           'media',
+                            'standard': 'VA.2',
+                            'estimated_time': 75,
+                            'assessment_criteria': ['Apply design principles',
+                                                    'Use digital tools effectively']}]},
+           {'title': 'Performing Arts: Theater',
+            'description': 'Acting, stagecraft, and theatrical production.',
+            'assessment_methods': ['Performances', 'Script analysis', 'Production roles'],
+            'resources': ['Stage props', 'Lighting equipment', 'Costume materials'],
+            'projects': ['One-act play production', 'Character development exercises'],
+            'objectives': [{'title': 'Acting Techniques',
+                            'description': 'Develop acting skills and character interpretation',
+                            'standard': 'TH.1',
+                            'estimated_time': 90,
+                            'assessment_criteria': ['Demonstrate character work',
+                                                    'Collaborate in ensemble']}]},
+           {'title': 'Music and Sound',
+            'description': 'Music theory, composition, and audio production.',
+            'assessment_methods': ['Compositions', 'Performances', 'Music analysis'],
+            'resources': ['Musical instruments', 'Recording equipment', 'Music software'],
+            'projects': ['Original composition', 'Audio production piece'],
+            'objectives': [{'title': 'Music Theory',
+                            'description': 'Understand music theory and composition principles',
+                            'standard': 'MU.1',
+                            'estimated_time': 60,
+                            'assessment_criteria': ['Analyze musical works',
+                                                    'Create original compositions']}]}]}
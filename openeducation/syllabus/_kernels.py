@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ..utils._jit import jit_or
+
+
+def _schedule_offsets_loop(counts: np.ndarray, spacing: int, gap: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Day offsets of each unit start (plus the end) and each objective start, written for numba."""
+    unit_starts = np.empty(counts.shape[0] + 1, dtype=np.int64)
+    obj_starts = np.empty(counts.sum(), dtype=np.int64)
+    day = 0
+    k = 0
+    for u in range(counts.shape[0]):
+        unit_starts[u] = day
+        for _ in range(counts[u]):
+            obj_starts[k] = day
+            k += 1
+            day += spacing
+        day += gap
+    unit_starts[counts.shape[0]] = day
+    return unit_starts, obj_starts
+
+
+def _schedule_offsets_numpy(counts: np.ndarray, spacing: int, gap: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized fallback used when numba is unavailable."""
+    unit_starts = np.zeros(counts.shape[0] + 1, dtype=np.int64)
+    np.cumsum(spacing * counts + gap, out=unit_starts[1:])
+    first_index = np.cumsum(counts) - counts
+    within = np.arange(counts.sum()) - np.repeat(first_index, counts)
+    return unit_starts, np.repeat(unit_starts[:-1], counts) + spacing * within
+
+
+schedule_offsets = jit_or(_schedule_offsets_loop, _schedule_offsets_numpy)
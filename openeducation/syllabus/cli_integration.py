@@ -1,15 +1,81 @@
 from __future__ import annotations
 
-import json
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import typer
 
-from .generator import Syllabus, SyllabusGenerator
+try:  # Optional: streams large decks instead of loading them whole
+    import ijson
+except Exception:  # pragma: no cover
+    ijson = None
+
+from .generator import Syllabus, SyllabusGenerator, _syllabus_from_dict
 
 app = typer.Typer(help="Syllabus generation and management tools")
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_SUBJECT_DESCRIPTIONS = {
+    "science": "Integrated science covering biology, chemistry, physics, and environmental science",
+    "visual_performing_arts": "Visual arts, music, theater, and digital media creation",
+    "social_studies": "World history, cultures, and contemporary global issues",
+    "service_learning": "Community engagement and civic leadership",
+    "mathematics": "Advanced algebra, trigonometry, and calculus preparation",
+    "language_literacy": "Reading, writing, speaking, and critical thinking",
+    "biliteracy_dual_language": "Dual language proficiency and cultural understanding",
+    "social_justice": "Inequality analysis and social change strategies",
+    "classroom_management": "Teaching strategies and classroom environment",
+    "health_fitness": "Physical fitness and wellness education",
+}
+
+# Serialized field order of the syllabus header; "units" is streamed after it.
+# The attrgetter fetches every value in one C-level call.
+_SYLLABUS_KEYS = (
+    "id", "subject", "grade_level", "title", "description", "instructor", "duration_weeks",
+    "standards", "materials", "grading_policy", "prerequisites", "learning_outcomes",
+)
+_syllabus_values = attrgetter(*_SYLLABUS_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _get_generator() -> SyllabusGenerator:
+    """Share one generator (and its subject templates) across commands in a process."""
+    return SyllabusGenerator()
+
+
+def _write_syllabus_json(syllabus: Syllabus, path: Path) -> None:
+    """Write a syllabus one unit at a time instead of building one nested dict.
+
+    Produces the same indented layout as dumping the whole document at once.
+    """
+    header = orjson.dumps(dict(zip(_SYLLABUS_KEYS, _syllabus_values(syllabus))), option=_JSON_OPTIONS)
+
+    with open(path, "wb") as f:
+        f.write(header[:-2])  # drop the closing "\n}" to append the units
+        if not syllabus.units:
+            f.write(b',\n  "units": []\n}')
+            return
+
+        f.write(b',\n  "units": [')
+        for i, unit in enumerate(syllabus.units):
+            unit_json = orjson.dumps(unit, option=_JSON_OPTIONS)  # dataclasses serialize natively
+            f.write(b"\n    " if i == 0 else b",\n    ")
+            f.write(unit_json.replace(b"\n", b"\n    "))  # nest two levels deep
+        f.write(b"\n  ]\n}")
+
+
+def _load_syllabus(syllabus_file: str) -> Syllabus:
+    """Load a syllabus written by `generate`."""
+    with open(syllabus_file, "rb") as f:
+        return _syllabus_from_dict(orjson.loads(f.read()))
+
 
 @app.command()
 def generate(
@@ -22,7 +88,7 @@ def generate(
 ) -> None:
     """Generate a comprehensive syllabus for the specified subject."""
     try:
-        generator = SyllabusGenerator()
+        generator = _get_generator()
 
         # Generate syllabus
         syllabus = generator.generate_syllabus(
@@ -36,63 +102,26 @@ def generate(
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Save syllabus as JSON
         syllabus_file = output_path / f"{syllabus.id}.json"
-        with open(syllabus_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "id": syllabus.id,
-                "subject": syllabus.subject,
-                "grade_level": syllabus.grade_level,
-                "title": syllabus.title,
-                "description": syllabus.description,
-                "instructor": syllabus.instructor,
-                "duration_weeks": syllabus.duration_weeks,
-                "standards": syllabus.standards,
-                "materials": syllabus.materials,
-                "grading_policy": syllabus.grading_policy,
-                "prerequisites": syllabus.prerequisites,
-                "learning_outcomes": syllabus.learning_outcomes,
-                "units": [
-                    {
-                        "id": unit.id,
-                        "title": unit.title,
-                        "description": unit.description,
-                        "duration_weeks": unit.duration_weeks,
-                        "assessment_methods": unit.assessment_methods,
-                        "resources": unit.resources,
-                        "projects": unit.projects,
-                        "objectives": [
-                            {
-                                "id": obj.id,
-                                "title": obj.title,
-                                "description": obj.description,
-                                "standard": obj.standard,
-                                "difficulty": obj.difficulty,
-                                "estimated_time": obj.estimated_time,
-                                "prerequisites": obj.prerequisites,
-                                "assessment_criteria": obj.assessment_criteria,
-                                "resources": obj.resources,
-                            }
-                            for obj in unit.objectives
-                        ]
-                    }
-                    for unit in syllabus.units
-                ]
-            }, f, indent=2, ensure_ascii=False)
-
-        print(f"✅ Syllabus generated: {syllabus_file}")
-
-        # Generate Anki deck if requested
-        if create_deck:
-            cards_path = generator.generate_anki_deck_from_syllabus(syllabus, str(output_path))
-            print(f"✅ Anki deck generated: {cards_path}")
-
-        # Create learning schedule
-        schedule = generator.create_learning_schedule(syllabus)
         schedule_file = output_path / f"{syllabus.id}_schedule.json"
-        with open(schedule_file, "w", encoding="utf-8") as f:
-            json.dump(schedule, f, indent=2, ensure_ascii=False)
-        print(f"✅ Learning schedule created: {schedule_file}")
+
+        # The syllabus, deck and schedule files are independent, so write them
+        # concurrently; file I/O releases the GIL
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            syllabus_written = pool.submit(_write_syllabus_json, syllabus, syllabus_file)
+            deck_written = (
+                pool.submit(generator.generate_anki_deck_from_syllabus, syllabus, str(output_path))
+                if create_deck else None
+            )
+            schedule = generator.create_learning_schedule(syllabus)
+            schedule_written = pool.submit(schedule_file.write_bytes, orjson.dumps(schedule, option=_JSON_OPTIONS))
+
+            syllabus_written.result()
+            print(f"✅ Syllabus generated: {syllabus_file}")
+            if deck_written is not None:
+                print(f"✅ Anki deck generated: {deck_written.result()}")
+            schedule_written.result()
+            print(f"✅ Learning schedule created: {schedule_file}")
 
         print("\n📚 Syllabus Summary:")
         print(f"   Subject: {syllabus.subject}")
@@ -109,28 +138,16 @@ def generate(
 @app.command()
 def list_subjects() -> None:
     """List all available subjects for syllabus generation."""
-    generator = SyllabusGenerator()
-    subjects = list(generator.subject_templates.keys())
-
-    print("📖 Available subjects for syllabus generation:")
-    print("=" * 50)
-
-    subject_descriptions = {
-        "science": "Integrated science covering biology, chemistry, physics, and environmental science",
-        "visual_performing_arts": "Visual arts, music, theater, and digital media creation",
-        "social_studies": "World history, cultures, and contemporary global issues",
-        "service_learning": "Community engagement and civic leadership",
-        "mathematics": "Advanced algebra, trigonometry, and calculus preparation",
-        "language_literacy": "Reading, writing, speaking, and critical thinking",
-        "biliteracy_dual_language": "Dual language proficiency and cultural understanding",
-        "social_justice": "Inequality analysis and social change strategies",
-        "classroom_management": "Teaching strategies and classroom environment",
-        "health_fitness": "Physical fitness and wellness education"
-    }
-
-    for subject in subjects:
-        description = subject_descriptions.get(subject, "Educational content and activities")
-        print(f"{subject:<15} {description}")
+    generator = _get_generator()
+
+    lines = ["📖 Available subjects for syllabus generation:", "=" * 50]
+    lines.extend(
+        f"{subject:<15} {_SUBJECT_DESCRIPTIONS.get(subject, 'Educational content and activities')}"
+        for subject in generator.subject_templates
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 @app.command()
 def schedule(
     syllabus_file: str = typer.Argument(..., help="Path to syllabus JSON file"),
@@ -140,27 +157,10 @@ def schedule(
     """Create a detailed learning schedule from a syllabus."""
     try:
         # Load syllabus
-        with open(syllabus_file, "r", encoding="utf-8") as f:
-            syllabus_data = json.load(f)
-
-        # Recreate syllabus object
-        syllabus = Syllabus(
-            id=syllabus_data["id"],
-            subject=syllabus_data["subject"],
-            grade_level=syllabus_data["grade_level"],
-            title=syllabus_data["title"],
-            description=syllabus_data["description"],
-            duration_weeks=syllabus_data["duration_weeks"],
-            instructor=syllabus_data["instructor"],
-            standards=syllabus_data["standards"],
-            materials=syllabus_data["materials"],
-            grading_policy=syllabus_data["grading_policy"],
-            prerequisites=syllabus_data["prerequisites"],
-            learning_outcomes=syllabus_data["learning_outcomes"],
-        )
+        syllabus = _load_syllabus(syllabus_file)
 
         # Generate schedule
-        generator = SyllabusGenerator()
+        generator = _get_generator()
         schedule = generator.create_learning_schedule(syllabus, start_date)
 
         # Determine output file
@@ -168,8 +168,8 @@ def schedule(
             output_file = syllabus_file.replace(".json", "_schedule.json")
 
         # Save schedule
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(schedule, f, indent=2, ensure_ascii=False)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(schedule, option=_JSON_OPTIONS))
 
         print(f"✅ Learning schedule created: {output_file}")
         print("\n📅 Schedule Summary:")
@@ -193,41 +193,21 @@ def export_deck(
     """Export Anki deck from syllabus content."""
     try:
         # Load syllabus
-        with open(syllabus_file, "r", encoding="utf-8") as f:
-            syllabus_data = json.load(f)
-
-        # Recreate syllabus object
-        syllabus = Syllabus(
-            id=syllabus_data["id"],
-            subject=syllabus_data["subject"],
-            grade_level=syllabus_data["grade_level"],
-            title=syllabus_data["title"],
-            description=syllabus_data["description"],
-            duration_weeks=syllabus_data["duration_weeks"],
-            instructor=syllabus_data["instructor"],
-            standards=syllabus_data["standards"],
-            materials=syllabus_data["materials"],
-            grading_policy=syllabus_data["grading_policy"],
-            prerequisites=syllabus_data["prerequisites"],
-            learning_outcomes=syllabus_data["learning_outcomes"],
-        )
+        syllabus = _load_syllabus(syllabus_file)
 
         # Generate Anki deck
-        generator = SyllabusGenerator()
+        generator = _get_generator()
         cards_path = generator.generate_anki_deck_from_syllabus(syllabus, output_dir)
 
         print(f"✅ Anki deck exported: {cards_path}")
 
-        # Count cards
-        with open(cards_path, "r", encoding="utf-8") as f:
-            cards = json.load(f)
-            print(f"   Cards Generated: {len(cards)}")
-
-        # Show card types
-        card_types = {}
-        for card in cards:
-            card_type = card.get("tags", ["unknown"])[0]
-            card_types[card_type] = card_types.get(card_type, 0) + 1
+        # Count cards and card types in one pass over the deck
+        card_types: Counter[str] = Counter()
+        with open(cards_path, "rb") as f:
+            cards = ijson.items(f, "item") if ijson is not None else orjson.loads(f.read())
+            for card in cards:
+                card_types[card.get("tags", ["unknown"])[0]] += 1
+        print(f"   Cards Generated: {card_types.total()}")
 
         print("   Card Types:")
         for card_type, count in card_types.items():
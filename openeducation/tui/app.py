@@ -1,12 +1,45 @@
 import os
+from importlib import import_module
+from typing import Dict, Set, Tuple, Union
 
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import ContentSwitcher, Footer, Header, Tab, Tabs
 
 from .widgets.dashboard import Dashboard
-from .widgets.performance_viewer import PerformanceViewer
-from .widgets.syllabus_viewer import SyllabusViewer
+
+# Tab id -> (module, class) of the widget shown on that tab. Each is imported and
+# mounted the first time its tab is opened, so startup does not load Markdown
+# or DirectoryTree.
+_LAZY_TABS: Dict[str, Tuple[str, str]] = {
+    "syllabus": (".widgets.syllabus_viewer", "SyllabusViewer"),
+    "performance": (".widgets.performance_viewer", "PerformanceViewer"),
+}
+
+_SYLLABI_PATH = "data/syllabi"
+_COACHING_PATH = "data/coaching"
+_PROGRESS_PATH = "data/progress"
+
+# path -> (directory st_mtime_ns, matching entry count). Adding, removing or
+# renaming an entry bumps the directory's mtime, so a matching stamp means the
+# cached count is still right.
+_summary_cache: Dict[str, Tuple[int, int]] = {}
+
+
+def _count_files(path: str, prefix: str = "", suffix: Union[str, Tuple[str, ...]] = "") -> int:
+    """Count the entries in ``path`` whose names match; 0 if the directory does not exist."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        cached = _summary_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with os.scandir(path) as entries:
+            count = sum(1 for e in entries if e.name.startswith(prefix) and e.name.endswith(suffix))
+    except FileNotFoundError:
+        _summary_cache.pop(path, None)
+        return 0
+    _summary_cache[path] = (mtime, count)
+    return count
 
 
 class OpenEducationTUI(App):
@@ -18,25 +51,46 @@ class OpenEducationTUI(App):
         ("q", "quit", "Quit"),
     ]
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._mounted_tabs: Set[str] = set()
+
     def fetch_summary_data(self) -> dict:
         """Fetch summary data from the filesystem."""
-        syllabi_path = "data/syllabi"
-        coaching_path = "data/coaching"
-        progress_path = "data/progress"
-        
-        syllabi_count = len([f for f in os.listdir(syllabi_path) if f.endswith('.json')]) if os.path.exists(syllabi_path) else 0
-        coaching_cycles_count = len([f for f in os.listdir(coaching_path) if f.startswith('cycle_')]) if os.path.exists(coaching_path) else 0
-        performance_reports_count = len([f for f in os.listdir(progress_path) if f.endswith('_progress.json')]) if os.path.exists(progress_path) else 0
+        return {
+            "syllabi_count": _count_files(_SYLLABI_PATH, suffix=".json"),
+            "coaching_cycles_count": _count_files(_COACHING_PATH, prefix="cycle_"),
+            "performance_reports_count": _count_files(_PROGRESS_PATH, suffix=("_progress.json", "_progress.json.gz")),
+        }
+
+    def cached_summary_data(self) -> dict:
+        """The last counts seen by fetch_summary_data, without touching the filesystem."""
+        def cached(path: str) -> int:
+            entry = _summary_cache.get(path)
+            return entry[1] if entry is not None else 0
 
         return {
-            "syllabi_count": syllabi_count,
-            "coaching_cycles_count": coaching_cycles_count,
-            "performance_reports_count": performance_reports_count,
+            "syllabi_count": cached(_SYLLABI_PATH),
+            "coaching_cycles_count": cached(_COACHING_PATH),
+            "performance_reports_count": cached(_PROGRESS_PATH),
         }
 
+    def refresh_summary(self) -> None:
+        """Recount the summary files in a worker thread and update the dashboard."""
+        self.run_worker(self._refresh_summary, thread=True, exclusive=True, group="summary")
+
+    def _refresh_summary(self) -> None:
+        # Only the counting runs on the worker; widgets are touched on the UI thread
+        self.call_from_thread(self._show_summary, self.fetch_summary_data())
+
+    def _show_summary(self, summary_data: dict) -> None:
+        self.query_one(Dashboard).update_summary(summary_data)
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
-        summary_data = self.fetch_summary_data()
+        # Start from the cached counts so the first frame never waits on the
+        # filesystem; on_mount fills in the current ones
+        summary_data = self.cached_summary_data()
 
         yield Header()
         yield Footer()
@@ -49,13 +103,25 @@ class OpenEducationTUI(App):
             )
             with ContentSwitcher(initial="dashboard"):
                 yield Dashboard(summary_data=summary_data, id="dashboard_content")
-                yield SyllabusViewer(id="syllabus_content")
-                yield PerformanceViewer(id="performance_content")
+                yield Container(id="syllabus_content")
+                yield Container(id="performance_content")
                 yield Container(id="settings_content")
 
+    def on_mount(self) -> None:
+        """Load the current summary counts once the app is on screen."""
+        self.refresh_summary()
+
     def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Handle tab activation."""
-        self.query_one(ContentSwitcher).current = f"{event.tab.id}_content"
+        tab_id = event.tab.id
+        if tab_id in _LAZY_TABS and tab_id not in self._mounted_tabs:
+            self._mounted_tabs.add(tab_id)
+            module_name, class_name = _LAZY_TABS[tab_id]
+            widget_cls = getattr(import_module(module_name, __package__), class_name)
+            self.query_one(f"#{tab_id}_content", Container).mount(widget_cls())
+        self.query_one(ContentSwitcher).current = f"{tab_id}_content"
+        if tab_id == "dashboard":
+            self.refresh_summary()
 
     def action_toggle_dark(self) -> None:
         """An action to toggle dark mode."""
@@ -1,5 +1,12 @@
 from textual.widgets import Static
 
+# (summary_data key, label) for each count shown; the key doubles as the line's id
+_SUMMARY_LINES = (
+    ("syllabi_count", "Syllabi Generated"),
+    ("coaching_cycles_count", "Coaching Cycles"),
+    ("performance_reports_count", "Performance Reports"),
+)
+
 
 class Dashboard(Static):
     """A dashboard widget to display summary information."""
@@ -13,6 +20,11 @@ class Dashboard(Static):
         yield Static("Welcome to OpenEducation!", id="welcome_title")
         yield Static("Your adaptive learning companion.", id="welcome_subtitle")
         yield Static("\n--- Summary ---")
-        yield Static(f"Syllabi Generated: {self.summary_data.get('syllabi_count', 0)}")
-        yield Static(f"Coaching Cycles: {self.summary_data.get('coaching_cycles_count', 0)}")
-        yield Static(f"Performance Reports: {self.summary_data.get('performance_reports_count', 0)}")
+        for key, label in _SUMMARY_LINES:
+            yield Static(f"{label}: {self.summary_data.get(key, 0)}", id=key)
+
+    def update_summary(self, summary_data: dict) -> None:
+        """Show new summary counts."""
+        self.summary_data = summary_data
+        for key, label in _SUMMARY_LINES:
+            self.query_one(f"#{key}", Static).update(f"{label}: {summary_data.get(key, 0)}")
@@ -1,9 +1,19 @@
-import json
+from pathlib import Path
+from typing import Iterable
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import DirectoryTree, Markdown, Static
 
+from ...utils.io import dump_json, read_json_maybe_gz
+
+
+class _ProgressTree(DirectoryTree):
+    """Directory tree that hides dot-prefixed entries such as the report cache."""
+
+    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+        return [path for path in paths if not path.name.startswith(".")]
+
 
 class PerformanceViewer(Static):
     """A widget to display a performance report."""
@@ -11,17 +21,16 @@ class PerformanceViewer(Static):
     def compose(self) -> ComposeResult:
         """Render the widget."""
         with Horizontal():
-            yield DirectoryTree("data/progress", id="performance_tree")
+            yield _ProgressTree("data/progress", id="performance_tree")
             with Vertical():
                 yield Markdown(id="performance_content_viewer")
 
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         """Called when a file is selected in the directory tree."""
         try:
-            with open(event.path, 'r', encoding='utf-8') as f:
-                # Assuming the performance files are JSON, pretty-print them
-                content = json.load(f)
-                md_content = f"```json\n{json.dumps(content, indent=2)}\n```"
-                self.query_one("#performance_content_viewer", Markdown).update(md_content)
+            # Progress files are JSON, gzip-compressed since they gained review history
+            content = read_json_maybe_gz(event.path)
+            md_content = f"```json\n{dump_json(content).decode()}\n```"
+            self.query_one("#performance_content_viewer", Markdown).update(md_content)
         except Exception as e:
             self.query_one("#performance_content_viewer", Markdown).update(f"Error loading file: {e}")
@@ -1,13 +1,26 @@
-import json
+from functools import partial
+from typing import Optional
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import DirectoryTree, Markdown, Static
 
+from ...utils.io import dump_json, read_json
+
+# Characters of pretty-printed JSON shown before the preview is cut off;
+# Markdown tokenizes the whole text on the UI thread, so large syllabi are truncated
+_PREVIEW_LIMIT = 64 * 1024
+
 
 class SyllabusViewer(Static):
     """A widget to view syllabi."""
 
+    BINDINGS = [("f", "show_full", "Show full syllabus")]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._full_text: Optional[str] = None  # untruncated JSON of the selected syllabus
+
     def compose(self) -> ComposeResult:
         """Render the widget."""
         with Horizontal():
@@ -17,11 +30,27 @@ class SyllabusViewer(Static):
 
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         """Called when a file is selected in the directory tree."""
+        # Reading and pretty-printing happen in a worker so the UI stays responsive
+        self.run_worker(partial(self._load_preview, event.path), thread=True, exclusive=True, group="syllabus_preview")
+
+    def _load_preview(self, path) -> None:
         try:
-            with open(event.path, 'r', encoding='utf-8') as f:
-                # Assuming the syllabus files are JSON, pretty-print them in a Markdown block
-                content = json.load(f)
-                md_content = f"```json\n{json.dumps(content, indent=2)}\n```"
-                self.query_one("#syllabus_content_viewer", Markdown).update(md_content)
+            # Assuming the syllabus files are JSON, pretty-print them in a Markdown block
+            text = dump_json(read_json(path)).decode()
         except Exception as e:
-            self.query_one("#syllabus_content_viewer", Markdown).update(f"Error loading file: {e}")
+            self.app.call_from_thread(self._show, None, f"Error loading file: {e}")
+            return
+        if len(text) > _PREVIEW_LIMIT:
+            md_content = f"```json\n{text[:_PREVIEW_LIMIT]}\n```\n\n… (truncated; press f to show the full syllabus)"
+        else:
+            md_content = f"```json\n{text}\n```"
+        self.app.call_from_thread(self._show, text, md_content)
+
+    def _show(self, full_text: Optional[str], md_content: str) -> None:
+        self._full_text = full_text
+        self.query_one("#syllabus_content_viewer", Markdown).update(md_content)
+
+    def action_show_full(self) -> None:
+        """Show the selected syllabus without truncation."""
+        if self._full_text is not None:
+            self.query_one("#syllabus_content_viewer", Markdown).update(f"```json\n{self._full_text}\n```")
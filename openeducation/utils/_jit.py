@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+try:  # Optional: install with `pip install openeducation[perf]`
+    from numba import njit
+except Exception:  # pragma: no cover - numba is not a hard dependency
+    njit = None
+
+F = TypeVar("F", bound=Callable)
+
+
+def jit_or(loop: F, fallback: F) -> F:
+    """Compile ``loop`` with numba when it is installed, otherwise use ``fallback``.
+
+    Compilation happens lazily on the first call; cache=True keeps the machine
+    code across runs.
+    """
+    return njit(cache=True)(loop) if njit is not None else fallback
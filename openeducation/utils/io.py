@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import json
+import gzip
+import os
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Dict, Iterable, List, Set, Union
+
+import orjson
 
 
 def ensure_dir(p: Union[str, Path]) -> Path:
@@ -12,13 +15,130 @@ def ensure_dir(p: Union[str, Path]) -> Path:
 
 
 def read_json(path: Union[str, Path]) -> Any:
+    return orjson.loads(Path(path).read_bytes())
+
+
+def read_json_maybe_gz(path: Union[str, Path]) -> Any:
+    """Read a JSON file, decompressing it first if its name ends in ``.gz``."""
+    data = Path(path).read_bytes()
+    if str(path).endswith(".gz"):
+        data = gzip.decompress(data)
+    return orjson.loads(data)
+
+
+# Same layout as json.dump(indent=2, ensure_ascii=False); also accepts int keys,
+# dataclasses and NumPy values
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+# As above but on a single line, for files only other code reads
+_COMPACT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dump_json(obj: Any, indent: bool = True) -> bytes:
+    return orjson.dumps(obj, option=_JSON_OPTIONS if indent else _COMPACT_JSON_OPTIONS)
+
+
+# O_BINARY keeps Windows from translating newlines; it is 0 elsewhere
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Create or truncate ``path`` and write ``data`` straight to the descriptor, unbuffered."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)  # same mode open() uses; umask applies
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = True) -> None:
+    """Write ``obj`` as JSON in one write to a temporary sibling, then swap it into place.
+
+    Readers see either the old file or the complete new one, never a partial write.
+    """
     p = Path(path)
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    _write_file_bytes(tmp, dump_json(obj, indent))
+    os.replace(tmp, p)
+
+
+def list_json_files(directory: Union[str, Path], prefix: str) -> List[str]:
+    """Paths of the ``<prefix>*.json`` files in ``directory``; empty if it does not exist.
+
+    Uses the entry type scandir already has, so no per-file stat is needed.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                e.path for e in entries
+                if e.name.startswith(prefix) and e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
+
+
+_WRITE_BLOCK_SIZE = 64 * 1024
+
 
+def cards_summary_path(cards_path: Union[str, Path]) -> Path:
+    """Location of the precomputed summary written next to a cards file."""
+    p = Path(cards_path)
+    return p.with_name(f"{p.stem}_summary.json")
 
-def write_json(path: Union[str, Path], obj: Any) -> None:
+
+def cards_gzip_path(cards_path: Union[str, Path]) -> Path:
+    """Location of the gzip-compressed copy written next to a cards file."""
+    p = Path(cards_path)
+    return p.with_name(p.name + ".gz")
+
+
+def write_cards(path: Union[str, Path], cards: Iterable[Dict[str, Any]]) -> None:
+    """Write a cards file together with its gzip copy and summary (card count and sorted tags).
+
+    Cards are encoded one at a time and written in blocks, so ``cards`` may be a
+    generator and the deck never has to be held in memory. Each file is written to a
+    temporary sibling and swapped into place, cards first, so the derived files
+    are never older than the cards they describe.
+    """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    gz_path = cards_gzip_path(p)
+    tmp, gz_tmp = p.with_name(p.name + ".tmp"), gz_path.with_name(gz_path.name + ".tmp")
+
+    count = 0
+    tags: Set[str] = set()
+    with (
+        open(tmp, "wb") as f,
+        open(gz_tmp, "wb") as gz_file,
+        gzip.GzipFile(fileobj=gz_file, mode="wb", compresslevel=6, mtime=0) as gz,
+    ):
+        # Encoded cards are gathered into ~64 KiB blocks; one large write is far
+        # cheaper than many small ones, especially for the gzip stream
+        block: List[bytes] = [b"["]
+        size = 0
+        for card in cards:
+            encoded = dump_json(card).replace(b"\n", b"\n  ")
+            block.append(b"\n  " if count == 0 else b",\n  ")
+            block.append(encoded)
+            size += len(encoded)
+            tags.update(card.get("tags", ()))
+            count += 1
+            if size >= _WRITE_BLOCK_SIZE:
+                chunk = b"".join(block)
+                f.write(chunk)
+                gz.write(chunk)
+                block, size = [], 0
+        # Same layout as dump_json(list(cards))
+        block.append(b"\n]" if count else b"]")
+        chunk = b"".join(block)
+        f.write(chunk)
+        gz.write(chunk)
+
+    os.replace(tmp, p)
+    os.replace(gz_tmp, gz_path)
+    summary_path = cards_summary_path(p)
+    summary_tmp = summary_path.with_name(summary_path.name + ".tmp")
+    summary_tmp.write_bytes(dump_json({"count": count, "tags": sorted(tags)}))
+    os.replace(summary_tmp, summary_path)
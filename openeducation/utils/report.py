@@ -1,31 +1,29 @@
 from __future__ import annotations
 
-import json
 import os
+from itertools import chain
 from typing import Dict, List
 
-from ..models.card import Card
+from .io import read_json, write_json
 
 
 def manifest(run_dir: str) -> str:
     cards_path = os.path.join(run_dir, "cards.json")
     if not os.path.exists(cards_path):
         raise FileNotFoundError("cards.json missing")
-    with open(cards_path, "r", encoding="utf-8") as f:
-        cards = [Card(**c) for c in json.load(f)]
+    # Only tags and sources are needed, so read them off the raw card dicts
+    cards = read_json(cards_path)
     data = {
         "count": len(cards),
-        "tags": sorted({t for c in cards for t in c.tags}),
-        "sources": sorted({c.source_id for c in cards if c.source_id}),
+        "tags": sorted(set(chain.from_iterable(c.get("tags") or () for c in cards))),
+        "sources": sorted({sid for c in cards if (sid := c.get("source_id"))}),
     }
     out = os.path.join(run_dir, "manifest.json")
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    write_json(out, data, indent=False)  # only read by code, and can list every tag
     return out
 
 
 def licensing_report(sources: List[Dict[str, str]], run_dir: str) -> str:
     out = os.path.join(run_dir, "licensing_report.json")
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump({"sources": sources}, f, indent=2)
+    write_json(out, {"sources": sources})
     return out
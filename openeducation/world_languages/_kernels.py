@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..utils._jit import jit_or
+
+
+def _score_means_loop(category_idx: np.ndarray, values: np.ndarray, n_categories: int) -> np.ndarray:
+    """Single-pass group mean of assessment scores by category, written for numba."""
+    sums = np.zeros(n_categories)
+    counts = np.zeros(n_categories)
+    for i in range(category_idx.shape[0]):
+        c = category_idx[i]
+        sums[c] += values[i]
+        counts[c] += 1.0
+    return sums / counts
+
+
+def _score_means_numpy(category_idx: np.ndarray, values: np.ndarray, n_categories: int) -> np.ndarray:
+    """Vectorized fallback used when numba is unavailable."""
+    sums = np.bincount(category_idx, weights=values, minlength=n_categories)
+    counts = np.bincount(category_idx, minlength=n_categories)
+    return sums / counts
+
+
+score_means = jit_or(_score_means_loop, _score_means_numpy)
@@ -1,37 +1,189 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import typer
 
+from ..utils.io import list_json_files, read_json
 from .language_core import Language, ProficiencyLevel, WorldLanguagesManager
 
 app = typer.Typer(help="World Languages instruction and cultural integration")
 
+# Shared by every command, so in-process callers running several listers reuse
+# the reader threads; they are only started once files are submitted
+_IO_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4), thread_name_prefix="oe-io")
+atexit.register(_IO_POOL.shutdown, wait=False)
+
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def _csv(value: str) -> List[str]:
+    """Split a comma-separated option into its stripped items; empty input gives no items."""
+    value = value.strip()
+    return _CSV_RE.split(value) if value else []
+
+
+@lru_cache(maxsize=1)
+def _get_manager() -> WorldLanguagesManager:
+    """Share one manager, and its built curricula, across commands run in-process."""
+    return WorldLanguagesManager()
+
+
+def _try_read_json(path: str) -> Any:
+    try:
+        return read_json(path)
+    except Exception:
+        return None
+
+
+def _read_data_files(paths: List[str]) -> List[Any]:
+    """Parse JSON files concurrently, in order; unreadable or malformed files give ``None``."""
+    if len(paths) < 2:
+        return [_try_read_json(p) for p in paths]
+    return list(_IO_POOL.map(_try_read_json, paths))
+
+
+@dataclass(slots=True)
+class _LessonIndex:
+    """The lesson plan files of a directory as parallel arrays, so filters run as numpy masks."""
+    data: List[Dict[str, Any]]  # raw JSON of each plan, in index order
+    curricula: np.ndarray  # curriculum_id
+    grades: np.ndarray  # lower-cased grade_level
+    created: np.ndarray  # created_date, an ISO date string
+
+    @classmethod
+    def build(cls, data: List[Dict[str, Any]]) -> _LessonIndex:
+        return cls(
+            data=data,
+            curricula=np.array([str(d.get("curriculum_id", "")) for d in data], dtype=str),
+            grades=np.array([str(d.get("grade_level", "")).lower() for d in data], dtype=str),
+            created=np.array([str(d.get("created_date", "")) for d in data], dtype=str),
+        )
+
+    def select(self, curriculum_id: Optional[str], grade_level: Optional[str]) -> List[int]:
+        """Indices of the matching plans, newest first; plans created the same day keep file order."""
+        mask = np.ones(len(self.data), dtype=bool)
+        if curriculum_id:
+            mask &= self.curricula == curriculum_id
+        if grade_level:
+            mask &= np.char.find(self.grades, grade_level.lower()) >= 0
+        rows = np.flatnonzero(mask)
+        # A stable ascending sort of the reversed rows, read backwards, is a
+        # stable descending sort
+        order = np.argsort(self.created[rows][::-1], kind="stable")[::-1]
+        return rows[::-1][order].tolist()
+
+
+# data dir -> (st_mtime_ns, index). Adding or removing a plan bumps the
+# directory's mtime, so a matching stamp means the cached index is current.
+_lesson_index_cache: Dict[str, Tuple[int, _LessonIndex]] = {}
+
+
+def _lesson_index(data_dir: Path) -> Optional[_LessonIndex]:
+    """Index of the lesson plans saved in ``data_dir``; ``None`` if there are none."""
+    key = str(data_dir)
+    try:
+        mtime = os.stat(data_dir).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _lesson_index_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        lesson_files = list_json_files(data_dir, "lesson_plan_")
+        if not lesson_files:
+            return None
+        data = [d for d in _read_data_files(lesson_files) if isinstance(d, dict)]
+        cached = _lesson_index_cache[key] = (mtime, _LessonIndex.build(data))
+    return cached[1]
+
+
+def _reference_text(title: str, icon: str, entries: Tuple[Tuple[str, str], ...], footer: Tuple[str, ...] = ()) -> str:
+    """Render one of the fixed reference tables printed by the show_* commands."""
+    lines = [title, "=" * 50]
+    for name, description in entries:
+        lines.extend((f"{icon} {name}", f"   {description}", ""))
+    lines.extend(footer)
+    return "\n".join(lines) + "\n"
+
+
+# The show_* reference tables never change, so each is rendered once here
+_PROFICIENCY_LEVELS_TEXT = _reference_text("🎯 ACTFL Proficiency Levels", "📊", (
+    ("Novice Low", "Can communicate using memorized words and phrases"),
+    ("Novice Mid", "Can handle short social interactions with familiar topics"),
+    ("Novice High", "Can create simple sentences on familiar topics"),
+    ("Intermediate Low", "Can handle uncomplicated tasks in most situations"),
+    ("Intermediate Mid", "Can participate in conversations on familiar topics"),
+    ("Intermediate High", "Can satisfy most work and school needs"),
+    ("Advanced Low", "Can handle a range of face-to-face professional tasks"),
+    ("Advanced Mid", "Can discuss concrete topics with ease"),
+    ("Advanced High", "Can handle most formal and informal interactions"),
+    ("Superior", "Can communicate with accuracy in major topics"),
+    ("Distinguished", "Can communicate as well as educated native speakers"),
+))
+
+_ACTFL_MODES_TEXT = _reference_text("💬 ACTFL Modes of Communication", "🎭", (
+    ("Interpersonal", "Two-way communication between people"),
+    ("Interpretive", "Understanding written and spoken language"),
+    ("Presentational", "Expressing oneself through speaking/writing"),
+), footer=(
+    "🌟 Key Features:",
+    "   • Communicative approach focuses on real-world language use",
+    "   • All modes essential for comprehensive language proficiency",
+    "   • Integrated skills development across modes",
+))
+
+_CONTENT_AREAS_TEXT = _reference_text("📚 World Language Content Areas", "📖", (
+    ("Grammar", "Language structures and patterns"),
+    ("Vocabulary", "Word knowledge and usage"),
+    ("Pronunciation", "Sounds and intonation patterns"),
+    ("Culture", "Cultural perspectives and practices"),
+    ("Literature", "Literary texts and analysis"),
+    ("History", "Historical contexts and events"),
+    ("Current Events", "Contemporary issues and topics"),
+    ("Professions", "Career-related language and skills"),
+    ("Media", "Digital and traditional media content"),
+), footer=(
+    "🌟 Integration Focus:",
+    "   • Content and language integrated learning",
+    "   • Cultural context for all content areas",
+    "   • Real-world application and relevance",
+))
+
 
 @app.command()
 def show_curricula() -> None:
     """Show available language curricula."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
-        print("🌍 World Languages Curricula Overview")
-        print("=" * 60)
+        lines = ["🌍 World Languages Curricula Overview", "=" * 60]
 
         curricula = manager.get_all_curricula()
 
         for language, levels in curricula.items():
-            print(f"\n🏛️  {language}")
-            print("-" * 30)
+            lines.append(f"\n🏛️  {language}")
+            lines.append("-" * 30)
 
             for level, curriculum in levels.items():
-                print(f"📚 {level.replace('_', ' ').title()}")
-                print(f"   Title: {curriculum.title}")
-                print(f"   Target: {curriculum.proficiency_target.value}")
-                print(f"   Units: {len(curriculum.units)}")
-                print(f"   Standards: {', '.join(curriculum.alignment_standards)}")
+                lines.extend((
+                    f"📚 {level.replace('_', ' ').title()}",
+                    f"   Title: {curriculum.title}",
+                    f"   Target: {curriculum.proficiency_target.value}",
+                    f"   Units: {len(curriculum.units)}",
+                    f"   Standards: {', '.join(curriculum.alignment_standards)}",
+                ))
+
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error showing curricula: {e}")
@@ -45,45 +197,41 @@ def get_curriculum(
 ) -> None:
     """Get detailed curriculum for specific language and level."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
         curriculum = manager.get_curriculum(language, level)
 
-        print(f"📚 {curriculum.title}")
-        print("=" * 60)
-        print(f"Language: {curriculum.language.value}")
-        print(f"Level: {curriculum.level}")
-        print(f"Target Proficiency: {curriculum.proficiency_target.value}")
-        print(f"Description: {curriculum.description}")
-        print(f"Created: {curriculum.created_date}")
-        print(f"Standards: {', '.join(curriculum.alignment_standards)}")
-
-        print("\n🎯 Essential Questions:")
-        for question in curriculum.essential_questions:
-            print(f"   • {question}")
-
-        print("\n💡 Enduring Understandings:")
-        for understanding in curriculum.enduring_understandings:
-            print(f"   • {understanding}")
-
-        print("\n🌍 Cultural Competencies:")
-        for competency in curriculum.cultural_competencies:
-            print(f"   • {competency}")
-
-        print("\n💻 Technology Integration:")
-        for tech in curriculum.technology_integration:
-            print(f"   • {tech}")
-
-        print("\n📊 Assessment Methods:")
-        for method in curriculum.assessment_methods:
-            print(f"   • {method}")
+        lines = [
+            f"📚 {curriculum.title}",
+            "=" * 60,
+            f"Language: {curriculum.language.value}",
+            f"Level: {curriculum.level}",
+            f"Target Proficiency: {curriculum.proficiency_target.value}",
+            f"Description: {curriculum.description}",
+            f"Created: {curriculum.created_date}",
+            f"Standards: {', '.join(curriculum.alignment_standards)}",
+        ]
 
-        print("\n📖 Units:")
+        for heading, items in (
+            ("\n🎯 Essential Questions:", curriculum.essential_questions),
+            ("\n💡 Enduring Understandings:", curriculum.enduring_understandings),
+            ("\n🌍 Cultural Competencies:", curriculum.cultural_competencies),
+            ("\n💻 Technology Integration:", curriculum.technology_integration),
+            ("\n📊 Assessment Methods:", curriculum.assessment_methods),
+        ):
+            lines.append(heading)
+            lines.extend(f"   • {item}" for item in items)
+
+        lines.append("\n📖 Units:")
         for i, unit in enumerate(curriculum.units, 1):
-            print(f"   {i}. {unit['title']}")
-            print(f"      Theme: {unit['theme']}")
-            print(f"      Focus: {unit['proficiency_focus']}")
-            print(f"      Activities: {len(unit['learning_activities'])}")
+            lines.extend((
+                f"   {i}. {unit.title}",
+                f"      Theme: {unit.theme}",
+                f"      Focus: {unit.proficiency_focus}",
+                f"      Activities: {len(unit.learning_activities)}",
+            ))
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error getting curriculum: {e}")
@@ -105,7 +253,7 @@ def create_lesson_plan(
 ) -> None:
     """Create a comprehensive lesson plan."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
         # Parse communicative goals JSON
         try:
@@ -116,10 +264,10 @@ def create_lesson_plan(
             raise typer.Exit(1)
 
         # Parse lists
-        functions_list = [f.strip() for f in language_functions.split(",")]
-        vocab_list = [v.strip() for v in vocabulary_focus.split(",")]
-        culture_list = [c.strip() for c in cultural_elements.split(",")]
-        tech_list = [t.strip() for t in technology_tools.split(",") if t.strip()]
+        functions_list = _csv(language_functions)
+        vocab_list = _csv(vocabulary_focus)
+        culture_list = _csv(cultural_elements)
+        tech_list = [t for t in _csv(technology_tools) if t]
 
         lesson_plan = manager.create_lesson_plan(
             curriculum_id=curriculum_id,
@@ -134,26 +282,29 @@ def create_lesson_plan(
             technology_tools=tech_list
         )
 
-        print("✅ Lesson plan created successfully!")
-        print(f"   Plan ID: {lesson_plan.id}")
-        print(f"   Title: {lesson_plan.title}")
-        print(f"   Grade Level: {lesson_plan.grade_level}")
-        print(f"   Duration: {lesson_plan.duration_minutes} minutes")
-        print(f"   Objective: {lesson_plan.objective}")
+        lines = [
+            "✅ Lesson plan created successfully!",
+            f"   Plan ID: {lesson_plan.id}",
+            f"   Title: {lesson_plan.title}",
+            f"   Grade Level: {lesson_plan.grade_level}",
+            f"   Duration: {lesson_plan.duration_minutes} minutes",
+            f"   Objective: {lesson_plan.objective}",
+            "\n🎯 Communicative Goals:",
+        ]
+        lines.extend(f"   {mode}: {', '.join(goals)}" for mode, goals in lesson_plan.communicative_goals.items())
 
-        print("\n🎯 Communicative Goals:")
-        for mode, goals in lesson_plan.communicative_goals.items():
-            print(f"   {mode}: {', '.join(goals)}")
+        lines.append("\n📝 Language Functions:")
+        lines.extend(f"   • {func}" for func in lesson_plan.language_functions)
 
-        print("\n📝 Language Functions:")
-        for func in lesson_plan.language_functions:
-            print(f"   • {func}")
+        lines.extend((
+            f"\n📚 Vocabulary Focus: {len(lesson_plan.vocabulary_focus)} words",
+            f"🌍 Cultural Elements: {len(lesson_plan.cultural_elements)}",
+            f"💻 Technology Tools: {len(lesson_plan.technology_tools)}",
+            f"📋 Procedures: {len(lesson_plan.procedures)} steps",
+            f"📊 Assessment Methods: {len(lesson_plan.assessment['formative']) + len(lesson_plan.assessment['summative'])}",
+        ))
 
-        print(f"\n📚 Vocabulary Focus: {len(lesson_plan.vocabulary_focus)} words")
-        print(f"🌍 Cultural Elements: {len(lesson_plan.cultural_elements)}")
-        print(f"💻 Technology Tools: {len(lesson_plan.technology_tools)}")
-        print(f"📋 Procedures: {len(lesson_plan.procedures)} steps")
-        print(f"📊 Assessment Methods: {len(lesson_plan.assessment['formative']) + len(lesson_plan.assessment['summative'])}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error creating lesson plan: {e}")
@@ -172,14 +323,14 @@ def create_cultural_activity(
 ) -> None:
     """Create a cultural enrichment activity."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
         # Parse language enum
         lang = Language(language)
 
         # Parse lists
-        grade_list = [g.strip() for g in grade_levels.split(",")]
-        obj_list = [o.strip() for o in objectives.split(",")]
+        grade_list = _csv(grade_levels)
+        obj_list = _csv(objectives)
 
         activity = manager.create_cultural_activity(
             language=lang,
@@ -191,24 +342,25 @@ def create_cultural_activity(
             duration_hours=duration_hours
         )
 
-        print("✅ Cultural activity created successfully!")
-        print(f"   Activity ID: {activity.id}")
-        print(f"   Language: {activity.language.value}")
-        print(f"   Title: {activity.title}")
-        print(f"   Type: {activity.type}")
-        print(f"   Duration: {activity.duration_hours} hours")
-        print(f"   Grade Levels: {', '.join(activity.grade_levels)}")
+        lines = [
+            "✅ Cultural activity created successfully!",
+            f"   Activity ID: {activity.id}",
+            f"   Language: {activity.language.value}",
+            f"   Title: {activity.title}",
+            f"   Type: {activity.type}",
+            f"   Duration: {activity.duration_hours} hours",
+            f"   Grade Levels: {', '.join(activity.grade_levels)}",
+            "\n🎯 Objectives:",
+        ]
+        lines.extend(f"   • {obj}" for obj in activity.objectives)
 
-        print("\n🎯 Objectives:")
-        for obj in activity.objectives:
-            print(f"   • {obj}")
+        lines.append("\n📋 Preparation Needed:")
+        lines.extend(f"   • {prep}" for prep in activity.preparation_needed)
 
-        print("\n📋 Preparation Needed:")
-        for prep in activity.preparation_needed:
-            print(f"   • {prep}")
+        lines.append(f"\n📚 Materials Required: {len(activity.materials_required)}")
+        lines.append(f"📊 Assessment Methods: {len(activity.assessment_methods)}")
 
-        print(f"\n📚 Materials Required: {len(activity.materials_required)}")
-        print(f"📊 Assessment Methods: {len(activity.assessment_methods)}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error creating cultural activity: {e}")
@@ -228,7 +380,7 @@ def assess_student(
 ) -> None:
     """Conduct comprehensive language assessment."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
         # Parse enums
         lang = Language(language)
@@ -243,9 +395,9 @@ def assess_student(
             raise typer.Exit(1)
 
         # Parse lists
-        strengths_list = [s.strip() for s in strengths.split(",")]
-        growth_list = [g.strip() for g in areas_for_growth.split(",")]
-        recommendations_list = [r.strip() for r in recommendations.split(",")]
+        strengths_list = _csv(strengths)
+        growth_list = _csv(areas_for_growth)
+        recommendations_list = _csv(recommendations)
 
         assessment = manager.assess_student_progress(
             student_id=student_id,
@@ -258,21 +410,25 @@ def assess_student(
             recommendations=recommendations_list
         )
 
-        print("✅ Language assessment completed successfully!")
-        print(f"   Assessment ID: {assessment.id}")
-        print(f"   Student: {assessment.student_id}")
-        print(f"   Language: {assessment.language.value}")
-        print(f"   Proficiency Level: {assessment.proficiency_level.value}")
-        print(f"   Assessment Type: {assessment.assessment_type}")
-        print(f"   Date: {assessment.assessment_date}")
+        lines = [
+            "✅ Language assessment completed successfully!",
+            f"   Assessment ID: {assessment.id}",
+            f"   Student: {assessment.student_id}",
+            f"   Language: {assessment.language.value}",
+            f"   Proficiency Level: {assessment.proficiency_level.value}",
+            f"   Assessment Type: {assessment.assessment_type}",
+            f"   Date: {assessment.assessment_date}",
+            "\n📊 Scores:",
+        ]
+        lines.extend(f"   {category}: {score}" for category, score in assessment.scores.items())
 
-        print("\n📊 Scores:")
-        for category, score in assessment.scores.items():
-            print(f"   {category}: {score}")
+        lines.extend((
+            f"\n💪 Strengths: {len(assessment.strengths)}",
+            f"📈 Areas for Growth: {len(assessment.areas_for_growth)}",
+            f"💡 Recommendations: {len(assessment.recommendations)}",
+        ))
 
-        print(f"\n💪 Strengths: {len(assessment.strengths)}")
-        print(f"📈 Areas for Growth: {len(assessment.areas_for_growth)}")
-        print(f"💡 Recommendations: {len(assessment.recommendations)}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error conducting assessment: {e}")
@@ -286,29 +442,19 @@ def list_lesson_plans(
 ) -> None:
     """List lesson plans with optional filtering."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
-        # Get all lesson plan files
-        data_dir = Path("data/world_languages")
-        lesson_files = list(data_dir.glob("lesson_plan_*.json"))
+        index = _lesson_index(Path("data/world_languages"))
 
-        if not lesson_files:
+        if index is None:
             print("📋 No lesson plans found")
             return
 
+        # Filter and order on the index; only the matching plans are built
         lesson_plans = []
-        for lesson_file in lesson_files:
+        for i in index.select(curriculum_id, grade_level):
             try:
-                lesson_data = json.loads(lesson_file.read_text())
-                lesson_plan = manager._load_lesson_plan_from_data(lesson_data)
-
-                # Apply filters
-                if curriculum_id and lesson_plan.curriculum_id != curriculum_id:
-                    continue
-                if grade_level and grade_level.lower() not in lesson_plan.grade_level.lower():
-                    continue
-
-                lesson_plans.append(lesson_plan)
+                lesson_plans.append(manager._load_lesson_plan_from_data(index.data[i]))
             except Exception:
                 continue
 
@@ -316,27 +462,30 @@ def list_lesson_plans(
             print("📋 No lesson plans match the specified filters")
             return
 
-        print(f"📋 Lesson Plans ({len(lesson_plans)} total)")
-        print("=" * 80)
+        lines = [f"📋 Lesson Plans ({len(lesson_plans)} total)", "=" * 80]
 
-        for plan in sorted(lesson_plans, key=lambda x: x.created_date, reverse=True):
-            print(f"📝 {plan.id}")
-            print(f"   Title: {plan.title}")
-            print(f"   Grade Level: {plan.grade_level}")
-            print(f"   Duration: {plan.duration_minutes} minutes")
-            print(f"   Objective: {plan.objective}")
-            print(f"   Created: {plan.created_date}")
+        for plan in lesson_plans:
+            lines.extend((
+                f"📝 {plan.id}",
+                f"   Title: {plan.title}",
+                f"   Grade Level: {plan.grade_level}",
+                f"   Duration: {plan.duration_minutes} minutes",
+                f"   Objective: {plan.objective}",
+                f"   Created: {plan.created_date}",
+            ))
 
             if plan.communicative_goals:
-                print(f"   Communicative Goals: {len(plan.communicative_goals)} modes")
+                lines.append(f"   Communicative Goals: {len(plan.communicative_goals)} modes")
 
             if plan.vocabulary_focus:
-                print(f"   Vocabulary: {len(plan.vocabulary_focus)} words")
+                lines.append(f"   Vocabulary: {len(plan.vocabulary_focus)} words")
 
             if plan.cultural_elements:
-                print(f"   Cultural Elements: {len(plan.cultural_elements)}")
+                lines.append(f"   Cultural Elements: {len(plan.cultural_elements)}")
+
+            lines.append("")
 
-            print()
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error listing lesson plans: {e}")
@@ -351,20 +500,21 @@ def list_cultural_activities(
 ) -> None:
     """List cultural activities with optional filtering."""
     try:
-        manager = WorldLanguagesManager()
+        manager = _get_manager()
 
         # Get all cultural activity files
         data_dir = Path("data/world_languages")
-        activity_files = list(data_dir.glob("cultural_activity_*.json"))
+        activity_files = list_json_files(data_dir, "cultural_activity_")
 
         if not activity_files:
             print("🌍 No cultural activities found")
             return
 
         activities = []
-        for activity_file in activity_files:
+        for activity_data in _read_data_files(activity_files):
+            if activity_data is None:
+                continue
             try:
-                activity_data = json.loads(activity_file.read_text())
                 activity = manager._load_cultural_activity_from_data(activity_data)
 
                 # Apply filters
@@ -383,25 +533,28 @@ def list_cultural_activities(
             print("🌍 No cultural activities match the specified filters")
             return
 
-        print(f"🌍 Cultural Activities ({len(activities)} total)")
-        print("=" * 80)
+        lines = [f"🌍 Cultural Activities ({len(activities)} total)", "=" * 80]
 
         for activity in sorted(activities, key=lambda x: x.title):
-            print(f"🎭 {activity.id}")
-            print(f"   Language: {activity.language.value}")
-            print(f"   Title: {activity.title}")
-            print(f"   Type: {activity.type}")
-            print(f"   Duration: {activity.duration_hours} hours")
-            print(f"   Grade Levels: {', '.join(activity.grade_levels)}")
-            print(f"   Status: {activity.status}")
+            lines.extend((
+                f"🎭 {activity.id}",
+                f"   Language: {activity.language.value}",
+                f"   Title: {activity.title}",
+                f"   Type: {activity.type}",
+                f"   Duration: {activity.duration_hours} hours",
+                f"   Grade Levels: {', '.join(activity.grade_levels)}",
+                f"   Status: {activity.status}",
+            ))
 
             if activity.objectives:
-                print(f"   Objectives: {len(activity.objectives)}")
+                lines.append(f"   Objectives: {len(activity.objectives)}")
 
             if activity.scheduled_date:
-                print(f"   Scheduled: {activity.scheduled_date}")
+                lines.append(f"   Scheduled: {activity.scheduled_date}")
+
+            lines.append("")
 
-            print()
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error listing cultural activities: {e}")
@@ -411,94 +564,19 @@ def list_cultural_activities(
 @app.command()
 def show_proficiency_levels() -> None:
     """Show ACTFL proficiency levels and descriptions."""
-    try:
-        print("🎯 ACTFL Proficiency Levels")
-        print("=" * 50)
-
-        levels = [
-            ("Novice Low", "Can communicate using memorized words and phrases"),
-            ("Novice Mid", "Can handle short social interactions with familiar topics"),
-            ("Novice High", "Can create simple sentences on familiar topics"),
-            ("Intermediate Low", "Can handle uncomplicated tasks in most situations"),
-            ("Intermediate Mid", "Can participate in conversations on familiar topics"),
-            ("Intermediate High", "Can satisfy most work and school needs"),
-            ("Advanced Low", "Can handle a range of face-to-face professional tasks"),
-            ("Advanced Mid", "Can discuss concrete topics with ease"),
-            ("Advanced High", "Can handle most formal and informal interactions"),
-            ("Superior", "Can communicate with accuracy in major topics"),
-            ("Distinguished", "Can communicate as well as educated native speakers")
-        ]
-
-        for level, description in levels:
-            print(f"📊 {level}")
-            print(f"   {description}")
-            print()
-
-    except Exception as e:
-        print(f"❌ Error showing proficiency levels: {e}")
-        raise typer.Exit(1)
+    sys.stdout.write(_PROFICIENCY_LEVELS_TEXT)
 
 
 @app.command()
 def show_actfl_modes() -> None:
     """Show ACTFL modes of communication."""
-    try:
-        print("💬 ACTFL Modes of Communication")
-        print("=" * 50)
-
-        modes = [
-            ("Interpersonal", "Two-way communication between people"),
-            ("Interpretive", "Understanding written and spoken language"),
-            ("Presentational", "Expressing oneself through speaking/writing")
-        ]
-
-        for mode, description in modes:
-            print(f"🎭 {mode}")
-            print(f"   {description}")
-            print()
-
-        print("🌟 Key Features:")
-        print("   • Communicative approach focuses on real-world language use")
-        print("   • All modes essential for comprehensive language proficiency")
-        print("   • Integrated skills development across modes")
-
-    except Exception as e:
-        print(f"❌ Error showing ACTFL modes: {e}")
-        raise typer.Exit(1)
+    sys.stdout.write(_ACTFL_MODES_TEXT)
 
 
 @app.command()
 def show_content_areas() -> None:
     """Show world language content areas."""
-    try:
-        print("📚 World Language Content Areas")
-        print("=" * 50)
-
-        areas = [
-            ("Grammar", "Language structures and patterns"),
-            ("Vocabulary", "Word knowledge and usage"),
-            ("Pronunciation", "Sounds and intonation patterns"),
-            ("Culture", "Cultural perspectives and practices"),
-            ("Literature", "Literary texts and analysis"),
-            ("History", "Historical contexts and events"),
-            ("Current Events", "Contemporary issues and topics"),
-            ("Professions", "Career-related language and skills"),
-            ("Media", "Digital and traditional media content")
-        ]
-
-        for area, description in areas:
-            print(f"📖 {area}")
-            print(f"   {description}")
-            print()
-
-        print("🌟 Integration Focus:")
-        print("   • Content and language integrated learning")
-        print("   • Cultural context for all content areas")
-        print("   • Real-world application and relevance")
-
-    except Exception as e:
-        print(f"❌ Error showing content areas: {e}")
-        raise typer.Exit(1)
+    sys.stdout.write(_CONTENT_AREAS_TEXT)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import total_ordering
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
-from ..utils.io import read_json, write_json
+import numpy as np
+
+from ..utils.io import dump_json, read_json, write_json
+from ._kernels import score_means
 
 
 class Language(Enum):
@@ -18,8 +24,9 @@ class Language(Enum):
     SPANISH = "Spanish"
 
 
+@total_ordering
 class ProficiencyLevel(Enum):
-    """ACTFL proficiency levels."""
+    """ACTFL proficiency levels, ordered from Novice Low to Distinguished."""
     NOVICE_LOW = "Novice Low"
     NOVICE_MID = "Novice Mid"
     NOVICE_HIGH = "Novice High"
@@ -32,6 +39,16 @@ class ProficiencyLevel(Enum):
     SUPERIOR = "Superior"
     DISTINGUISHED = "Distinguished"
 
+    def __lt__(self, other: object) -> bool:
+        if type(other) is not ProficiencyLevel:
+            return NotImplemented
+        return _PROFICIENCY_RANK[self] < _PROFICIENCY_RANK[other]
+
+
+# Position of each level on the ACTFL scale; values stay the display strings
+# so saved records and CLI arguments are unchanged
+_PROFICIENCY_RANK: Dict[ProficiencyLevel, int] = {level: i for i, level in enumerate(ProficiencyLevel)}
+
 
 class ACTFLMode(Enum):
     """ACTFL modes of communication."""
@@ -53,7 +70,30 @@ class ContentArea(Enum):
     MEDIA = "Media"
 
 
-@dataclass
+# (enum class, stored value) -> member, for turning saved strings back into
+# enums with a dict lookup rather than an Enum call
+_ENUM_DECODE: Dict[Tuple[type, str], Enum] = {
+    (cls, member.value): member
+    for cls in (Language, ProficiencyLevel, ACTFLMode, ContentArea)
+    for member in cls
+}
+
+
+@dataclass(slots=True, frozen=True)
+class CurriculumUnit:
+    """One unit of a language curriculum."""
+    title: str
+    theme: str
+    proficiency_focus: str
+    cultural_focus: str
+    essential_question: str
+    learning_activities: Tuple[str, ...] = ()
+    vocabulary: Tuple[str, ...] = ()
+    grammar: Tuple[str, ...] = ()
+    assessment: str = ""
+
+
+@dataclass(slots=True)
 class LanguageCurriculum:
     """Comprehensive language curriculum with cultural integration."""
     id: str
@@ -62,7 +102,7 @@ class LanguageCurriculum:
     proficiency_target: ProficiencyLevel
     title: str
     description: str
-    units: List[Dict[str, Any]] = field(default_factory=list)
+    units: List[CurriculumUnit] = field(default_factory=list)
     essential_questions: List[str] = field(default_factory=list)
     enduring_understandings: List[str] = field(default_factory=list)
     cultural_competencies: List[str] = field(default_factory=list)
@@ -74,7 +114,7 @@ class LanguageCurriculum:
     alignment_standards: List[str] = field(default_factory=list)  # ACTFL, NGSS, CCSS, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class LessonPlan:
     """Standards-based lesson plan with communicative focus."""
     id: str
@@ -98,7 +138,7 @@ class LessonPlan:
     created_date: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CulturalActivity:
     """Cultural enrichment activities and events."""
     id: str
@@ -117,7 +157,7 @@ class CulturalActivity:
     status: str = "planned"  # planned, in_progress, completed, cancelled
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageAssessment:
     """Standards-based language assessment."""
     id: str
@@ -137,7 +177,7 @@ class LanguageAssessment:
     next_assessment_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentProgress:
     """Comprehensive student language learning progress."""
     id: str
@@ -157,89 +197,147 @@ class StudentProgress:
     last_updated: str = ""
 
 
+def _id_suffix() -> str:
+    """Random tail for record ids, so records created within the same second do not overwrite each other."""
+    return uuid.uuid4().hex[:8]
+
+
+# Built curricula by (language, level), shared across WorldLanguagesManager instances
+# so a manager created per request does not rebuild them; treat them as read-only
+_CURRICULA: Dict[Tuple[Language, str], LanguageCurriculum] = {}
+# Compact JSON of each curriculum, serialized on first request
+_CURRICULUM_JSON: Dict[Tuple[Language, str], bytes] = {}
+
+
+# Lesson activities and summative assessment for each ACTFL mode in a plan's communicative goals
+_PROCEDURES_BY_MODE: Dict[str, Tuple[str, ...]] = {
+    "Interpersonal": (
+        "Pair/small group practice: Student conversations using target vocabulary",
+        "Language function practice: Role-playing real-life situations",
+        "Peer feedback and revision activities",
+    ),
+    "Interpretive": (
+        "Reading/listening comprehension activities",
+        "Cultural text analysis and interpretation",
+        "Vocabulary in context practice",
+    ),
+    "Presentational": (
+        "Project development and planning",
+        "Presentation preparation with feedback",
+        "Final presentation delivery and discussion",
+    ),
+}
+_SUMMATIVE_BY_MODE: Dict[str, str] = {
+    "Interpersonal": "Conversation assessment rubric",
+    "Interpretive": "Reading comprehension quiz",
+    "Presentational": "Presentation rubric",
+}
+
+# Differentiation strategies for every lesson plan, plus those added by grade band
+_BASE_DIFFERENTIATION = (
+    "Flexible grouping based on proficiency and interests",
+    "Multiple means of representation (visual, auditory, kinesthetic)",
+    "Choice-based activities for different learning styles",
+    "Technology accommodations for accessibility",
+    "Native language support and translation tools",
+)
+_MIDDLE_SCHOOL_DIFFERENTIATION = (
+    "Simplified instructions with visual supports",
+    "Extra practice opportunities for struggling learners",
+    "Extension activities for advanced students",
+)
+_HIGH_SCHOOL_DIFFERENTIATION = (
+    "Advanced vocabulary options for proficient learners",
+    "Real-world application projects",
+    "Leadership opportunities in group work",
+)
+
+
 class WorldLanguagesManager:
     """Comprehensive world languages instruction and cultural integration manager."""
 
     def __init__(self, data_dir: str = "data/world_languages"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.languages = self._load_language_curricula()
-
-    def _load_language_curricula(self) -> Dict[str, Dict[str, Any]]:
-        """Load comprehensive language curricula for all supported languages."""
+        # Curricula are built on first request and shared by all managers; see get_curriculum
+        self._curriculum_builders = self._language_curriculum_builders()
+        # Records saved inside batch(), by path; None when not batching
+        self._pending: Optional[Dict[Path, Any]] = None
+        self._progress_paths: Dict[str, Path] = {}
+
+    def _language_curriculum_builders(self) -> Dict[Tuple[Language, str], Callable[[], LanguageCurriculum]]:
+        """Builder for each supported (language, level)."""
         return {
-            "Japanese": {
-                "middle_school": self._create_japanese_middle_school(),
-                "high_school": self._create_japanese_high_school()
-            },
-            "Mandarin": {
-                "middle_school": self._create_mandarin_middle_school(),
-                "high_school": self._create_mandarin_high_school()
-            },
-            "Korean": {
-                "middle_school": self._create_korean_middle_school(),
-                "high_school": self._create_korean_high_school()
-            },
-            "French": {
-                "middle_school": self._create_french_middle_school(),
-                "high_school": self._create_french_high_school()
-            },
-            "Spanish": {
-                "middle_school": self._create_spanish_middle_school(),
-                "high_school": self._create_spanish_high_school()
-            }
+            (Language.JAPANESE, "middle_school"): self._create_japanese_middle_school,
+            (Language.JAPANESE, "high_school"): self._create_japanese_high_school,
+            (Language.MANDARIN, "middle_school"): self._create_mandarin_middle_school,
+            (Language.MANDARIN, "high_school"): self._create_mandarin_high_school,
+            (Language.KOREAN, "middle_school"): self._create_korean_middle_school,
+            (Language.KOREAN, "high_school"): self._create_korean_high_school,
+            (Language.FRENCH, "middle_school"): self._create_french_middle_school,
+            (Language.FRENCH, "high_school"): self._create_french_high_school,
+            (Language.SPANISH, "middle_school"): self._create_spanish_middle_school,
+            (Language.SPANISH, "high_school"): self._create_spanish_high_school,
         }
 
+    @property
+    def languages(self) -> Dict[str, Dict[str, LanguageCurriculum]]:
+        """Every curriculum, by language and level; builds any not yet requested."""
+        languages: Dict[str, Dict[str, LanguageCurriculum]] = {}
+        for language, level in self._curriculum_builders:
+            languages.setdefault(language.value, {})[level] = self.get_curriculum(language, level)
+        return languages
+
     def _create_japanese_middle_school(self) -> LanguageCurriculum:
         """Create comprehensive Japanese curriculum for middle school."""
         curriculum_id = "jp_ms_curriculum"
 
         units = [
-            {
-                "title": "Japanese Greetings and Introductions",
-                "theme": "Personal Identity",
-                "proficiency_focus": "Novice Low",
-                "cultural_focus": "Japanese etiquette and bowing",
-                "essential_question": "How do we introduce ourselves in Japanese culture?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Japanese Greetings and Introductions",
+                theme="Personal Identity",
+                proficiency_focus="Novice Low",
+                cultural_focus="Japanese etiquette and bowing",
+                essential_question="How do we introduce ourselves in Japanese culture?",
+                learning_activities=(
                     "Role-playing introductions with appropriate bowing",
                     "Creating digital name cards with self-introductions",
                     "Cultural comparison: American vs. Japanese introductions"
-                ],
-                "vocabulary": ["konnichiwa", "hajimemashite", "yoroshiku onegaishimasu"],
-                "grammar": ["Basic sentence structure", "Particle usage (wa, ga)"],
-                "assessment": "Presentational speaking assessment with cultural accuracy"
-            },
-            {
-                "title": "Family and Relationships",
-                "theme": "Family Structure",
-                "proficiency_focus": "Novice Mid",
-                "cultural_focus": "Japanese family dynamics and honorifics",
-                "essential_question": "How does family structure influence Japanese communication?",
-                "learning_activities": [
+                ),
+                vocabulary=("konnichiwa", "hajimemashite", "yoroshiku onegaishimasu"),
+                grammar=("Basic sentence structure", "Particle usage (wa, ga)"),
+                assessment="Presentational speaking assessment with cultural accuracy"
+            ),
+            CurriculumUnit(
+                title="Family and Relationships",
+                theme="Family Structure",
+                proficiency_focus="Novice Mid",
+                cultural_focus="Japanese family dynamics and honorifics",
+                essential_question="How does family structure influence Japanese communication?",
+                learning_activities=(
                     "Family tree creation with honorific language",
                     "Video interviews with Japanese students about family",
                     "Comparison of family vocabulary across cultures"
-                ],
-                "vocabulary": ["kazoku", "otousan", "okaasan", "oniisan", "oneesan"],
-                "grammar": ["Possessive particles (no)", "Describing relationships"],
-                "assessment": "Interpersonal conversation about family"
-            },
-            {
-                "title": "School Life in Japan",
-                "theme": "Education System",
-                "proficiency_focus": "Novice High",
-                "cultural_focus": "Japanese school culture and club activities",
-                "essential_question": "How does school life reflect Japanese values?",
-                "learning_activities": [
+                ),
+                vocabulary=("kazoku", "otousan", "okaasan", "oniisan", "oneesan"),
+                grammar=("Possessive particles (no)", "Describing relationships"),
+                assessment="Interpersonal conversation about family"
+            ),
+            CurriculumUnit(
+                title="School Life in Japan",
+                theme="Education System",
+                proficiency_focus="Novice High",
+                cultural_focus="Japanese school culture and club activities",
+                essential_question="How does school life reflect Japanese values?",
+                learning_activities=(
                     "Virtual exchange with Japanese middle school students",
                     "Research on Japanese school clubs (bukatsu)",
                     "Creating presentations about American vs. Japanese schools"
-                ],
-                "vocabulary": ["gakkou", "sensei", "gakusei", "bukatsu"],
-                "grammar": ["Time expressions", "Daily routine descriptions"],
-                "assessment": "Presentational project on school comparison"
-            }
+                ),
+                vocabulary=("gakkou", "sensei", "gakusei", "bukatsu"),
+                grammar=("Time expressions", "Daily routine descriptions"),
+                assessment="Presentational project on school comparison"
+            )
         ]
 
         return LanguageCurriculum(
@@ -291,51 +389,51 @@ class WorldLanguagesManager:
         curriculum_id = "jp_hs_curriculum"
 
         units = [
-            {
-                "title": "Contemporary Japanese Society",
-                "theme": "Modern Japan",
-                "proficiency_focus": "Intermediate Low",
-                "cultural_focus": "Japanese youth culture and social media",
-                "essential_question": "How do Japanese youth balance tradition and modernity?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Contemporary Japanese Society",
+                theme="Modern Japan",
+                proficiency_focus="Intermediate Low",
+                cultural_focus="Japanese youth culture and social media",
+                essential_question="How do Japanese youth balance tradition and modernity?",
+                learning_activities=(
                     "Analysis of Japanese social media trends",
                     "Interviews with Japanese exchange students",
                     "Debate: Tradition vs. modernity in Japanese society"
-                ],
-                "vocabulary": ["wakamono", "otaku", "kawaii", "salaryman"],
-                "grammar": ["Causative/passive forms", "Expressing opinions"],
-                "assessment": "Presentational debate with research"
-            },
-            {
-                "title": "Japanese Literature and Media",
-                "theme": "Creative Expression",
-                "proficiency_focus": "Intermediate Mid",
-                "cultural_focus": "Manga, anime, and contemporary literature",
-                "essential_question": "How do Japanese creative arts reflect cultural values?",
-                "learning_activities": [
+                ),
+                vocabulary=("wakamono", "otaku", "kawaii", "salaryman"),
+                grammar=("Causative/passive forms", "Expressing opinions"),
+                assessment="Presentational debate with research"
+            ),
+            CurriculumUnit(
+                title="Japanese Literature and Media",
+                theme="Creative Expression",
+                proficiency_focus="Intermediate Mid",
+                cultural_focus="Manga, anime, and contemporary literature",
+                essential_question="How do Japanese creative arts reflect cultural values?",
+                learning_activities=(
                     "Manga analysis with cultural context",
                     "Creating original stories in Japanese style",
                     "Japanese film analysis and discussion"
-                ],
-                "vocabulary": ["manga", "anime", "dorama", "bungaku"],
-                "grammar": ["Quotations", "Expressing emotions and opinions"],
-                "assessment": "Literary analysis presentation"
-            },
-            {
-                "title": "Japanese for the Professions",
-                "theme": "Career Preparation",
-                "proficiency_focus": "Intermediate High",
-                "cultural_focus": "Japanese business culture and etiquette",
-                "essential_question": "How does Japanese business culture influence global communication?",
-                "learning_activities": [
+                ),
+                vocabulary=("manga", "anime", "dorama", "bungaku"),
+                grammar=("Quotations", "Expressing emotions and opinions"),
+                assessment="Literary analysis presentation"
+            ),
+            CurriculumUnit(
+                title="Japanese for the Professions",
+                theme="Career Preparation",
+                proficiency_focus="Intermediate High",
+                cultural_focus="Japanese business culture and etiquette",
+                essential_question="How does Japanese business culture influence global communication?",
+                learning_activities=(
                     "Business role-plays with proper etiquette",
                     "Research on Japanese internship programs",
                     "Creating professional portfolios in Japanese"
-                ],
-                "vocabulary": ["kaisha", "shachou", "kaigi", "keiyaku"],
-                "grammar": ["Formal language (keigo)", "Professional expressions"],
-                "assessment": "Business presentation and negotiation"
-            }
+                ),
+                vocabulary=("kaisha", "shachou", "kaigi", "keiyaku"),
+                grammar=("Formal language (keigo)", "Professional expressions"),
+                assessment="Business presentation and negotiation"
+            )
         ]
 
         return LanguageCurriculum(
@@ -387,36 +485,36 @@ class WorldLanguagesManager:
         curriculum_id = "md_ms_curriculum"
 
         units = [
-            {
-                "title": "Chinese Characters and Pinyin",
-                "theme": "Language Foundation",
-                "proficiency_focus": "Novice Low",
-                "cultural_focus": "Chinese writing system and pronunciation",
-                "essential_question": "How does the Chinese writing system reflect cultural values?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Chinese Characters and Pinyin",
+                theme="Language Foundation",
+                proficiency_focus="Novice Low",
+                cultural_focus="Chinese writing system and pronunciation",
+                essential_question="How does the Chinese writing system reflect cultural values?",
+                learning_activities=(
                     "Pinyin pronunciation practice with tones",
                     "Character writing with cultural stories",
                     "Chinese name creation and meaning exploration"
-                ],
-                "vocabulary": ["nǐ hǎo", "xiè xiè", "zài jiàn"],
-                "grammar": ["Basic sentence structure", "Tone production"],
-                "assessment": "Character writing and pronunciation assessment"
-            },
-            {
-                "title": "Family and School Life",
-                "theme": "Personal Relationships",
-                "proficiency_focus": "Novice Mid",
-                "cultural_focus": "Chinese family values and education",
-                "essential_question": "How do family relationships influence Chinese communication?",
-                "learning_activities": [
+                ),
+                vocabulary=("nǐ hǎo", "xiè xiè", "zài jiàn"),
+                grammar=("Basic sentence structure", "Tone production"),
+                assessment="Character writing and pronunciation assessment"
+            ),
+            CurriculumUnit(
+                title="Family and School Life",
+                theme="Personal Relationships",
+                proficiency_focus="Novice Mid",
+                cultural_focus="Chinese family values and education",
+                essential_question="How do family relationships influence Chinese communication?",
+                learning_activities=(
                     "Family photo albums with Chinese descriptions",
                     "School life comparison videos",
                     "Chinese holiday celebration projects"
-                ],
-                "vocabulary": ["jiā", "xué xiào", "lǎo shī", "péng yǒu"],
-                "grammar": ["Possession (de)", "Question formation"],
-                "assessment": "Family interview presentation"
-            }
+                ),
+                vocabulary=("jiā", "xué xiào", "lǎo shī", "péng yǒu"),
+                grammar=("Possession (de)", "Question formation"),
+                assessment="Family interview presentation"
+            )
         ]
 
         return LanguageCurriculum(
@@ -449,21 +547,21 @@ class WorldLanguagesManager:
         curriculum_id = "md_hs_curriculum"
 
         units = [
-            {
-                "title": "Chinese Media and Pop Culture",
-                "theme": "Modern China",
-                "proficiency_focus": "Intermediate Low",
-                "cultural_focus": "Contemporary Chinese media and youth culture",
-                "essential_question": "How does Chinese media reflect changing cultural values?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Chinese Media and Pop Culture",
+                theme="Modern China",
+                proficiency_focus="Intermediate Low",
+                cultural_focus="Contemporary Chinese media and youth culture",
+                essential_question="How does Chinese media reflect changing cultural values?",
+                learning_activities=(
                     "Chinese film and music analysis",
                     "Social media trends research",
                     "Chinese influencer interviews"
-                ],
-                "vocabulary": ["wǎng luò", "shǒu jī", "yīn yuè", "diàn yǐng"],
-                "grammar": ["Complex sentence structures", "Media language"],
-                "assessment": "Media presentation project"
-            }
+                ),
+                vocabulary=("wǎng luò", "shǒu jī", "yīn yuè", "diàn yǐng"),
+                grammar=("Complex sentence structures", "Media language"),
+                assessment="Media presentation project"
+            )
         ]
 
         return LanguageCurriculum(
@@ -481,21 +579,21 @@ class WorldLanguagesManager:
         curriculum_id = "kr_ms_curriculum"
 
         units = [
-            {
-                "title": "Hangul and Basic Communication",
-                "theme": "Language Foundation",
-                "proficiency_focus": "Novice Low",
-                "cultural_focus": "Korean alphabet and social etiquette",
-                "essential_question": "How does the Korean alphabet reflect Korean cultural values?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Hangul and Basic Communication",
+                theme="Language Foundation",
+                proficiency_focus="Novice Low",
+                cultural_focus="Korean alphabet and social etiquette",
+                essential_question="How does the Korean alphabet reflect Korean cultural values?",
+                learning_activities=(
                     "Hangul writing practice with cultural connections",
                     "Basic conversation practice with bowing",
                     "K-pop song lyrics analysis"
-                ],
-                "vocabulary": ["annyeong", "gamsahamnida", "joesonghamnida"],
-                "grammar": ["Basic sentence structure", "Honorific particles"],
-                "assessment": "Basic conversation with cultural accuracy"
-            }
+                ),
+                vocabulary=("annyeong", "gamsahamnida", "joesonghamnida"),
+                grammar=("Basic sentence structure", "Honorific particles"),
+                assessment="Basic conversation with cultural accuracy"
+            )
         ]
 
         return LanguageCurriculum(
@@ -513,21 +611,21 @@ class WorldLanguagesManager:
         curriculum_id = "kr_hs_curriculum"
 
         units = [
-            {
-                "title": "Korean Society and Innovation",
-                "theme": "Modern Korea",
-                "proficiency_focus": "Intermediate Low",
-                "cultural_focus": "Korean innovation and technology culture",
-                "essential_question": "How has Korean culture influenced global technology?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Korean Society and Innovation",
+                theme="Modern Korea",
+                proficiency_focus="Intermediate Low",
+                cultural_focus="Korean innovation and technology culture",
+                essential_question="How has Korean culture influenced global technology?",
+                learning_activities=(
                     "K-tech company presentations",
                     "Korean innovation research projects",
                     "K-pop globalization analysis"
-                ],
-                "vocabulary": ["giyeok", "saneop", "munhwa", "gyoyuk"],
-                "grammar": ["Formal and informal speech levels", "Complex sentences"],
-                "assessment": "Innovation presentation in Korean"
-            }
+                ),
+                vocabulary=("giyeok", "saneop", "munhwa", "gyoyuk"),
+                grammar=("Formal and informal speech levels", "Complex sentences"),
+                assessment="Innovation presentation in Korean"
+            )
         ]
 
         return LanguageCurriculum(
@@ -545,36 +643,36 @@ class WorldLanguagesManager:
         curriculum_id = "fr_ms_curriculum"
 
         units = [
-            {
-                "title": "Bonjour! French Greetings and Identity",
-                "theme": "Personal Identity",
-                "proficiency_focus": "Novice Low",
-                "cultural_focus": "French-speaking cultures and introductions",
-                "essential_question": "How do French-speaking cultures express identity?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Bonjour! French Greetings and Identity",
+                theme="Personal Identity",
+                proficiency_focus="Novice Low",
+                cultural_focus="French-speaking cultures and introductions",
+                essential_question="How do French-speaking cultures express identity?",
+                learning_activities=(
                     "Cultural introduction videos from Francophone countries",
                     "French name and identity presentations",
                     "Comparison of greeting customs across cultures"
-                ],
-                "vocabulary": ["bonjour", "comment ça va", "je m'appelle", "enchanté"],
-                "grammar": ["Subject pronouns", "Basic verb conjugation (être, avoir)"],
-                "assessment": "Personal introduction presentation"
-            },
-            {
-                "title": "La Famille et les Amis",
-                "theme": "Relationships",
-                "proficiency_focus": "Novice Mid",
-                "cultural_focus": "French family dynamics and friendship",
-                "essential_question": "How do French-speaking cultures view family and friendship?",
-                "learning_activities": [
+                ),
+                vocabulary=("bonjour", "comment ça va", "je m'appelle", "enchanté"),
+                grammar=("Subject pronouns", "Basic verb conjugation (être, avoir)"),
+                assessment="Personal introduction presentation"
+            ),
+            CurriculumUnit(
+                title="La Famille et les Amis",
+                theme="Relationships",
+                proficiency_focus="Novice Mid",
+                cultural_focus="French family dynamics and friendship",
+                essential_question="How do French-speaking cultures view family and friendship?",
+                learning_activities=(
                     "Family tree creation with French vocabulary",
                     "French music and friendship themes",
                     "Cultural comparison of family celebrations"
-                ],
-                "vocabulary": ["la famille", "les parents", "les amis", "l'anniversaire"],
-                "grammar": ["Possession (mon, ma, mes)", "Present tense regular verbs"],
-                "assessment": "Family and friends photo story"
-            }
+                ),
+                vocabulary=("la famille", "les parents", "les amis", "l'anniversaire"),
+                grammar=("Possession (mon, ma, mes)", "Present tense regular verbs"),
+                assessment="Family and friends photo story"
+            )
         ]
 
         return LanguageCurriculum(
@@ -592,21 +690,21 @@ class WorldLanguagesManager:
         curriculum_id = "fr_hs_curriculum"
 
         units = [
-            {
-                "title": "French Literature and Social Issues",
-                "theme": "Contemporary France",
-                "proficiency_focus": "Intermediate Low",
-                "cultural_focus": "French social issues and literature",
-                "essential_question": "How does French literature address contemporary social issues?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="French Literature and Social Issues",
+                theme="Contemporary France",
+                proficiency_focus="Intermediate Low",
+                cultural_focus="French social issues and literature",
+                essential_question="How does French literature address contemporary social issues?",
+                learning_activities=(
                     "Analysis of contemporary French films",
                     "Debates on French social policies",
                     "Translation of modern French literature excerpts"
-                ],
-                "vocabulary": ["l'immigration", "l'environnement", "l'égalité", "la culture"],
-                "grammar": ["Subjunctive mood", "Complex sentence structures"],
-                "assessment": "Literary analysis and debate presentation"
-            }
+                ),
+                vocabulary=("l'immigration", "l'environnement", "l'égalité", "la culture"),
+                grammar=("Subjunctive mood", "Complex sentence structures"),
+                assessment="Literary analysis and debate presentation"
+            )
         ]
 
         return LanguageCurriculum(
@@ -624,36 +722,36 @@ class WorldLanguagesManager:
         curriculum_id = "es_ms_curriculum"
 
         units = [
-            {
-                "title": "¡Hola! Spanish Greetings and Cultural Identity",
-                "theme": "Personal Identity",
-                "proficiency_focus": "Novice Low",
-                "cultural_focus": "Hispanic cultures and self-expression",
-                "essential_question": "How do Spanish-speaking cultures express personal identity?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="¡Hola! Spanish Greetings and Cultural Identity",
+                theme="Personal Identity",
+                proficiency_focus="Novice Low",
+                cultural_focus="Hispanic cultures and self-expression",
+                essential_question="How do Spanish-speaking cultures express personal identity?",
+                learning_activities=(
                     "Cultural identity presentations from Spanish-speaking countries",
                     "Spanish music and self-expression activities",
                     "Bilingual autobiography projects"
-                ],
-                "vocabulary": ["hola", "¿cómo estás?", "me llamo", "mucho gusto"],
-                "grammar": ["Subject pronouns", "Basic verb conjugation (ser, estar)"],
-                "assessment": "Personal presentation with cultural elements"
-            },
-            {
-                "title": "La Familia y la Comunidad",
-                "theme": "Community and Relationships",
-                "proficiency_focus": "Novice Mid",
-                "cultural_focus": "Hispanic family and community values",
-                "essential_question": "How do family and community influence Hispanic cultures?",
-                "learning_activities": [
+                ),
+                vocabulary=("hola", "¿cómo estás?", "me llamo", "mucho gusto"),
+                grammar=("Subject pronouns", "Basic verb conjugation (ser, estar)"),
+                assessment="Personal presentation with cultural elements"
+            ),
+            CurriculumUnit(
+                title="La Familia y la Comunidad",
+                theme="Community and Relationships",
+                proficiency_focus="Novice Mid",
+                cultural_focus="Hispanic family and community values",
+                essential_question="How do family and community influence Hispanic cultures?",
+                learning_activities=(
                     "Family tradition research and presentations",
                     "Community service project proposals in Spanish",
                     "Hispanic holiday celebration comparisons"
-                ],
-                "vocabulary": ["la familia", "la comunidad", "los amigos", "la fiesta"],
-                "grammar": ["Possession (mi, tu, su)", "Present tense irregular verbs"],
-                "assessment": "Community impact project presentation"
-            }
+                ),
+                vocabulary=("la familia", "la comunidad", "los amigos", "la fiesta"),
+                grammar=("Possession (mi, tu, su)", "Present tense irregular verbs"),
+                assessment="Community impact project presentation"
+            )
         ]
 
         return LanguageCurriculum(
@@ -671,21 +769,21 @@ class WorldLanguagesManager:
         curriculum_id = "es_hs_curriculum"
 
         units = [
-            {
-                "title": "Latin American Literature and Social Justice",
-                "theme": "Social Issues",
-                "proficiency_focus": "Intermediate Low",
-                "cultural_focus": "Latin American social justice and literature",
-                "essential_question": "How does Latin American literature address social justice?",
-                "learning_activities": [
+            CurriculumUnit(
+                title="Latin American Literature and Social Justice",
+                theme="Social Issues",
+                proficiency_focus="Intermediate Low",
+                cultural_focus="Latin American social justice and literature",
+                essential_question="How does Latin American literature address social justice?",
+                learning_activities=(
                     "Analysis of magical realism in Latin American literature",
                     "Social justice research projects",
                     "Debates on contemporary Latin American issues"
-                ],
-                "vocabulary": ["la justicia social", "la igualdad", "los derechos humanos", "la cultura"],
-                "grammar": ["Subjunctive in complex sentences", "Advanced vocabulary usage"],
-                "assessment": "Literature analysis and social justice presentation"
-            }
+                ),
+                vocabulary=("la justicia social", "la igualdad", "los derechos humanos", "la cultura"),
+                grammar=("Subjunctive in complex sentences", "Advanced vocabulary usage"),
+                assessment="Literature analysis and social justice presentation"
+            )
         ]
 
         return LanguageCurriculum(
@@ -704,7 +802,8 @@ class WorldLanguagesManager:
                           language_functions: List[str], vocabulary_focus: List[str],
                           cultural_elements: List[str], technology_tools: List[str]) -> LessonPlan:
         """Create a comprehensive lesson plan."""
-        plan_id = f"lesson_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        plan_id = f"lesson_{now.strftime('%Y%m%d_%H%M%S')}_{_id_suffix()}"
 
         lesson_plan = LessonPlan(
             id=plan_id,
@@ -719,7 +818,7 @@ class WorldLanguagesManager:
             cultural_elements=cultural_elements,
             technology_tools=technology_tools,
             created_by="curriculum_system",
-            created_date=datetime.now().strftime('%Y-%m-%d')
+            created_date=now.strftime('%Y-%m-%d')
         )
 
         # Generate procedures based on communicative goals
@@ -738,7 +837,7 @@ class WorldLanguagesManager:
                                activity_type: str, grade_levels: List[str],
                                objectives: List[str], duration_hours: int) -> CulturalActivity:
         """Create a cultural enrichment activity."""
-        activity_id = f"activity_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        activity_id = f"activity_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{_id_suffix()}"
 
         activity = CulturalActivity(
             id=activity_id,
@@ -790,7 +889,8 @@ class WorldLanguagesManager:
                               scores: Dict[str, Any], strengths: List[str],
                               areas_for_growth: List[str], recommendations: List[str]) -> LanguageAssessment:
         """Conduct comprehensive language assessment."""
-        assessment_id = f"assess_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        assessment_id = f"assess_{now.strftime('%Y%m%d_%H%M%S')}_{_id_suffix()}"
 
         assessment = LanguageAssessment(
             id=assessment_id,
@@ -799,7 +899,7 @@ class WorldLanguagesManager:
             assessment_type=assessment_type,
             proficiency_level=proficiency_level,
             mode=ACTFLMode.INTERPERSONAL,  # Default, can be updated
-            assessment_date=datetime.now().strftime('%Y-%m-%d'),
+            assessment_date=now.strftime('%Y-%m-%d'),
             scores=scores,
             strengths=strengths,
             areas_for_growth=areas_for_growth,
@@ -814,6 +914,21 @@ class WorldLanguagesManager:
 
         return assessment
 
+    def average_scores(self, assessments: Iterable[LanguageAssessment]) -> Dict[str, float]:
+        """Mean of each numeric score category across assessments, e.g. for a class."""
+        category_ids: Dict[str, int] = {}
+        category_idx: List[int] = []
+        values: List[float] = []
+        for assessment in assessments:
+            for category, score in assessment.scores.items():
+                if isinstance(score, (int, float)) and not isinstance(score, bool):
+                    category_idx.append(category_ids.setdefault(category, len(category_ids)))
+                    values.append(score)
+        if not values:
+            return {}
+        means = score_means(np.asarray(category_idx, dtype=np.int64), np.asarray(values, dtype=np.float64), len(category_ids))
+        return {category: float(means[i]) for category, i in category_ids.items()}
+
     def _generate_lesson_procedures(self, lesson_plan: LessonPlan) -> List[str]:
         """Generate lesson procedures based on communicative goals."""
         procedures = []
@@ -825,25 +940,8 @@ class WorldLanguagesManager:
         ])
 
         # Main activities based on communicative goals
-        for mode, goals in lesson_plan.communicative_goals.items():
-            if mode == "Interpersonal":
-                procedures.extend([
-                    "Pair/small group practice: Student conversations using target vocabulary",
-                    "Language function practice: Role-playing real-life situations",
-                    "Peer feedback and revision activities"
-                ])
-            elif mode == "Interpretive":
-                procedures.extend([
-                    "Reading/listening comprehension activities",
-                    "Cultural text analysis and interpretation",
-                    "Vocabulary in context practice"
-                ])
-            elif mode == "Presentational":
-                procedures.extend([
-                    "Project development and planning",
-                    "Presentation preparation with feedback",
-                    "Final presentation delivery and discussion"
-                ])
+        for mode in lesson_plan.communicative_goals:
+            procedures.extend(_PROCEDURES_BY_MODE.get(mode, ()))
 
         # Cultural integration
         if lesson_plan.cultural_elements:
@@ -878,13 +976,9 @@ class WorldLanguagesManager:
         ])
 
         # Summative assessments based on communicative goals
-        for mode, goals in lesson_plan.communicative_goals.items():
-            if mode == "Interpersonal":
-                assessment["summative"].append("Conversation assessment rubric")
-            elif mode == "Interpretive":
-                assessment["summative"].append("Reading comprehension quiz")
-            elif mode == "Presentational":
-                assessment["summative"].append("Presentation rubric")
+        assessment["summative"].extend(
+            _SUMMATIVE_BY_MODE[mode] for mode in lesson_plan.communicative_goals if mode in _SUMMATIVE_BY_MODE
+        )
 
         # Self-assessment
         assessment["self_assessment"].extend([
@@ -897,33 +991,14 @@ class WorldLanguagesManager:
 
     def _generate_differentiation_strategies(self, lesson_plan: LessonPlan) -> List[str]:
         """Generate differentiation strategies for diverse learners."""
-        strategies = [
-            "Flexible grouping based on proficiency and interests",
-            "Multiple means of representation (visual, auditory, kinesthetic)",
-            "Choice-based activities for different learning styles",
-            "Technology accommodations for accessibility",
-            "Native language support and translation tools"
-        ]
-
-        # Add strategies based on grade level
         if "Middle" in lesson_plan.grade_level:
-            strategies.extend([
-                "Simplified instructions with visual supports",
-                "Extra practice opportunities for struggling learners",
-                "Extension activities for advanced students"
-            ])
-        else:  # High school
-            strategies.extend([
-                "Advanced vocabulary options for proficient learners",
-                "Real-world application projects",
-                "Leadership opportunities in group work"
-            ])
-
-        return strategies
+            return list(_BASE_DIFFERENTIATION + _MIDDLE_SCHOOL_DIFFERENTIATION)
+        return list(_BASE_DIFFERENTIATION + _HIGH_SCHOOL_DIFFERENTIATION)
 
     def _update_student_progress(self, student_id: str, language: Language, assessment: LanguageAssessment) -> None:
         """Update or create student progress record."""
         progress_id = f"progress_{student_id}_{language.value}"
+        today = datetime.now().strftime('%Y-%m-%d')
 
         try:
             # Try to load existing progress
@@ -934,7 +1009,7 @@ class WorldLanguagesManager:
                 id=progress_id,
                 student_id=student_id,
                 language=language,
-                start_date=datetime.now().strftime('%Y-%m-%d'),
+                start_date=today,
                 current_level=assessment.proficiency_level,
                 target_level=ProficiencyLevel.INTERMEDIATE_HIGH
             )
@@ -942,130 +1017,106 @@ class WorldLanguagesManager:
         # Update progress
         progress.current_level = assessment.proficiency_level
         progress.assessments.append(assessment.id)
-        progress.last_updated = datetime.now().strftime('%Y-%m-%d')
+        progress.last_updated = today
 
-        # Add strengths and challenges
-        progress.achievements.extend(assessment.strengths)
-        progress.challenges.extend(assessment.areas_for_growth)
+        # Add new strengths and challenges; ones already recorded are not repeated
+        progress.achievements = list(dict.fromkeys(progress.achievements + assessment.strengths))
+        progress.challenges = list(dict.fromkeys(progress.challenges + assessment.areas_for_growth))
 
         self._save_student_progress(progress)
 
-    def get_curriculum(self, language: str, level: str) -> LanguageCurriculum:
+    def get_curriculum(self, language: Union[Language, str], level: str) -> LanguageCurriculum:
         """Get curriculum for specific language and level."""
-        return self.languages[language][level]
+        key = self._curriculum_key(language, level)
+        curriculum = _CURRICULA.get(key)
+        if curriculum is None:
+            curriculum = _CURRICULA[key] = self._curriculum_builders[key]()
+        return curriculum
+
+    def get_curriculum_json(self, language: Union[Language, str], level: str) -> bytes:
+        """Curriculum as compact JSON; curricula do not change, so it is serialized only once."""
+        key = self._curriculum_key(language, level)
+        blob = _CURRICULUM_JSON.get(key)
+        if blob is None:
+            blob = _CURRICULUM_JSON[key] = dump_json(self.get_curriculum(*key), indent=False)
+        return blob
+
+    @staticmethod
+    def _curriculum_key(language: Union[Language, str], level: str) -> Tuple[Language, str]:
+        if isinstance(language, str):
+            try:
+                return cast(Language, _ENUM_DECODE[Language, language]), level
+            except KeyError:
+                raise KeyError(language) from None
+        return language, level
 
     def get_all_curricula(self) -> Dict[str, Dict[str, Any]]:
         """Get all curricula."""
         return self.languages
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer record writes until the block exits, writing each file once.
+
+        Assessing a whole class inside one batch rewrites each student's
+        progress record once instead of after every assessment.
+        """
+        if self._pending is not None:  # nested; the outer batch writes
+            yield
+            return
+        self._pending = {}
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            for filepath, record in pending.items():
+                write_json(filepath, record)
+
+    def _write_record(self, filepath: Path, record: Any) -> None:
+        if self._pending is None:
+            write_json(filepath, record)
+        else:
+            self._pending[filepath] = record
+
     def _save_lesson_plan(self, lesson_plan: LessonPlan) -> None:
         """Save lesson plan."""
         filename = f"lesson_plan_{lesson_plan.id}.json"
         filepath = self.data_dir / filename
 
-        data = {
-            "id": lesson_plan.id,
-            "curriculum_id": lesson_plan.curriculum_id,
-            "title": lesson_plan.title,
-            "grade_level": lesson_plan.grade_level,
-            "duration_minutes": lesson_plan.duration_minutes,
-            "objective": lesson_plan.objective,
-            "communicative_goals": lesson_plan.communicative_goals,
-            "language_functions": lesson_plan.language_functions,
-            "vocabulary_focus": lesson_plan.vocabulary_focus,
-            "cultural_elements": lesson_plan.cultural_elements,
-            "materials": lesson_plan.materials,
-            "technology_tools": lesson_plan.technology_tools,
-            "procedures": lesson_plan.procedures,
-            "differentiation": lesson_plan.differentiation,
-            "assessment": lesson_plan.assessment,
-            "homework": lesson_plan.homework,
-            "extensions": lesson_plan.extensions,
-            "created_by": lesson_plan.created_by,
-            "created_date": lesson_plan.created_date
-        }
-
-        write_json(str(filepath), data)
+        # orjson serializes dataclasses and enum values natively
+        self._write_record(filepath, lesson_plan)
 
     def _save_cultural_activity(self, activity: CulturalActivity) -> None:
         """Save cultural activity."""
         filename = f"cultural_activity_{activity.id}.json"
         filepath = self.data_dir / filename
 
-        data = {
-            "id": activity.id,
-            "language": activity.language.value,
-            "title": activity.title,
-            "description": activity.description,
-            "type": activity.type,
-            "grade_levels": activity.grade_levels,
-            "objectives": activity.objectives,
-            "duration_hours": activity.duration_hours,
-            "preparation_needed": activity.preparation_needed,
-            "materials_required": activity.materials_required,
-            "assessment_methods": activity.assessment_methods,
-            "collaboration_partners": activity.collaboration_partners,
-            "scheduled_date": activity.scheduled_date,
-            "status": activity.status
-        }
-
-        write_json(str(filepath), data)
+        self._write_record(filepath, activity)
 
     def _save_assessment(self, assessment: LanguageAssessment) -> None:
         """Save language assessment."""
         filename = f"language_assessment_{assessment.id}.json"
         filepath = self.data_dir / filename
 
-        data = {
-            "id": assessment.id,
-            "student_id": assessment.student_id,
-            "language": assessment.language.value,
-            "assessment_type": assessment.assessment_type,
-            "proficiency_level": assessment.proficiency_level.value,
-            "mode": assessment.mode.value,
-            "content_areas": [area.value for area in assessment.content_areas],
-            "assessment_date": assessment.assessment_date,
-            "scores": assessment.scores,
-            "strengths": assessment.strengths,
-            "areas_for_growth": assessment.areas_for_growth,
-            "recommendations": assessment.recommendations,
-            "administered_by": assessment.administered_by,
-            "notes": assessment.notes,
-            "next_assessment_date": assessment.next_assessment_date
-        }
-
-        write_json(str(filepath), data)
+        self._write_record(filepath, assessment)
 
     def _save_student_progress(self, progress: StudentProgress) -> None:
         """Save student progress record."""
-        filename = f"student_progress_{progress.id}.json"
-        filepath = self.data_dir / filename
-
-        data = {
-            "id": progress.id,
-            "student_id": progress.student_id,
-            "language": progress.language.value,
-            "start_date": progress.start_date,
-            "current_level": progress.current_level.value,
-            "target_level": progress.target_level.value,
-            "courses_completed": progress.courses_completed,
-            "assessments": progress.assessments,
-            "cultural_activities": progress.cultural_activities,
-            "achievements": progress.achievements,
-            "challenges": progress.challenges,
-            "interests": progress.interests,
-            "learning_goals": progress.learning_goals,
-            "mentor_notes": progress.mentor_notes,
-            "last_updated": progress.last_updated
-        }
+        self._write_record(self._progress_path(progress.id), progress)
 
-        write_json(str(filepath), data)
+    def _progress_path(self, progress_id: str) -> Path:
+        """Path of a progress record; each update loads and saves it, so it is built once."""
+        filepath = self._progress_paths.get(progress_id)
+        if filepath is None:
+            filepath = self._progress_paths[progress_id] = self.data_dir / f"student_progress_{progress_id}.json"
+        return filepath
 
     def _load_student_progress(self, progress_id: str) -> StudentProgress:
         """Load student progress record."""
-        filename = f"student_progress_{progress_id}.json"
-        filepath = self.data_dir / filename
+        filepath = self._progress_path(progress_id)
 
+        if self._pending is not None and filepath in self._pending:
+            return self._pending[filepath]
         if filepath.exists():
             data = read_json(str(filepath))
             return StudentProgress(**data)
@@ -1084,6 +1135,6 @@ class WorldLanguagesManager:
     def _load_cultural_activity_from_data(self, data: Dict[str, Any]) -> CulturalActivity:
         """Load cultural activity from data dictionary."""
         # Convert language enum back from string
-        data["language"] = Language(data["language"])
+        data["language"] = _ENUM_DECODE[Language, data["language"]]
 
         return CulturalActivity(**data)
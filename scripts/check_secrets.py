@@ -5,44 +5,124 @@ Looks for common API key patterns and prints any suspicious hits.
 Returns non-zero if any suspected secret is found.
 """
 
+import codecs
+import os
 import re
+import stat
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 
+# Each pattern matches only as far as needed to recognize a secret (a fixed
+# number of key characters), so apart from whitespace runs every match is short
 PATTERNS = [
-    ("OpenAI sk-", re.compile(r"sk-[A-Za-z0-9]{20,}")),
+    ("OpenAI sk-", re.compile(r"sk-[A-Za-z0-9]{20}")),
     ("AWS", re.compile(r"AKIA[0-9A-Z]{16}")),
-    ("Generic API key", re.compile(r"api[_-]?key\s*[:=]\s*['\"][A-Za-z0-9_-]{16,}['\"]", re.I)),
+    ("Generic API key", re.compile(r"api[_-]?key\s*[:=]\s*['\"][A-Za-z0-9_-]{16}", re.I)),
 ]
 
+# All patterns in one regex, so each file is scanned once. Every alternative is
+# a lookahead, so hits of different patterns may overlap (an sk- key inside an
+# api_key assignment reports both). Group p<i> names the PATTERNS entry that
+# matched; re.I is scoped to its own pattern.
+COMBINED = re.compile("|".join(
+    f"(?=(?P<p{i}>(?i:{rx.pattern})))" if rx.flags & re.I else f"(?=(?P<p{i}>{rx.pattern}))"
+    for i, (_, rx) in enumerate(PATTERNS)
+))
+
+# An unfinished generic key assignment running to the end of a window. Its
+# whitespace runs are unbounded, so it may start before the carried tail; the
+# carry is then extended back to its start so the next window sees it whole.
+PENDING = re.compile(r"api[_-]?key\s*(?:[:=]\s*(?:['\"][A-Za-z0-9_-]{0,15})?)?\Z", re.I)
+
+NEWLINE = re.compile(r"\n")
+
+CHUNK_SIZE = 1 << 20
+# Carried from one chunk into the next; longer than any match without a long
+# whitespace run (those are handled by PENDING). Only hits starting before the
+# carried tail are reported from a window, so each is reported once.
+OVERLAP = 128
+BINARY_SNIFF = 8192  # a NUL byte this early marks the file as binary
+
 IGNORE_DIRS = {".git", ".venv", "venv", "node_modules", "qdrant_data", "data", ".mypy_cache", "__pycache__"}
 IGNORE_FILES = {"requirements.txt", ".env.example"}
+SKIP_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".pdf", ".zip", ".gz", ".whl", ".so", ".pyc", ".apkg"}
+MAX_BYTES = 2_000_000  # larger files are build outputs or data dumps, not hand-written config
 
 
 def should_skip(path: Path) -> bool:
-    for part in path.parts:
-        if part in IGNORE_DIRS:
-            return True
-    return path.name in IGNORE_FILES
+    return path.name in IGNORE_FILES or path.suffix.lower() in SKIP_SUFFIXES
+
+
+def is_scannable(path: Path) -> bool:
+    """Whether ``path`` is a regular file small enough to scan, from a single stat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size <= MAX_BYTES
+
+
+def scan_file(path: Path) -> Iterator[Tuple[str, int]]:
+    """Yield (pattern name, line number) for each hit, reading the file in chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    with path.open("rb") as f:
+        data = f.read(CHUNK_SIZE)
+        if b"\0" in data[:BINARY_SNIFF]:
+            return
+        carry, line_base = "", 1
+        while True:
+            window = carry + decoder.decode(data, final=not data)
+            # Hits starting in the last OVERLAP chars are left to the next window, which begins there
+            cut = max(len(window) - OVERLAP, 0) if data else len(window)
+            if data:
+                pending = PENDING.search(window)
+                if pending is not None and pending.start() < cut:
+                    cut = pending.start()
+            line_starts = None  # offsets where each line begins; built on the first hit
+            for m in COMBINED.finditer(window):
+                if m.start() >= cut:
+                    break
+                if line_starts is None:
+                    line_starts = [0]
+                    line_starts.extend(nl.end() for nl in NEWLINE.finditer(window))
+                yield PATTERNS[int(m.lastgroup[1:])][0], line_base - 1 + bisect_right(line_starts, m.start())
+            if not data:
+                return
+            line_base += window.count("\n", 0, cut)
+            carry = window[cut:]
+            data = f.read(CHUNK_SIZE)
+
+
+def iter_files() -> Iterator[Path]:
+    """Files to scan under ROOT; IGNORE_DIRS are pruned before the walk descends into them."""
+    for dirpath, dirnames, filenames in os.walk(ROOT):
+        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
+        for name in filenames:
+            path = Path(dirpath, name)
+            if not should_skip(path) and is_scannable(path):
+                yield path
+
+
+def file_hits(path: Path) -> List[Tuple[str, Path, int]]:
+    """All hits in one file, or none if it cannot be read; runs in a worker process."""
+    try:
+        return [(name, path, ln) for name, ln in scan_file(path)]
+    except OSError:
+        return []
 
 
 def main() -> int:
+    files = list(iter_files())
     hits = []
-    for p in ROOT.rglob("*"):
-        if not p.is_file():
-            continue
-        if should_skip(p):
-            continue
-        try:
-            txt = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        for name, rx in PATTERNS:
-            for m in rx.finditer(txt):
-                line_num = txt[: m.start()].count("\n") + 1
-                hits.append((name, p, line_num))
+    # Files are scanned in parallel; map keeps the results in walk order
+    with ProcessPoolExecutor() as pool:
+        for file_result in pool.map(file_hits, files, chunksize=32):
+            hits.extend(file_result)
     if hits:
         print("Potential secrets found:")
         for name, p, ln in hits:
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Compile the syllabus subject templates into Python modules.
+
+Reads each openeducation/syllabus/templates/<subject>.json and writes
+openeducation/syllabus/_generated_templates/<subject>.py holding the same data
+as a ``TEMPLATE`` literal, so loading a template is a module import (served
+from its .pyc) instead of a JSON parse. Re-run after editing a template.
+"""
+
+import json
+import pprint
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SOURCE_DIR = ROOT / "openeducation" / "syllabus" / "templates"
+OUTPUT_DIR = ROOT / "openeducation" / "syllabus" / "_generated_templates"
+
+HEADER = "# Generated by scripts/gen_templates.py from templates/{name}; do not edit.\n\n"
+
+
+def main() -> int:
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    (OUTPUT_DIR / "__init__.py").write_text(
+        '"""Subject templates compiled from templates/*.json by scripts/gen_templates.py."""\n'
+    )
+    for source in sorted(SOURCE_DIR.glob("*.json")):
+        data = json.loads(source.read_text(encoding="utf-8"))
+        body = pprint.pformat(data, indent=1, width=100, sort_dicts=False)
+        target = OUTPUT_DIR / f"{source.stem}.py"
+        target.write_text(HEADER.format(name=source.name) + f"TEMPLATE = {body}\n", encoding="utf-8")
+        print(f"Wrote {target.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,15 +5,16 @@ Runs the repository's core and integration tests and exits non-zero on failure.
 """
 from __future__ import annotations
 
-import pathlib
+import os
 import sys
 import tempfile
 
 
 def main() -> int:
     try:
+        from openeducation.cli import generate, index, ingest
         from tests.test_core import test_block_and_cards
-        from tests.test_integration import test_end_to_end
+        from tests.test_integration import test_export, test_generate, test_index, test_ingest
     except Exception as exc:
         print(f"Failed to import tests: {exc}")
         return 1
@@ -22,13 +23,19 @@ def main() -> int:
     test_block_and_cards()
     print("Passed: test_block_and_cards")
 
-    print("Running integration test: test_end_to_end")
-    class TmpPath(pathlib.Path):
-        _flavour = pathlib._windows_flavour if pathlib.os.name == 'nt' else pathlib._posix_flavour
-
+    print("Running integration tests: ingest, index, generate, export")
+    # Builds the artifacts the pytest fixtures in tests/conftest.py provide
     with tempfile.TemporaryDirectory() as td:
-        test_end_to_end(TmpPath(td))
-    print("Passed: test_end_to_end")
+        ingest("examples/config_examples/config.json", out_dir=td)
+        blocks_path = os.path.join(td, "content_blocks.json")
+        test_ingest(blocks_path)
+        index(blocks_path)
+        test_index(os.path.join(td, "index.json"))
+        generate(blocks_path, deck_id="deck_neuro", max_cards=10)
+        cards_path = os.path.join(td, "cards.json")
+        test_generate(cards_path)
+        test_export(cards_path)
+    print("Passed: integration tests")
     return 0
 
 
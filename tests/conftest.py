@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from openeducation.cli import generate, index, ingest
+
+E2E_CONFIG = "examples/config_examples/config.json"
+
+
+@pytest.fixture(scope="session")
+def blocks_path(tmp_path_factory):
+    """content_blocks.json ingested from the example config, once per session."""
+    out_dir = tmp_path_factory.mktemp("e2e")
+    ingest(E2E_CONFIG, out_dir=str(out_dir))
+    return os.path.join(out_dir, "content_blocks.json")
+
+
+@pytest.fixture(scope="session")
+def index_path(blocks_path):
+    index(blocks_path)
+    return os.path.join(os.path.dirname(blocks_path), "index.json")
+
+
+@pytest.fixture(scope="session")
+def cards_path(blocks_path, index_path):
+    generate(blocks_path, deck_id="deck_neuro", max_cards=10)
+    return os.path.join(os.path.dirname(blocks_path), "cards.json")
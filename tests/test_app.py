@@ -18,6 +18,8 @@ class FakePoint:
         self.id = pid
         self.vector = vector
         self.payload = payload
+        # naive score from the payload text length, computed once at upsert
+        self.score = float(min(1.0, len((payload or {}).get("text", "")) / 1000.0))
 
 
 class FakeHit:
@@ -43,14 +45,8 @@ class FakeQdrant:
             self._cols[collection_name].append(FakePoint(p.id, p.vector, p.payload))
 
     def search(self, collection_name, query_vector, limit, query_filter=None):
-        # naive score: count matching tokens in payload text
         items = self._cols.get(collection_name, [])
-        hits = []
-        for i, p in enumerate(items[: limit]):
-            txt = (p.payload or {}).get("text", "")
-            score = float(min(1.0, len(txt) / 1000.0))
-            hits.append(FakeHit(p.id, score, p.payload))
-        return hits
+        return [FakeHit(p.id, p.score, p.payload) for p in items[: limit]]
 
     def scroll(self, collection_name, scroll_filter=None, with_payload=True, with_vectors=False, limit=100, offset=None):
         items = self._cols.get(collection_name, [])
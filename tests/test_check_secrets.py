@@ -0,0 +1,43 @@
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "check_secrets", Path(__file__).resolve().parents[1] / "scripts" / "check_secrets.py"
+)
+check_secrets = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_secrets)
+
+AWS_KEY = "AKIA" + "ABCDEFGHIJKLMNOP"
+OPENAI_KEY = "sk-" + "a1B2c3D4e5F6g7H8i9J0k1L2"
+GENERIC = 'api_key = "' + "x" * 200 + '"'
+
+
+def test_scan_file_finds_secrets_straddling_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_secrets, "CHUNK_SIZE", 1024)
+    # The first two secrets share a line and cross the first chunk boundary; the
+    # long generic key starts shortly before the second read's carried tail
+    # and runs past the end of that read
+    line1 = "x" * 1010 + f" {AWS_KEY} {OPENAI_KEY}\n"
+    text = line1 + "y" * (1900 - len(line1) - 1) + "\n" + GENERIC + "\n" + "tail\n" * 300
+    path = tmp_path / "config.txt"
+    path.write_text(text)
+
+    assert list(check_secrets.scan_file(path)) == [("AWS", 1), ("OpenAI sk-", 1), ("Generic API key", 3)]
+
+
+def test_scan_file_finds_long_and_nested_keys(tmp_path):
+    path = tmp_path / "settings.py"
+    path.write_text(f'API_KEY = "{"k" * 300}"\napi_key = "{OPENAI_KEY}"\n')
+
+    assert list(check_secrets.scan_file(path)) == [("Generic API key", 1), ("Generic API key", 2), ("OpenAI sk-", 2)]
+
+
+def test_scan_file_finds_key_with_whitespace_run_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_secrets, "CHUNK_SIZE", 1024)
+    # The assignment starts in the first read and its padding runs far past
+    # the carried tail into the third
+    text = "x" * 900 + "\napi_key =" + " " * 1500 + '"' + "k" * 20 + '"\n' + "tail\n" * 300
+    path = tmp_path / "config.txt"
+    path.write_text(text)
+
+    assert list(check_secrets.scan_file(path)) == [("Generic API key", 2)]
@@ -1,4 +1,5 @@
 from openeducation.llm.rulebased import make_cards_rulebased
+from openeducation.models.card import Card
 from openeducation.models.content_block import ContentBlock
 
 
@@ -8,3 +9,7 @@ def test_block_and_cards():
     assert len(cards) >= 1
     assert cards[0].front
     assert cards[0].back
+
+
+def test_card_basic_dict_matches_basic():
+    assert Card.basic_dict("Q", "A", "s", "d", ["t"]) == Card.basic("Q", "A", "s", "d", ["t"]).to_dict()
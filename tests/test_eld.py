@@ -17,18 +17,19 @@ from openeducation.eld.eld_core import (
 )
 
 
+@pytest.fixture(scope="module")
+def manager(tmp_path_factory):
+    """Create one ELD manager, with a temporary directory, shared by the module's tests."""
+    return ELDManager(str(tmp_path_factory.mktemp("eld_data")))
+
+
 class TestELDManager:
     """Test ELD Manager functionality."""
 
-    @pytest.fixture
-    def manager(self, tmp_path):
-        """Create ELD manager with temporary directory."""
-        return ELDManager(str(tmp_path / "eld_data"))
-
     def test_create_eld_profile(self, manager):
         """Test creating ELD student profile."""
         profile = manager.create_eld_profile(
-            student_id="student_001",
+            student_id="student_101",
             current_level=EnglishProficiencyLevel.DEVELOPING,
             primary_language="Spanish",
             overall_score=2.8,
@@ -37,7 +38,7 @@ class TestELDManager:
         )
 
         assert profile.id.startswith("eld_")
-        assert profile.student_id == "student_001"
+        assert profile.student_id == "student_101"
         assert profile.current_level == EnglishProficiencyLevel.DEVELOPING
         assert profile.overall_score == 2.8
         assert profile.primary_language == "Spanish"
@@ -66,7 +67,7 @@ class TestELDManager:
     def test_assess_eld_progress(self, manager):
         """Test ELD progress assessment."""
         record = manager.assess_eld_progress(
-            student_id="student_001",
+            student_id="student_102",
             assessment_type="progress",
             proficiency_level=EnglishProficiencyLevel.DEVELOPING,
             overall_score=3.2,
@@ -79,7 +80,7 @@ class TestELDManager:
         )
 
         assert record.id.startswith("progress_")
-        assert record.student_id == "student_001"
+        assert record.student_id == "student_102"
         assert record.proficiency_level == EnglishProficiencyLevel.DEVELOPING
         assert len(record.next_steps) > 0
 
@@ -88,7 +89,7 @@ class TestELDManager:
         record = manager.collaborate_with_teacher(
             teacher_id="teacher_smith",
             eld_specialist_id="eld_specialist_001",
-            student_ids=["student_001", "student_002"],
+            student_ids=["student_103", "student_104"],
             focus_area="vocabulary_development",
             discussion_topics=["Spanish vocabulary strategies"],
             agreed_actions=["Implement word walls"],
@@ -1,16 +1,21 @@
 import os
 
-from openeducation.cli import export, generate, index, ingest
+from openeducation.cli import export
 
 
-def test_end_to_end(tmp_path):
-    cfg = "examples/config_examples/config.json"
-    ingest(cfg, out_dir=tmp_path)
-    blocks_path = os.path.join(tmp_path, "content_blocks.json")
-    index(blocks_path)
-    generate(blocks_path, deck_id="deck_neuro", max_cards=10)
-    cards_path = os.path.join(tmp_path, "cards.json")
+def test_ingest(blocks_path):
+    assert os.path.exists(blocks_path)
+
+
+def test_index(index_path):
+    assert os.path.exists(index_path)
+
+
+def test_generate(cards_path):
     assert os.path.exists(cards_path)
+
+
+def test_export(cards_path):
     export(cards_path, deck_id="deck_neuro", name="TestDeck")
-    apkg = os.path.join(tmp_path, "TestDeck.apkg")
+    apkg = os.path.join(os.path.dirname(cards_path), "TestDeck.apkg")
     assert os.path.exists(apkg)
@@ -0,0 +1,240 @@
+"""
+Tests for learning progress tracking.
+"""
+
+import gzip
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from openeducation.scheduling.progress_tracker import (
+    AnkiPerformance,
+    ProgressTracker,
+    StudySession,
+)
+from openeducation.utils.io import read_json_maybe_gz, write_json
+
+
+def make_session(objective_id: str, unit_id: str = "unit_1", **kwargs) -> StudySession:
+    return StudySession(
+        id=f"alice_{objective_id}_{unit_id}",
+        syllabus_id="bio_101",
+        unit_id=unit_id,
+        objective_id=objective_id,
+        scheduled_date="",
+        duration_planned=0,
+        **kwargs,
+    )
+
+
+def make_review(card_id: str, deck_name: str, lapses: int = 0) -> AnkiPerformance:
+    return AnkiPerformance(
+        card_id=card_id,
+        deck_name=deck_name,
+        lapses=lapses,
+        ease_factor=2.5,
+        review_date="2024-01-15",
+    )
+
+
+class TestProgressTracker:
+    """Test ProgressTracker functionality."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a tracker with one student already tracking bio_101."""
+        tracker = ProgressTracker(str(tmp_path / "progress"))
+        tracker.start_tracking("bio_101", "alice")
+        return tracker
+
+    def test_log_session_round_trip(self, tracker):
+        """Test that logged sessions load back as dataclasses."""
+        tracker.log_session(make_session("obj_1", duration_actual=30, completed=True))
+
+        progress = tracker._load_progress("bio_101", "alice")
+        assert progress.total_sessions == 1
+        assert progress.completed_sessions == 1
+        assert progress.total_study_time == 30
+        assert isinstance(progress.sessions[0], StudySession)
+
+    def test_saved_progress_readable_by_viewer(self, tracker):
+        """Test that the gzip progress file loads through the TUI's JSON reader."""
+        tracker.log_session(make_session("obj_1", duration_actual=30, completed=True))
+
+        path = tracker._progress_path("bio_101", "alice")
+        assert path.name.endswith(".json.gz")
+        data = read_json_maybe_gz(path)
+        assert data["student_id"] == "alice"
+        assert data["total_study_time"] == 30
+
+    def test_import_anki_reviews_uses_most_recent_deck_session(self, tracker):
+        """Test that reviews attach to the latest session mentioning the deck."""
+        tracker.log_session(make_session("obj_1", notes="Cells, Genetics"))
+        tracker.log_session(make_session("obj_2", notes="Reviewed Cells deck"))
+        tracker.log_session(make_session("obj_3", notes="Ecology"))
+
+        tracker.import_anki_reviews(
+            "bio_101",
+            "alice",
+            [make_review("c1", "Cells"), make_review("c2", "Genetics"), make_review("c3", "Unknown")],
+        )
+
+        sessions = tracker._load_progress("bio_101", "alice").sessions
+        assert [p.card_id for p in sessions[0].anki_performance] == ["c2"]
+        assert [p.card_id for p in sessions[1].anki_performance] == ["c1"]
+        assert sessions[2].anki_performance == []
+        assert isinstance(sessions[1].anki_performance[0], AnkiPerformance)
+
+    def test_import_anki_reviews_matches_explicit_deck_tags(self, tracker):
+        """Test that deck tags survive a save and match multi-word deck names."""
+        tracker.log_session(make_session("obj_1", deck_tags={"Cell Biology"}))
+        assert tracker._load_progress("bio_101", "alice").sessions[0].deck_tags == {"Cell Biology"}
+
+        tracker.import_anki_reviews("bio_101", "alice", [make_review("c1", "Cell Biology")])
+
+        sessions = tracker._load_progress("bio_101", "alice").sessions
+        assert [p.card_id for p in sessions[0].anki_performance] == ["c1"]
+
+    def test_import_anki_reviews_matches_deck_names_inside_notes(self, tracker):
+        """Test that multi-word and punctuated deck names in free text still match."""
+        tracker.log_session(make_session("obj_1", notes="Studied Japanese Vocab today"))
+        tracker.log_session(make_session("obj_2", notes="Finished Default::Japanese."))
+
+        tracker.import_anki_reviews(
+            "bio_101", "alice", [make_review("c1", "Japanese Vocab"), make_review("c2", "Default::Japanese")]
+        )
+
+        sessions = tracker._load_progress("bio_101", "alice").sessions
+        assert [p.card_id for p in sessions[0].anki_performance] == ["c1"]
+        assert [p.card_id for p in sessions[1].anki_performance] == ["c2"]
+
+    def test_import_anki_reviews_for_syllabus_deck(self, tracker):
+        """Test that syllabus-named decks attach to the latest session."""
+        tracker.log_session(make_session("obj_1", notes="Cells"))
+        tracker.log_session(make_session("obj_2"))
+
+        tracker.import_anki_reviews("bio_101", "alice", [make_review("c1", "bio_101::Unit 1")])
+
+        sessions = tracker._load_progress("bio_101", "alice").sessions
+        assert sessions[0].anki_performance == []
+        assert [p.card_id for p in sessions[1].anki_performance] == ["c1"]
+
+    def test_progress_report_unit_breakdown(self, tracker):
+        """Test that unit stats are kept up to date as sessions are logged."""
+        tracker.log_session(make_session("obj_1", duration_actual=30, completed=True))
+        tracker.log_session(make_session("obj_2", duration_actual=20, completed=False))
+        tracker.log_session(make_session("obj_1", unit_id="unit_2", duration_actual=15, completed=True))
+
+        report = tracker.get_progress_report("bio_101", "alice")
+
+        assert report["unit_breakdown"] == {
+            "unit_1": {"completion_rate": 50.0, "total_time": 50, "objectives_covered": 2},
+            "unit_2": {"completion_rate": 100.0, "total_time": 15, "objectives_covered": 1},
+        }
+
+    def test_progress_report_cache_invalidated_by_new_session(self, tracker):
+        """Test that cached reports are reused until progress changes."""
+        tracker.log_session(make_session("obj_1", duration_actual=30, completed=True))
+        first = tracker.get_progress_report("bio_101", "alice")
+        assert (tracker.data_dir / ".report_cache" / "bio_101_alice_report.json").exists()
+        assert not (tracker.data_dir / "bio_101_alice_report.json").exists()
+        assert tracker.get_progress_report("bio_101", "alice") == first
+
+        tracker.log_session(make_session("obj_2", duration_actual=10, completed=True))
+        second = tracker.get_progress_report("bio_101", "alice")
+        assert second["overall_progress"]["total_sessions"] == 2
+        assert second["overall_progress"]["total_study_time"] == 40
+
+    def test_progress_report_without_data(self, tracker):
+        """Test that a missing progress file reports an error."""
+        assert tracker.get_progress_report("bio_101", "bob") == {"error": "No progress data found"}
+
+    def test_unit_stats_rebuilt_for_legacy_files(self, tracker):
+        """Test that legacy progress files without unit stats are backfilled on load."""
+        tracker.log_session(make_session("obj_1", duration_actual=30, completed=True))
+        progress_file = tracker.data_dir / "bio_101_alice_progress.json.gz"
+        data = json.loads(gzip.decompress(progress_file.read_bytes()))
+        del data["unit_stats"]
+        progress_file.unlink()
+        write_json(tracker.data_dir / "bio_101_alice_progress.json", data)
+
+        progress = tracker._load_progress("bio_101", "alice")
+        assert progress.unit_stats["unit_1"].total_time == 30
+        assert progress.unit_stats["unit_1"].objectives == {"obj_1"}
+
+    def test_study_streak_counts_consecutive_days(self, tracker):
+        """Test that the cached streak extends, holds and resets correctly."""
+        today = date.today()
+        for days_ago in (5, 2, 1, 1, 0):
+            actual = (today - timedelta(days=days_ago)).isoformat()
+            tracker.log_session(make_session("obj_1", completed=True, actual_date=actual))
+
+        progress = tracker._load_progress("bio_101", "alice")
+        assert progress.current_streak == 3
+        assert progress.last_completed_date == today.isoformat()
+        assert tracker.get_progress_report("bio_101", "alice")["overall_progress"]["current_streak"] == 3
+
+    def test_study_streak_replayed_for_legacy_files(self, tracker):
+        """Test that legacy progress files get their streak from dated sessions."""
+        today = date.today()
+        for days_ago in (1, 0):
+            actual = (today - timedelta(days=days_ago)).isoformat() + "T09:30:00"
+            tracker.log_session(make_session("obj_1", completed=True, actual_date=actual))
+        progress_file = tracker.data_dir / "bio_101_alice_progress.json.gz"
+        data = json.loads(gzip.decompress(progress_file.read_bytes()))
+        del data["current_streak"], data["last_completed_date"]
+        progress_file.unlink()
+        write_json(tracker.data_dir / "bio_101_alice_progress.json", data)
+
+        progress = tracker._load_progress("bio_101", "alice")
+        assert progress.current_streak == 2
+        assert progress.last_completed_date == today.isoformat()
+
+    def test_study_streak_expires_after_missed_day(self, tracker):
+        """Test that a streak ending before yesterday reports as zero."""
+        actual = (date.today() - timedelta(days=3)).isoformat()
+        tracker.log_session(make_session("obj_1", completed=True, actual_date=actual))
+
+        report = tracker.get_progress_report("bio_101", "alice")
+        assert report["overall_progress"]["current_streak"] == 0
+
+    def test_performance_report_topics(self, tracker):
+        """Test that lapse-based scores split objectives into weak and strong topics."""
+        tracker.log_session(make_session("obj_weak", notes="Genetics"))
+        tracker.log_session(make_session("obj_strong", notes="Cells"))
+        tracker.import_anki_reviews(
+            "bio_101",
+            "alice",
+            [
+                make_review("c1", "Genetics", lapses=1),
+                make_review("c2", "Genetics", lapses=3),
+                make_review("c3", "Cells", lapses=0),
+            ],
+        )
+
+        report = tracker.generate_performance_report("bio_101", "alice")
+
+        assert report.weak_topics == {"obj_weak": pytest.approx(0.375)}
+        assert report.strong_topics == {"obj_strong": 1.0}
+
+    def test_generate_study_schedule(self, tracker):
+        """Test that schedule objectives become planned study sessions."""
+        schedule = {
+            "syllabus_id": "bio_101",
+            "schedule": [
+                {
+                    "unit_id": "unit_1",
+                    "objectives": [
+                        {"objective_id": "obj_1", "start_date": "2024-01-15", "estimated_time": 90},
+                        {"objective_id": "obj_2", "start_date": "2024-01-19", "estimated_time": 60},
+                    ],
+                }
+            ],
+        }
+
+        sessions = tracker.generate_study_schedule(schedule, "alice")
+
+        assert [s.id for s in sessions] == ["alice_obj_1_2024-01-15", "alice_obj_2_2024-01-19"]
+        assert sessions[1].unit_id == "unit_1"
+        assert sessions[1].duration_planned == 60
@@ -0,0 +1,113 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from openeducation import serve
+from openeducation.utils.io import cards_summary_path, write_cards, write_json
+
+CARDS = [
+    {"id": "card_1", "front": "Q1", "back": "A1", "tags": ["syllabus", "biology"]},
+    {"id": "card_2", "front": "Q2", "back": "A2", "tags": ["biology", "cells"]},
+]
+
+
+@pytest.fixture
+def client():
+    return TestClient(serve.app)
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    write_json(tmp_path / "cards.json", CARDS)
+    return str(tmp_path)
+
+
+def test_deck_summary(client, run_dir):
+    r = client.get("/deck/summary", params={"run_dir": run_dir})
+    assert r.status_code == 200
+    assert r.json() == {"count": 2, "tags": ["biology", "cells", "syllabus"]}
+
+
+def test_deck_summary_refreshes_when_cards_change(client, run_dir):
+    assert client.get("/deck/summary", params={"run_dir": run_dir}).json()["count"] == 2
+
+    cards_path = os.path.join(run_dir, "cards.json")
+    write_json(cards_path, CARDS[:1])
+    st = os.stat(cards_path)
+    os.utime(cards_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert client.get("/deck/summary", params={"run_dir": run_dir}).json()["count"] == 1
+
+
+def test_deck_summary_served_from_write_through_file(client, tmp_path):
+    write_cards(tmp_path / "cards.json", CARDS)
+    assert (tmp_path / "cards_summary.json").exists()
+    # Mark the summary so we can tell it was served from disk, not recomputed
+    write_json(cards_summary_path(tmp_path / "cards.json"), {"count": 2, "tags": ["from-disk"]})
+
+    r = client.get("/deck/summary", params={"run_dir": str(tmp_path)})
+    assert r.json() == {"count": 2, "tags": ["from-disk"]}
+
+
+def test_deck_card(client, run_dir):
+    r = client.get("/deck/card/card_2", params={"run_dir": run_dir})
+    assert r.status_code == 200
+    assert r.json()["front"] == "Q2"
+
+    r = client.get("/deck/card/card_9", params={"run_dir": run_dir})
+    assert r.status_code == 404
+
+
+def test_missing_deck(client, tmp_path):
+    assert client.get("/deck/summary", params={"run_dir": str(tmp_path)}).status_code == 404
+    assert client.get("/deck/card/card_1", params={"run_dir": str(tmp_path)}).status_code == 404
+
+
+def test_deck_raw(client, run_dir):
+    r = client.get("/deck/raw", params={"run_dir": run_dir})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.json() == CARDS
+    assert r.headers["accept-ranges"] == "bytes"
+    assert int(r.headers["content-length"]) == os.path.getsize(os.path.join(run_dir, "cards.json"))
+
+
+def test_deck_raw_range(client, run_dir):
+    with open(os.path.join(run_dir, "cards.json"), "rb") as f:
+        body = f.read()
+    r = client.get("/deck/raw", params={"run_dir": run_dir}, headers={"Range": "bytes=10-19"})
+    assert r.status_code == 206
+    assert r.headers["content-range"] == f"bytes 10-19/{len(body)}"
+    assert r.content == body[10:20]
+
+
+def test_deck_raw_serves_gzip_copy(client, tmp_path):
+    write_cards(tmp_path / "cards.json", CARDS)
+    params = {"run_dir": str(tmp_path)}
+
+    r = client.get("/deck/raw", params=params, headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.json() == CARDS
+
+    r = client.get("/deck/raw", params=params, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in r.headers
+    assert r.json() == CARDS
+
+
+def test_static_etag_and_revalidation(client):
+    version = serve.static_files.version("styles.css")
+    r = client.get("/static/styles.css")
+    assert r.status_code == 200
+    assert r.headers["etag"] == f'"{version}"'
+    assert r.headers["cache-control"] == "no-cache"
+
+    r = client.get("/static/styles.css", headers={"If-None-Match": f'"{version}"'})
+    assert r.status_code == 304
+
+
+def test_static_versioned_url_is_immutable(client):
+    version = serve.static_files.version("main.js")
+    r = client.get("/static/main.js", params={"v": version})
+    assert "immutable" in r.headers["cache-control"]
+    assert f"main.js?v={version}" in client.get("/dashboard").text
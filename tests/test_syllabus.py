@@ -0,0 +1,80 @@
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+from openeducation.syllabus import generator
+from openeducation.syllabus.cli_integration import _load_syllabus, _write_syllabus_json
+from openeducation.syllabus.generator import SyllabusGenerator, _SubjectTemplate
+
+
+def test_syllabus_json_round_trip(tmp_path):
+    syllabus = SyllabusGenerator(use_llm=False).generate_syllabus(subject="science")
+    path = tmp_path / f"{syllabus.id}.json"
+    _write_syllabus_json(syllabus, path)
+
+    loaded = _load_syllabus(str(path))
+    assert loaded == syllabus
+    assert loaded.units and loaded.units[0].objectives
+
+
+def test_learning_schedule_dates():
+    generator = SyllabusGenerator(use_llm=False)
+    syllabus = generator.generate_syllabus(subject="science")
+    syllabus.units = syllabus.units[:2]
+    syllabus.units[0].objectives = syllabus.units[0].objectives * 2
+
+    schedule = generator.create_learning_schedule(syllabus, "2024-12-28")
+
+    first, second = schedule["schedule"]
+    assert [o["start_date"] for o in first["objectives"]] == ["2024-12-28", "2025-01-01"]
+    assert first["objectives"][1]["estimated_completion"] == "2025-01-04"
+    assert first["end_date"] == "2025-01-05"
+    assert second["start_date"] == "2025-01-06"
+    assert schedule["end_date"] == "2025-01-11"
+
+
+class CountingLLM:
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    def get_response(self, prompt: str) -> str:
+        self.calls += 1
+        return self.response
+
+
+def test_llm_syllabus_reused_for_repeated_requests():
+    generator = SyllabusGenerator(use_llm=False)
+    generator.llm = CountingLLM(json.dumps({"title": "Adaptive Science", "units": []}))
+
+    first = generator.generate_syllabus(subject="science")
+    first.standards.append("edited")
+    second = generator.generate_syllabus(subject="science")
+
+    assert generator.llm.calls == 1
+    assert second.title == "Adaptive Science"
+    assert "edited" not in second.standards
+    generator.generate_syllabus(subject="science", duration_weeks=12)
+    assert generator.llm.calls == 2
+
+
+def test_subject_aliases():
+    generator = SyllabusGenerator(use_llm=False)
+    assert generator.generate_syllabus(subject="math").subject == "mathematics"
+    with pytest.raises(ValueError):
+        generator.generate_syllabus(subject="astrology")
+
+
+def test_template_grading_policy_must_total_100():
+    with pytest.raises(ValueError):
+        _SubjectTemplate._from_json({"title": "Broken", "grading_policy": {"tests": 60, "projects": 30}})
+
+
+def test_generated_templates_match_json():
+    templates = Path(generator.__file__).parent / "templates"
+    for subject in generator._SUBJECTS:
+        compiled = importlib.import_module(f"openeducation.syllabus._generated_templates.{subject}")
+        source = json.loads((templates / f"{subject}.json").read_text(encoding="utf-8"))
+        assert compiled.TEMPLATE == source, f"re-run scripts/gen_templates.py for {subject}"
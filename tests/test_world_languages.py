@@ -3,6 +3,7 @@ Tests for World Languages instruction module.
 """
 
 
+import orjson
 import pytest
 
 from openeducation.world_languages.language_core import (
@@ -18,14 +19,15 @@ from openeducation.world_languages.language_core import (
 )
 
 
+@pytest.fixture(scope="module")
+def manager(tmp_path_factory):
+    """Create one world languages manager, with a temporary directory, shared by the module's tests."""
+    return WorldLanguagesManager(str(tmp_path_factory.mktemp("world_languages_data")))
+
+
 class TestWorldLanguagesManager:
     """Test World Languages Manager functionality."""
 
-    @pytest.fixture
-    def manager(self, tmp_path):
-        """Create world languages manager with temporary directory."""
-        return WorldLanguagesManager(str(tmp_path / "world_languages_data"))
-
     def test_get_curriculum(self, manager):
         """Test getting curriculum for specific language and level."""
         curriculum = manager.get_curriculum("Japanese", "middle_school")
@@ -36,6 +38,15 @@ class TestWorldLanguagesManager:
         assert curriculum.proficiency_target == ProficiencyLevel.NOVICE_HIGH
         assert len(curriculum.units) > 0
 
+    def test_get_curriculum_json(self, manager):
+        """Test that curriculum JSON is serialized once and reused."""
+        blob = manager.get_curriculum_json("French", "high_school")
+
+        assert orjson.loads(blob)["language"] == "French"
+        assert manager.get_curriculum_json(Language.FRENCH, "high_school") is blob
+        with pytest.raises(KeyError):
+            manager.get_curriculum_json("Klingon", "high_school")
+
     def test_get_all_curricula(self, manager):
         """Test getting all curricula."""
         curricula = manager.get_all_curricula()
@@ -120,6 +131,50 @@ class TestWorldLanguagesManager:
         assert len(assessment.strengths) == 2
         assert len(assessment.areas_for_growth) == 2
 
+    def test_average_scores(self, manager):
+        """Test averaging numeric scores across assessments."""
+        assessments = [
+            manager.assess_student_progress(
+                student_id=student_id,
+                language=Language.FRENCH,
+                proficiency_level=ProficiencyLevel.NOVICE_HIGH,
+                assessment_type="formative",
+                scores=scores,
+                strengths=[],
+                areas_for_growth=[],
+                recommendations=[]
+            )
+            for student_id, scores in (
+                ("student_001", {"vocabulary": 3.0, "grammar": 2.0, "comments": "good effort"}),
+                ("student_002", {"vocabulary": 4.0}),
+            )
+        ]
+
+        averages = manager.average_scores(assessments)
+
+        assert averages == pytest.approx({"vocabulary": 3.5, "grammar": 2.0})
+        assert manager.average_scores([]) == {}
+
+    def test_batch_defers_writes(self, manager):
+        """Test that records saved in a batch are written when it exits."""
+        with manager.batch():
+            for _ in range(2):
+                manager.assess_student_progress(
+                    student_id="student_001",
+                    language=Language.SPANISH,
+                    proficiency_level=ProficiencyLevel.NOVICE_MID,
+                    assessment_type="formative",
+                    scores={"vocabulary": 3.0},
+                    strengths=["Vocabulary"],
+                    areas_for_growth=[],
+                    recommendations=[]
+                )
+            assert not manager._progress_path("progress_student_001_Spanish").exists()
+
+        progress = manager._load_student_progress("progress_student_001_Spanish")
+        assert len(progress.assessments) == 2
+        assert progress.achievements == ["Vocabulary"]
+
     def test_load_lesson_plan_from_data(self, manager):
         """Test loading lesson plan from data."""
         data = {
@@ -193,6 +248,12 @@ class TestLanguageDataModels:
         assert ProficiencyLevel.INTERMEDIATE_HIGH.value == "Intermediate High"
         assert ProficiencyLevel.ADVANCED_LOW.value == "Advanced Low"
 
+    def test_proficiency_level_ordering(self):
+        """Test proficiency levels compare by position on the ACTFL scale."""
+        assert ProficiencyLevel.NOVICE_HIGH < ProficiencyLevel.INTERMEDIATE_LOW
+        assert ProficiencyLevel.SUPERIOR >= ProficiencyLevel.ADVANCED_HIGH
+        assert max(ProficiencyLevel.ADVANCED_MID, ProficiencyLevel.NOVICE_LOW) == ProficiencyLevel.ADVANCED_MID
+
     def test_actfl_mode_enum(self):
         """Test ACTFL mode enum."""
         assert ACTFLMode.INTERPERSONAL.value == "Interpersonal"
@@ -346,11 +407,6 @@ class TestWorldLanguagesIntegration:
 class TestCurriculumContent:
     """Test curriculum content and structure."""
 
-    @pytest.fixture
-    def manager(self):
-        """Create world languages manager."""
-        return WorldLanguagesManager()
-
     def test_japanese_curricula_structure(self, manager):
         """Test Japanese curricula structure."""
         ms_curriculum = manager.get_curriculum("Japanese", "middle_school")
@@ -359,16 +415,16 @@ class TestCurriculumContent:
         # Middle school
         assert ms_curriculum.proficiency_target == ProficiencyLevel.NOVICE_HIGH
         assert len(ms_curriculum.units) == 3
-        assert "Greetings" in ms_curriculum.units[0]["title"]
-        assert "Family" in ms_curriculum.units[1]["title"]
-        assert "School" in ms_curriculum.units[2]["title"]
+        assert "Greetings" in ms_curriculum.units[0].title
+        assert "Family" in ms_curriculum.units[1].title
+        assert "School" in ms_curriculum.units[2].title
 
         # High school
         assert hs_curriculum.proficiency_target == ProficiencyLevel.INTERMEDIATE_HIGH
         assert len(hs_curriculum.units) == 3
-        assert "Society" in hs_curriculum.units[0]["title"]
-        assert "Literature" in hs_curriculum.units[1]["title"]
-        assert "Professions" in hs_curriculum.units[2]["title"]
+        assert "Society" in hs_curriculum.units[0].title
+        assert "Literature" in hs_curriculum.units[1].title
+        assert "Professions" in hs_curriculum.units[2].title
 
     def test_mandarin_curricula_structure(self, manager):
         """Test Mandarin curricula structure."""
@@ -378,13 +434,13 @@ class TestCurriculumContent:
         # Middle school
         assert ms_curriculum.proficiency_target == ProficiencyLevel.NOVICE_HIGH
         assert len(ms_curriculum.units) == 2
-        assert "Characters" in ms_curriculum.units[0]["title"]
-        assert "Family" in ms_curriculum.units[1]["title"]
+        assert "Characters" in ms_curriculum.units[0].title
+        assert "Family" in ms_curriculum.units[1].title
 
         # High school
         assert hs_curriculum.proficiency_target == ProficiencyLevel.INTERMEDIATE_HIGH
         assert len(hs_curriculum.units) == 1
-        assert "Media" in hs_curriculum.units[0]["title"]
+        assert "Media" in hs_curriculum.units[0].title
 
     def test_french_curricula_structure(self, manager):
         """Test French curricula structure."""
@@ -394,13 +450,13 @@ class TestCurriculumContent:
         # Middle school
         assert ms_curriculum.proficiency_target == ProficiencyLevel.NOVICE_HIGH
         assert len(ms_curriculum.units) == 2
-        assert "Bonjour" in ms_curriculum.units[0]["title"]
-        assert "Famille" in ms_curriculum.units[1]["title"]
+        assert "Bonjour" in ms_curriculum.units[0].title
+        assert "Famille" in ms_curriculum.units[1].title
 
         # High school
         assert hs_curriculum.proficiency_target == ProficiencyLevel.INTERMEDIATE_HIGH
         assert len(hs_curriculum.units) == 1
-        assert "Literature" in hs_curriculum.units[0]["title"]
+        assert "Literature" in hs_curriculum.units[0].title
 
     def test_spanish_curricula_structure(self, manager):
         """Test Spanish curricula structure."""
@@ -410,13 +466,13 @@ class TestCurriculumContent:
         # Middle school
         assert ms_curriculum.proficiency_target == ProficiencyLevel.NOVICE_HIGH
         assert len(ms_curriculum.units) == 2
-        assert "Hola" in ms_curriculum.units[0]["title"]
-        assert "Familia" in ms_curriculum.units[1]["title"]
+        assert "Hola" in ms_curriculum.units[0].title
+        assert "Familia" in ms_curriculum.units[1].title
 
         # High school
         assert hs_curriculum.proficiency_target == ProficiencyLevel.INTERMEDIATE_HIGH
         assert len(hs_curriculum.units) == 1
-        assert "Literature" in hs_curriculum.units[0]["title"]
+        assert "Literature" in hs_curriculum.units[0].title
 
     def test_korean_curricula_structure(self, manager):
         """Test Korean curricula structure."""
@@ -426,12 +482,12 @@ class TestCurriculumContent:
         # Middle school
         assert ms_curriculum.proficiency_target == ProficiencyLevel.NOVICE_HIGH
         assert len(ms_curriculum.units) == 1
-        assert "Hangul" in ms_curriculum.units[0]["title"]
+        assert "Hangul" in ms_curriculum.units[0].title
 
         # High school
         assert hs_curriculum.proficiency_target == ProficiencyLevel.INTERMEDIATE_HIGH
         assert len(hs_curriculum.units) == 1
-        assert "Society" in hs_curriculum.units[0]["title"]
+        assert "Society" in hs_curriculum.units[0].title
 
     def test_curriculum_metadata(self, manager):
         """Test curriculum metadata and standards."""
@@ -49,381 +49,528 @@ Requirements:
 
 import os
 import json
+import shlex
+import sys
 import time
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import click
+import typer.main
+
+from openeducation.cli import app as cli_app
+
+# Calling the Typer app rebuilds the whole Click command tree each time; build it once
+_CLI = typer.main.get_command(cli_app)
+
+_HRULE = "=" * 85
+_SUBRULE = "-" * 65
 
 def print_header(title: str):
     """Print a formatted header."""
-    print(f"\n{'='*85}")
-    print(f"🌟 {title}")
-    print(f"{'='*85}")
+    sys.stdout.write(f"\n{_HRULE}\n🌟 {title}\n{_HRULE}\n")
 
 def print_section(title: str):
     """Print a formatted section header."""
-    print(f"\n🔹 {title}")
-    print("-" * 65)
+    sys.stdout.write(f"\n🔹 {title}\n{_SUBRULE}\n")
+
+def _emit(lines):
+    """Print a block of lines with a single write."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def run_command(cmd: str, description: str = "") -> bool:
-    """Run a shell command and return success status."""
+def run_command(args: List[str], description: str = "") -> bool:
+    """Run an openeducation CLI command in this process and return success status."""
     if description:
         print(f"📌 {description}")
 
-    print(f"💻 Running: {cmd}")
-    result = os.system(cmd)
-
-    if result == 0:
+    print(f"💻 Running: openeducation {shlex.join(args)}")
+    try:
+        result = _CLI.main(args, prog_name="openeducation", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        result = e.exit_code
+    except SystemExit as e:
+        result = e.code
+
+    if not result:
         print("✅ Command completed successfully")
         return True
     else:
         print("❌ Command failed")
         return False
 
-def check_environment():
+# Read once at import; the demo assumes the environment does not change mid-run
+_HAS_OPENAI = bool(os.environ.get("OPENAI_API_KEY"))
+
+# Written once the data directories exist, so later runs from the same cwd skip setup
+_ENV_SENTINEL = "data/.oe_env_ready"
+
+def check_environment(force_setup: bool = False):
     """Check the environment and prerequisites."""
     print_header("Environment Setup")
 
-    directories = [
-        "data/world_languages", "data/eld", "data/observations", "data/coaching",
-        "data/syllabi", "data/decks", "data/progress"
-    ]
-
-    for dir_path in directories:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
-        print(f"   ✅ Created: {dir_path}")
+    if not force_setup and os.path.exists(_ENV_SENTINEL):
+        print(f"   ✅ Data directories already set up ({_ENV_SENTINEL})")
+    else:
+        directories = [
+            "data/world_languages", "data/eld", "data/observations", "data/coaching",
+            "data/syllabi", "data/decks", "data/progress"
+        ]
+
+        for dir_path in directories:
+            # One stat for directories left by an earlier run, instead of a failing mkdir plus a stat
+            if not os.path.isdir(dir_path):
+                os.makedirs(dir_path, exist_ok=True)
+            print(f"   ✅ Created: {dir_path}")
+        open(_ENV_SENTINEL, "a").close()
 
     print("\n🔍 Checking API keys...")
-    if os.getenv("OPENAI_API_KEY"):
+    if _HAS_OPENAI:
         print("   ✅ OpenAI API key found (enhanced features available)")
     else:
         print("   ⚠️  OpenAI API key not set (basic features only)")
 
     return True
 
+_PROFESSOR_EXPERTISE = (
+    ("🎓 Ph.D. Japanese Language & Culture Expertise", (
+        "   • Applied Linguistics & Second Language Acquisition",
+        "   • Translation/Interpretation Specialization",
+        "   • Cultural Studies & Communication Patterns",
+        "   • Native/Near-Native Proficiency Skills",
+        "   • Digital Technologies & Social Media Integration",
+        "   • Curriculum Innovation & Program Development",
+        "   • Student Mentoring for Diverse Backgrounds",
+        "   • Extracurricular Cultural Events Organization",
+    )),
+    ("🎓 Ph.D. Mandarin Chinese Language & Culture Expertise", (
+        "   • Communicative-Oriented Instruction Methods",
+        "   • Standards-Based Language Assessment",
+        "   • Technology Integration for Language Learning",
+        "   • Cultural Competency Development",
+        "   • Professional Language Applications",
+        "   • Character Recognition & Pinyin Mastery",
+        "   • Contemporary Chinese Media & Society",
+    )),
+    ("🎓 Ph.D. Korean Language & Culture Expertise", (
+        "   • Proficiency-Oriented Assessment Frameworks",
+        "   • Hangul & Korean Script Mastery",
+        "   • K-Culture & Korean Wave Integration",
+        "   • Technology Innovation in Language Teaching",
+        "   • Student Support for Diverse Backgrounds",
+        "   • Professional Development & Career Preparation",
+        "   • Korean Business Culture & Etiquette",
+    )),
+    ("🎓 Ph.D. French Language & Literature Expertise", (
+        "   • Literature & Social Issues Integration",
+        "   • Francophone Cultural Perspectives",
+        "   • Global Citizenship Development",
+        "   • Professional Communication Skills",
+        "   • Standards-Based Curriculum Alignment",
+        "   • Student Engagement Beyond Classroom",
+        "   • Contemporary French Society Analysis",
+    )),
+    ("🎓 Ph.D. Spanish Language & Culture Expertise", (
+        "   • Social Justice & Literature Focus",
+        "   • Latin American Cultural Perspectives",
+        "   • Community Engagement & Service Learning",
+        "   • Bilingualism & Cultural Identity",
+        "   • Professional Development & Internships",
+        "   • Multicultural Perspectives Integration",
+    )),
+)
+
 def demo_professor_expertise():
     """Demonstrate professor-level expertise integration."""
     print_header("Professor-Level Expertise Integration")
-
-    print_section("🎓 Ph.D. Japanese Language & Culture Expertise")
-    print("   • Applied Linguistics & Second Language Acquisition")
-    print("   • Translation/Interpretation Specialization")
-    print("   • Cultural Studies & Communication Patterns")
-    print("   • Native/Near-Native Proficiency Skills")
-    print("   • Digital Technologies & Social Media Integration")
-    print("   • Curriculum Innovation & Program Development")
-    print("   • Student Mentoring for Diverse Backgrounds")
-    print("   • Extracurricular Cultural Events Organization")
-
-    print_section("🎓 Ph.D. Mandarin Chinese Language & Culture Expertise")
-    print("   • Communicative-Oriented Instruction Methods")
-    print("   • Standards-Based Language Assessment")
-    print("   • Technology Integration for Language Learning")
-    print("   • Cultural Competency Development")
-    print("   • Professional Language Applications")
-    print("   • Character Recognition & Pinyin Mastery")
-    print("   • Contemporary Chinese Media & Society")
-
-    print_section("🎓 Ph.D. Korean Language & Culture Expertise")
-    print("   • Proficiency-Oriented Assessment Frameworks")
-    print("   • Hangul & Korean Script Mastery")
-    print("   • K-Culture & Korean Wave Integration")
-    print("   • Technology Innovation in Language Teaching")
-    print("   • Student Support for Diverse Backgrounds")
-    print("   • Professional Development & Career Preparation")
-    print("   • Korean Business Culture & Etiquette")
-
-    print_section("🎓 Ph.D. French Language & Literature Expertise")
-    print("   • Literature & Social Issues Integration")
-    print("   • Francophone Cultural Perspectives")
-    print("   • Global Citizenship Development")
-    print("   • Professional Communication Skills")
-    print("   • Standards-Based Curriculum Alignment")
-    print("   • Student Engagement Beyond Classroom")
-    print("   • Contemporary French Society Analysis")
-
-    print_section("🎓 Ph.D. Spanish Language & Culture Expertise")
-    print("   • Social Justice & Literature Focus")
-    print("   • Latin American Cultural Perspectives")
-    print("   • Community Engagement & Service Learning")
-    print("   • Bilingualism & Cultural Identity")
-    print("   • Professional Development & Internships")
-    print("   • Multicultural Perspectives Integration")
+    for title, section_lines in _PROFESSOR_EXPERTISE:
+        print_section(title)
+        _emit(section_lines)
 
 def demo_actfl_standards():
     """Demonstrate ACTFL standards and proficiency frameworks."""
     print_header("ACTFL Standards & Proficiency Frameworks")
 
     print_section("🎯 ACTFL Proficiency Levels")
-    run_command("python3 -m openeducation.cli languages show-proficiency-levels", "Showing complete ACTFL proficiency levels")
+    run_command(["languages", "show-proficiency-levels"], "Showing complete ACTFL proficiency levels")
 
     print_section("💬 ACTFL Modes of Communication")
-    run_command("python3 -m openeducation.cli languages show-actfl-modes", "Showing ACTFL communication modes")
+    run_command(["languages", "show-actfl-modes"], "Showing ACTFL communication modes")
 
     print_section("📚 Content Areas Integration")
-    run_command("python3 -m openeducation.cli languages show-content-areas", "Showing world language content areas")
+    run_command(["languages", "show-content-areas"], "Showing world language content areas")
 
 def demo_curricula_overview():
     """Demonstrate comprehensive language curricula."""
     print_header("Comprehensive Language Curricula")
 
     print_section("🌍 Available Curricula")
-    run_command("python3 -m openeducation.cli languages show-curricula", "Showing all available language curricula")
+    run_command(["languages", "show-curricula"], "Showing all available language curricula")
 
     print_section("📚 Japanese Middle School Curriculum")
-    run_command("python3 -m openeducation.cli languages get-curriculum --language Japanese --level middle_school", "Showing detailed Japanese middle school curriculum")
+    run_command(["languages", "get-curriculum", "--language", "Japanese", "--level", "middle_school"], "Showing detailed Japanese middle school curriculum")
 
     print_section("📚 Japanese High School Curriculum")
-    run_command("python3 -m openeducation.cli languages get-curriculum --language Japanese --level high_school", "Showing detailed Japanese high school curriculum")
+    run_command(["languages", "get-curriculum", "--language", "Japanese", "--level", "high_school"], "Showing detailed Japanese high school curriculum")
 
     print_section("📚 Mandarin Middle School Curriculum")
-    run_command("python3 -m openeducation.cli languages get-curriculum --language Mandarin --level middle_school", "Showing Mandarin middle school curriculum")
+    run_command(["languages", "get-curriculum", "--language", "Mandarin", "--level", "middle_school"], "Showing Mandarin middle school curriculum")
 
     print_section("📚 French High School Curriculum")
-    run_command("python3 -m openeducation.cli languages get-curriculum --language French --level high_school", "Showing French high school curriculum")
+    run_command(["languages", "get-curriculum", "--language", "French", "--level", "high_school"], "Showing French high school curriculum")
+
+_LESSON_FIXTURES: Dict[str, Dict[str, Any]] = {
+    "jp_greetings": {
+        "goals": {
+            "Interpersonal": ["Practice self-introductions with appropriate bowing"],
+            "Presentational": ["Create digital name cards"],
+            "Interpretive": ["Understand Japanese social hierarchy concepts"],
+        },
+        "functions": "Introduce oneself, Ask questions about others, Express cultural awareness",
+        "vocabulary": "konnichiwa, hajimemashite, yoroshiku onegaishimasu, otousan, okaasan",
+        "culture": "Japanese bowing etiquette, social hierarchy, family honorifics",
+        "tech": "Flipgrid for video introductions, Google Translate for cultural context",
+    },
+    "md_characters": {
+        "goals": {
+            "Interpersonal": ["Practice character pronunciation"],
+            "Presentational": ["Create character posters"],
+            "Interpretive": ["Understand Chinese writing system"],
+        },
+        "functions": "Pronounce Pinyin correctly, Write characters, Explain cultural significance",
+        "vocabulary": "nǐ hǎo, xiè xiè, zài jiàn, jiā, xué xiào",
+        "culture": "Chinese character origins, cultural significance of writing",
+        "tech": "Character recognition apps, digital calligraphy tools",
+    },
+    "kr_innovation": {
+        "goals": {
+            "Interpersonal": ["Discuss Korean innovation"],
+            "Presentational": ["Present K-tech analysis"],
+            "Interpretive": ["Analyze Korean business culture"],
+        },
+        "functions": "Express opinions about technology, Compare cultures, Present research findings",
+        "vocabulary": "giyeok, saneop, munhwa, gyoyuk, keorieo",
+        "culture": "Korean business etiquette, technology culture, education system",
+        "tech": "Video conferencing tools, Korean news sources, digital presentation software",
+    },
+    "es_literature": {
+        "goals": {
+            "Interpersonal": ["Discuss social justice themes"],
+            "Presentational": ["Present literary analysis"],
+            "Interpretive": ["Analyze Latin American literature"],
+        },
+        "functions": "Express opinions about social issues, Analyze literary texts, Present research findings",
+        "vocabulary": "la justicia social, la igualdad, los derechos humanos, la cultura, la literatura",
+        "culture": "Latin American social issues, magical realism, cultural perspectives",
+        "tech": "Digital literature databases, video analysis tools, presentation software",
+    },
+}
+
+# CLI argument strings for each lesson, serialized once at import
+_LESSON_JSON = {
+    lesson_id: {key: json.dumps(value) if isinstance(value, dict) else value for key, value in fixture.items()}
+    for lesson_id, fixture in _LESSON_FIXTURES.items()
+}
 
 def demo_lesson_planning():
     """Demonstrate standards-based lesson planning."""
     print_header("Standards-Based Lesson Planning")
 
     print_section("Creating Japanese Cultural Lesson")
-    goals = '{"Interpersonal": ["Practice self-introductions with appropriate bowing"], "Presentational": ["Create digital name cards"], "Interpretive": ["Understand Japanese social hierarchy concepts"]}'
-    functions = "Introduce oneself, Ask questions about others, Express cultural awareness"
-    vocabulary = "konnichiwa, hajimemashite, yoroshiku onegaishimasu, otousan, okaasan"
-    culture = "Japanese bowing etiquette, social hierarchy, family honorifics"
-    tech = "Flipgrid for video introductions, Google Translate for cultural context"
-    run_command(f"python3 -m openeducation.cli languages create-lesson-plan --curriculum-id jp_ms_curriculum --title 'Japanese Greetings and Family' --grade-level 'Middle School' --duration-minutes 45 --objective 'Students will introduce themselves and family using appropriate Japanese etiquette' --communicative-goals '{goals}' --language-functions '{functions}' --vocabulary-focus '{vocabulary}' --cultural-elements '{culture}' --technology-tools '{tech}'", "Creating comprehensive Japanese lesson plan")
+    run_command(["languages", "create-lesson-plan", "--curriculum-id", "jp_ms_curriculum", "--title", "Japanese Greetings and Family", "--grade-level", "Middle School", "--duration-minutes", "45", "--objective", "Students will introduce themselves and family using appropriate Japanese etiquette", "--communicative-goals", _LESSON_JSON["jp_greetings"]["goals"], "--language-functions", _LESSON_JSON["jp_greetings"]["functions"], "--vocabulary-focus", _LESSON_JSON["jp_greetings"]["vocabulary"], "--cultural-elements", _LESSON_JSON["jp_greetings"]["culture"], "--technology-tools", _LESSON_JSON["jp_greetings"]["tech"]], "Creating comprehensive Japanese lesson plan")
 
     print_section("Creating Mandarin Character Lesson")
-    goals = '{"Interpersonal": ["Practice character pronunciation"], "Presentational": ["Create character posters"], "Interpretive": ["Understand Chinese writing system"]}'
-    functions = "Pronounce Pinyin correctly, Write characters, Explain cultural significance"
-    vocabulary = "nǐ hǎo, xiè xiè, zài jiàn, jiā, xué xiào"
-    culture = "Chinese character origins, cultural significance of writing"
-    tech = "Character recognition apps, digital calligraphy tools"
-    run_command(f"python3 -m openeducation.cli languages create-lesson-plan --curriculum-id md_ms_curriculum --title 'Chinese Characters and Cultural Writing' --grade-level 'Middle School' --duration-minutes 50 --objective 'Students will understand Chinese character formation and cultural significance' --communicative-goals '{goals}' --language-functions '{functions}' --vocabulary-focus '{vocabulary}' --cultural-elements '{culture}' --technology-tools '{tech}'", "Creating Mandarin character lesson plan")
+    run_command(["languages", "create-lesson-plan", "--curriculum-id", "md_ms_curriculum", "--title", "Chinese Characters and Cultural Writing", "--grade-level", "Middle School", "--duration-minutes", "50", "--objective", "Students will understand Chinese character formation and cultural significance", "--communicative-goals", _LESSON_JSON["md_characters"]["goals"], "--language-functions", _LESSON_JSON["md_characters"]["functions"], "--vocabulary-focus", _LESSON_JSON["md_characters"]["vocabulary"], "--cultural-elements", _LESSON_JSON["md_characters"]["culture"], "--technology-tools", _LESSON_JSON["md_characters"]["tech"]], "Creating Mandarin character lesson plan")
+
+# (section, language, title, description, activity type, grade levels, objectives, hours, step)
+_CULTURAL_ACTIVITIES = (
+    (
+        "Creating Japanese Cultural Event",
+        "Japanese",
+        "Traditional Japanese Tea Ceremony",
+        "Students participate in a traditional Japanese tea ceremony with cultural explanation and practice",
+        "cultural_event",
+        "Middle School,High School",
+        "Experience Japanese tea ceremony, Understand cultural significance of ceremony, Practice respectful behavior, Connect with Japanese cultural values",
+        "2",
+        "Creating Japanese tea ceremony activity",
+    ),
+    (
+        "Creating Korean K-Pop Presentation Activity",
+        "Korean",
+        "K-Pop Culture and Globalization",
+        "Students analyze K-pop music videos and present findings on Korean youth culture",
+        "presentation",
+        "High School",
+        "Analyze Korean music videos, Understand Korean youth culture, Create cultural presentations, Explore Korean Wave globalization",
+        "3",
+        "Creating K-pop presentation activity",
+    ),
+    (
+        "Creating French Film Festival",
+        "French",
+        "Contemporary French Cinema Festival",
+        "Students watch and analyze contemporary French films addressing social issues",
+        "cultural_event",
+        "High School",
+        "Analyze contemporary French films, Discuss social issues in French society, Improve listening comprehension, Explore French cultural perspectives",
+        "4",
+        "Creating French film festival activity",
+    ),
+    (
+        "Creating Spanish Community Service Project",
+        "Spanish",
+        "Community Service and Social Justice",
+        "Students participate in community service projects with Spanish-speaking populations",
+        "internship",
+        "High School",
+        "Engage with local Spanish-speaking community, Apply Spanish language skills in real context, Understand social justice issues, Develop cultural awareness",
+        "6",
+        "Creating Spanish community service activity",
+    ),
+)
+
+# (section, student id, language, proficiency level, assessment type, scores JSON,
+#  strengths, areas for growth, recommendations, step)
+_ASSESSMENTS = (
+    (
+        "Japanese Student Progress Assessment",
+        "student_jp_001",
+        "Japanese",
+        "Intermediate Low",
+        "progress",
+        json.dumps({"vocabulary": 3.5, "grammar": 2.8, "culture": 4.0, "pronunciation": 3.2}),
+        "Excellent cultural understanding, Good pronunciation, Strong motivation",
+        "Grammar accuracy, Complex sentence structures, Reading comprehension",
+        "Increase grammar practice activities, Provide more reading materials, Continue cultural activities",
+        "Conducting Japanese student assessment",
+    ),
+    (
+        "Mandarin Student Assessment",
+        "student_md_001",
+        "Mandarin",
+        "Novice High",
+        "formative",
+        json.dumps({"vocabulary": 2.8, "grammar": 3.2, "culture": 3.5, "pronunciation": 2.5}),
+        "Strong character recognition, Good cultural awareness, Motivated learner",
+        "Tone pronunciation, Sentence formation, Listening comprehension",
+        "Focus on tone practice, Increase speaking activities, Use more audio materials",
+        "Conducting Mandarin student assessment",
+    ),
+    (
+        "French Student Assessment",
+        "student_fr_001",
+        "French",
+        "Intermediate High",
+        "summative",
+        json.dumps({"vocabulary": 4.2, "grammar": 3.8, "culture": 4.5, "pronunciation": 3.9}),
+        "Excellent cultural knowledge, Strong vocabulary, Good pronunciation",
+        "Complex grammar structures, Academic writing, Formal register",
+        "Advanced literature analysis, Professional communication practice, Study abroad preparation",
+        "Conducting French student assessment",
+    ),
+)
 
 def demo_cultural_activities():
     """Demonstrate cultural enrichment activities."""
     print_header("Cultural Enrichment Activities")
 
-    print_section("Creating Japanese Cultural Event")
-    objectives = "Experience Japanese tea ceremony, Understand cultural significance of ceremony, Practice respectful behavior, Connect with Japanese cultural values"
-    run_command(f"python3 -m openeducation.cli languages create-cultural-activity --language Japanese --title 'Traditional Japanese Tea Ceremony' --description 'Students participate in a traditional Japanese tea ceremony with cultural explanation and practice' --activity-type cultural_event --grade-levels 'Middle School,High School' --objectives '{objectives}' --duration-hours 2", "Creating Japanese tea ceremony activity")
-
-    print_section("Creating Korean K-Pop Presentation Activity")
-    objectives = "Analyze Korean music videos, Understand Korean youth culture, Create cultural presentations, Explore Korean Wave globalization"
-    run_command(f"python3 -m openeducation.cli languages create-cultural-activity --language Korean --title 'K-Pop Culture and Globalization' --description 'Students analyze K-pop music videos and present findings on Korean youth culture' --activity-type presentation --grade-levels 'High School' --objectives '{objectives}' --duration-hours 3", "Creating K-pop presentation activity")
-
-    print_section("Creating French Film Festival")
-    objectives = "Analyze contemporary French films, Discuss social issues in French society, Improve listening comprehension, Explore French cultural perspectives"
-    run_command(f"python3 -m openeducation.cli languages create-cultural-activity --language French --title 'Contemporary French Cinema Festival' --description 'Students watch and analyze contemporary French films addressing social issues' --activity-type cultural_event --grade-levels 'High School' --objectives '{objectives}' --duration-hours 4", "Creating French film festival activity")
-
-    print_section("Creating Spanish Community Service Project")
-    objectives = "Engage with local Spanish-speaking community, Apply Spanish language skills in real context, Understand social justice issues, Develop cultural awareness"
-    run_command(f"python3 -m openeducation.cli languages create-cultural-activity --language Spanish --title 'Community Service and Social Justice' --description 'Students participate in community service projects with Spanish-speaking populations' --activity-type internship --grade-levels 'High School' --objectives '{objectives}' --duration-hours 6", "Creating Spanish community service activity")
+    for section, language, title, description, activity_type, grade_levels, objectives, hours, step in _CULTURAL_ACTIVITIES:
+        print_section(section)
+        run_command(["languages", "create-cultural-activity", "--language", language, "--title", title, "--description", description, "--activity-type", activity_type, "--grade-levels", grade_levels, "--objectives", objectives, "--duration-hours", hours], step)
 
     print_section("Listing All Cultural Activities")
-    run_command("python3 -m openeducation.cli languages list-cultural-activities", "Showing all cultural activities")
+    run_command(["languages", "list-cultural-activities"], "Showing all cultural activities")
 
 def demo_student_assessment():
     """Demonstrate comprehensive student assessment."""
     print_header("Comprehensive Student Assessment")
 
-    print_section("Japanese Student Progress Assessment")
-    scores = '{"vocabulary": 3.5, "grammar": 2.8, "culture": 4.0, "pronunciation": 3.2}'
-    strengths = "Excellent cultural understanding, Good pronunciation, Strong motivation"
-    growth = "Grammar accuracy, Complex sentence structures, Reading comprehension"
-    recommendations = "Increase grammar practice activities, Provide more reading materials, Continue cultural activities"
-    run_command(f"python3 -m openeducation.cli languages assess-student --student-id student_jp_001 --language Japanese --proficiency-level Intermediate_Low --assessment-type progress --scores '{scores}' --strengths '{strengths}' --areas-for-growth '{growth}' --recommendations '{recommendations}'", "Conducting Japanese student assessment")
-
-    print_section("Mandarin Student Assessment")
-    scores = '{"vocabulary": 2.8, "grammar": 3.2, "culture": 3.5, "pronunciation": 2.5}'
-    strengths = "Strong character recognition, Good cultural awareness, Motivated learner"
-    growth = "Tone pronunciation, Sentence formation, Listening comprehension"
-    recommendations = "Focus on tone practice, Increase speaking activities, Use more audio materials"
-    run_command(f"python3 -m openeducation.cli languages assess-student --student-id student_md_001 --language Mandarin --proficiency-level Novice_High --assessment-type formative --scores '{scores}' --strengths '{strengths}' --areas-for-growth '{growth}' --recommendations '{recommendations}'", "Conducting Mandarin student assessment")
-
-    print_section("French Student Assessment")
-    scores = '{"vocabulary": 4.2, "grammar": 3.8, "culture": 4.5, "pronunciation": 3.9}'
-    strengths = "Excellent cultural knowledge, Strong vocabulary, Good pronunciation"
-    growth = "Complex grammar structures, Academic writing, Formal register"
-    recommendations = "Advanced literature analysis, Professional communication practice, Study abroad preparation"
-    run_command(f"python3 -m openeducation.cli languages assess-student --student-id student_fr_001 --language French --proficiency-level Intermediate_High --assessment-type summative --scores '{scores}' --strengths '{strengths}' --areas-for-growth '{growth}' --recommendations '{recommendations}'", "Conducting French student assessment")
+    for section, student_id, language, level, assessment_type, scores, strengths, growth, recommendations, step in _ASSESSMENTS:
+        print_section(section)
+        run_command(["languages", "assess-student", "--student-id", student_id, "--language", language, "--proficiency-level", level, "--assessment-type", assessment_type, "--scores", scores, "--strengths", strengths, "--areas-for-growth", growth, "--recommendations", recommendations], step)
 
 def demo_lesson_plan_management():
     """Demonstrate lesson plan management."""
     print_header("Lesson Plan Management")
 
     print_section("Creating Advanced Korean Lesson")
-    goals = '{"Interpersonal": ["Discuss Korean innovation"], "Presentational": ["Present K-tech analysis"], "Interpretive": ["Analyze Korean business culture"]}'
-    functions = "Express opinions about technology, Compare cultures, Present research findings"
-    vocabulary = "giyeok, saneop, munhwa, gyoyuk, keorieo"
-    culture = "Korean business etiquette, technology culture, education system"
-    tech = "Video conferencing tools, Korean news sources, digital presentation software"
-    run_command(f"python3 -m openeducation.cli languages create-lesson-plan --curriculum-id kr_hs_curriculum --title 'Korean Innovation and Technology Culture' --grade-level 'High School' --duration-minutes 60 --objective 'Students will analyze Korean innovation culture and its global impact' --communicative-goals '{goals}' --language-functions '{functions}' --vocabulary-focus '{vocabulary}' --cultural-elements '{culture}' --technology-tools '{tech}'", "Creating advanced Korean lesson plan")
+    run_command(["languages", "create-lesson-plan", "--curriculum-id", "kr_hs_curriculum", "--title", "Korean Innovation and Technology Culture", "--grade-level", "High School", "--duration-minutes", "60", "--objective", "Students will analyze Korean innovation culture and its global impact", "--communicative-goals", _LESSON_JSON["kr_innovation"]["goals"], "--language-functions", _LESSON_JSON["kr_innovation"]["functions"], "--vocabulary-focus", _LESSON_JSON["kr_innovation"]["vocabulary"], "--cultural-elements", _LESSON_JSON["kr_innovation"]["culture"], "--technology-tools", _LESSON_JSON["kr_innovation"]["tech"]], "Creating advanced Korean lesson plan")
 
     print_section("Creating Spanish Literature Lesson")
-    goals = '{"Interpersonal": ["Discuss social justice themes"], "Presentational": ["Present literary analysis"], "Interpretive": ["Analyze Latin American literature"]}'
-    functions = "Express opinions about social issues, Analyze literary texts, Present research findings"
-    vocabulary = "la justicia social, la igualdad, los derechos humanos, la cultura, la literatura"
-    culture = "Latin American social issues, magical realism, cultural perspectives"
-    tech = "Digital literature databases, video analysis tools, presentation software"
-    run_command(f"python3 -m openeducation.cli languages create-lesson-plan --curriculum-id es_hs_curriculum --title 'Magical Realism and Social Justice in Latin American Literature' --grade-level 'High School' --duration-minutes 75 --objective 'Students will analyze magical realism and social justice themes in Latin American literature' --communicative-goals '{goals}' --language-functions '{functions}' --vocabulary-focus '{vocabulary}' --cultural-elements '{culture}' --technology-tools '{tech}'", "Creating Spanish literature lesson plan")
+    run_command(["languages", "create-lesson-plan", "--curriculum-id", "es_hs_curriculum", "--title", "Magical Realism and Social Justice in Latin American Literature", "--grade-level", "High School", "--duration-minutes", "75", "--objective", "Students will analyze magical realism and social justice themes in Latin American literature", "--communicative-goals", _LESSON_JSON["es_literature"]["goals"], "--language-functions", _LESSON_JSON["es_literature"]["functions"], "--vocabulary-focus", _LESSON_JSON["es_literature"]["vocabulary"], "--cultural-elements", _LESSON_JSON["es_literature"]["culture"], "--technology-tools", _LESSON_JSON["es_literature"]["tech"]], "Creating Spanish literature lesson plan")
 
     print_section("Listing All Lesson Plans")
-    run_command("python3 -m openeducation.cli languages list-lesson-plans", "Showing all created lesson plans")
+    run_command(["languages", "list-lesson-plans"], "Showing all created lesson plans")
+
+_PROFESSIONAL_DEVELOPMENT = (
+    ("🏫 Professor-Level Teaching Excellence", (
+        "   • 2+ years teaching experience at university level",
+        "   • Demonstrated excellence in teaching diverse student populations",
+        "   • Native/near-native proficiency in target language",
+        "   • Expertise in applied linguistics and SLA",
+        "   • Curriculum innovation and program development",
+        "   • Student mentoring and support",
+    )),
+    ("🎓 Standards-Based Instruction", (
+        "   • ACTFL World-Readiness Standards implementation",
+        "   • Proficiency-oriented assessment and instruction",
+        "   • Communicative language teaching methodology",
+        "   • Technology integration for enhanced learning",
+        "   • Cultural competency development",
+        "   • Content-based language instruction",
+    )),
+    ("🌍 Global Citizenship Development", (
+        "   • Intercultural communication skills",
+        "   • Cultural awareness and sensitivity",
+        "   • Global perspectives and understanding",
+        "   • International collaboration opportunities",
+        "   • Cross-cultural problem-solving skills",
+    )),
+    ("💼 Professional Applications", (
+        "   • Business language and etiquette",
+        "   • Translation and interpretation skills",
+        "   • Professional presentation abilities",
+        "   • International career preparation",
+        "   • Study abroad and exchange programs",
+    )),
+)
 
 def demo_professional_development():
     """Demonstrate professional development features."""
     print_header("Professional Development & Program Enhancement")
-
-    print_section("🏫 Professor-Level Teaching Excellence")
-    print("   • 2+ years teaching experience at university level")
-    • Demonstrated excellence in teaching diverse student populations
-    • Native/near-native proficiency in target language
-    • Expertise in applied linguistics and SLA
-    • Curriculum innovation and program development
-    • Student mentoring and support
-
-    print_section("🎓 Standards-Based Instruction")
-    print("   • ACTFL World-Readiness Standards implementation")
-    • Proficiency-oriented assessment and instruction
-    • Communicative language teaching methodology
-    • Technology integration for enhanced learning
-    • Cultural competency development
-    • Content-based language instruction
-
-    print_section("🌍 Global Citizenship Development")
-    print("   • Intercultural communication skills")
-    print("   • Cultural awareness and sensitivity")
-    print("   • Global perspectives and understanding")
-    print("   • International collaboration opportunities")
-    print("   • Cross-cultural problem-solving skills")
-
-    print_section("💼 Professional Applications")
-    print("   • Business language and etiquette")
-    print("   • Translation and interpretation skills")
-    print("   • Professional presentation abilities")
-    print("   • International career preparation")
-    print("   • Study abroad and exchange programs")
+    for title, section_lines in _PROFESSIONAL_DEVELOPMENT:
+        print_section(title)
+        _emit(section_lines)
+
+_INTEGRATED_SYSTEM = (
+    ("🎯 Complete Educational Framework", (
+        "   ✅ ACTFL Standards-Based Curriculum",
+        "   ✅ Proficiency-Oriented Assessment",
+        "   ✅ Communicative Language Teaching",
+        "   ✅ Cultural Integration & Understanding",
+        "   ✅ Technology-Enhanced Learning",
+        "   ✅ Professional Development Focus",
+        "   ✅ Extracurricular Engagement",
+        "   ✅ Standards Alignment & Compliance",
+    )),
+    ("📈 Student Learning Outcomes", (
+        "   • Language Proficiency Development (Novice → Distinguished)",
+        "   • Cultural Competency & Global Citizenship",
+        "   • Critical Thinking & Analytical Skills",
+        "   • Communication & Presentation Skills",
+        "   • Intercultural Understanding & Respect",
+        "   • Professional & Career Readiness",
+    )),
+    ("👨‍🏫 Professor Expertise Integration", (
+        "   • Ph.D. Level Academic Rigor",
+        "   • Applied Linguistics Research",
+        "   • Cultural Studies Expertise",
+        "   • Technology Innovation",
+        "   • Student Mentoring & Support",
+        "   • Program Development & Leadership",
+    )),
+)
 
 def demo_integrated_system():
     """Demonstrate integrated world languages system."""
     print_header("Integrated World Languages System")
-
-    print_section("🎯 Complete Educational Framework")
-    print("   ✅ ACTFL Standards-Based Curriculum")
-    print("   ✅ Proficiency-Oriented Assessment")
-    print("   ✅ Communicative Language Teaching")
-    print("   ✅ Cultural Integration & Understanding")
-    print("   ✅ Technology-Enhanced Learning")
-    print("   ✅ Professional Development Focus")
-    print("   ✅ Extracurricular Engagement")
-    print("   ✅ Standards Alignment & Compliance")
-
-    print_section("📈 Student Learning Outcomes")
-    print("   • Language Proficiency Development (Novice → Distinguished)")
-    print("   • Cultural Competency & Global Citizenship")
-    print("   • Critical Thinking & Analytical Skills")
-    print("   • Communication & Presentation Skills")
-    print("   • Intercultural Understanding & Respect")
-    print("   • Professional & Career Readiness")
-
-    print_section("👨‍🏫 Professor Expertise Integration")
-    print("   • Ph.D. Level Academic Rigor")
-    print("   • Applied Linguistics Research")
-    print("   • Cultural Studies Expertise")
-    print("   • Technology Innovation")
-    print("   • Student Mentoring & Support")
-    print("   • Program Development & Leadership")
+    for title, section_lines in _INTEGRATED_SYSTEM:
+        print_section(title)
+        _emit(section_lines)
+
+# Joined once at import; main writes it in a single call
+_SUMMARY = "\n".join((
+    "Congratulations! You have successfully explored the complete",
+    "World Languages instruction and cultural integration system.",
+    "\n📊 What was demonstrated:",
+    "   ✅ Professor-level Ph.D. expertise integration",
+    "   ✅ ACTFL standards and proficiency frameworks",
+    "   ✅ Comprehensive curricula for all 5 languages",
+    "   ✅ Standards-based lesson planning",
+    "   ✅ Cultural enrichment activities",
+    "   ✅ Student assessment and progress tracking",
+    "   ✅ Technology integration and innovation",
+    "   ✅ Professional development and mentoring",
+    "\n🌟 Key Features Implemented:",
+    "   🎓 Ph.D. Level Academic Rigor - Applied linguistics expertise",
+    "   📚 ACTFL Standards Alignment - World-readiness standards",
+    "   🌍 Cultural Integration - Authentic cultural experiences",
+    "   💻 Technology Innovation - Digital tools and platforms",
+    "   📊 Proficiency Assessment - Standards-based evaluation",
+    "   🤝 Student Mentoring - Diverse background support",
+    "   🎭 Extracurricular Activities - Cultural events and exchanges",
+    "   💼 Professional Development - Career and internship preparation",
+    "\n🎓 Language Programs Developed:",
+    "   🗾 Japanese - Cultural fluency and professional communication",
+    "   🀄 Mandarin - Character mastery and contemporary culture",
+    "   🇰🇷 Korean - Innovation culture and global perspectives",
+    "   🇫🇷 French - Literature, social issues, and global citizenship",
+    "   🇪🇸 Spanish - Social justice, community engagement, and identity",
+    "\n📈 Proficiency Development:",
+    "   📊 Novice → Intermediate → Advanced → Superior → Distinguished",
+    "   💬 Interpersonal, Interpretive, Presentational modes",
+    "   🌍 Integrated cultural competencies",
+    "   💼 Professional applications and career readiness",
+    "   📚 Content-based language instruction",
+    "\n🎯 Ready for World Languages Instruction!",
+    "   🏫 Comprehensive K-12 World Languages Programs",
+    "   👨‍🏫 Professor-Level Expertise and Rigor",
+    "   👶 Diverse Student Population Support",
+    "   🌍 Global Citizenship Development",
+    "   💼 Professional and Career Preparation",
+    "   📱 Technology-Enhanced Language Learning",
+)) + "\n"
+
+# Demo sections in the order main runs them; names can be passed on the command line
+DEMOS = (
+    ("expertise", demo_professor_expertise),
+    ("actfl", demo_actfl_standards),
+    ("curricula", demo_curricula_overview),
+    ("lessons", demo_lesson_planning),
+    ("activities", demo_cultural_activities),
+    ("assessment", demo_student_assessment),
+    ("lesson-management", demo_lesson_plan_management),
+    ("professional", demo_professional_development),
+    ("integrated", demo_integrated_system),
+)
 
 def main():
-    """Main demonstration function."""
+    """Main demonstration function.
+
+    Runs every section by default; ``world_languages_demonstration.py actfl lessons``
+    runs only the named ones, without waiting for Enter.
+    """
+    argv = sys.argv[1:]
+    selected = {arg for arg in argv if not arg.startswith("--")}
+    unknown = selected.difference(name for name, _ in DEMOS)
+    if unknown:
+        print(f"❌ Unknown demo section(s): {', '.join(sorted(unknown))}")
+        print(f"   Available: {', '.join(name for name, _ in DEMOS)}")
+        return
+
     print("🌍 OpenEducation World Languages Instruction System")
     print("=" * 85)
     print("Comprehensive demonstration of world languages instruction designed by")
     print("professor-level experts with Ph.D. qualifications in language and culture.")
-    print("\nPress Enter to begin...")
-    input()
+    if not selected:
+        print("\nPress Enter to begin...")
+        input()
 
     # Check environment
-    if not check_environment():
+    if not check_environment(force_setup="--force-setup" in argv):
         print("❌ Environment setup failed. Please fix issues and try again.")
         return
 
     # Run comprehensive world languages demonstration
     try:
-        # Professor expertise demonstration
-        demo_professor_expertise()
-
-        # ACTFL standards and frameworks
-        demo_actfl_standards()
-
-        # Comprehensive curricula overview
-        demo_curricula_overview()
-
-        # Lesson planning demonstration
-        demo_lesson_planning()
-
-        # Cultural activities and events
-        demo_cultural_activities()
-
-        # Student assessment and progress tracking
-        demo_student_assessment()
-
-        # Lesson plan management
-        demo_lesson_plan_management()
-
-        # Professional development features
-        demo_professional_development()
-
-        # Integrated system overview
-        demo_integrated_system()
-
-        # Final comprehensive summary
-        print_header("🎉 WORLD LANGUAGES SYSTEM DEMONSTRATION COMPLETE!")
-        print("Congratulations! You have successfully explored the complete")
-        print("World Languages instruction and cultural integration system.")
-        print("\n📊 What was demonstrated:")
-        print("   ✅ Professor-level Ph.D. expertise integration")
-        print("   ✅ ACTFL standards and proficiency frameworks")
-        print("   ✅ Comprehensive curricula for all 5 languages")
-        print("   ✅ Standards-based lesson planning")
-        print("   ✅ Cultural enrichment activities")
-        print("   ✅ Student assessment and progress tracking")
-        print("   ✅ Technology integration and innovation")
-        print("   ✅ Professional development and mentoring")
-
-        print("
-🌟 Key Features Implemented:"        print("   🎓 Ph.D. Level Academic Rigor - Applied linguistics expertise")
-        print("   📚 ACTFL Standards Alignment - World-readiness standards")
-        print("   🌍 Cultural Integration - Authentic cultural experiences")
-        print("   💻 Technology Innovation - Digital tools and platforms")
-        print("   📊 Proficiency Assessment - Standards-based evaluation")
-        print("   🤝 Student Mentoring - Diverse background support")
-        print("   🎭 Extracurricular Activities - Cultural events and exchanges")
-        print("   💼 Professional Development - Career and internship preparation")
-
-        print("
-🎓 Language Programs Developed:"        print("   🗾 Japanese - Cultural fluency and professional communication")
-        print("   🀄 Mandarin - Character mastery and contemporary culture")
-        print("   🇰🇷 Korean - Innovation culture and global perspectives")
-        print("   🇫🇷 French - Literature, social issues, and global citizenship")
-        print("   🇪🇸 Spanish - Social justice, community engagement, and identity")
-
-        print("
-📈 Proficiency Development:"        print("   📊 Novice → Intermediate → Advanced → Superior → Distinguished")
-        print("   💬 Interpersonal, Interpretive, Presentational modes")
-        print("   🌍 Integrated cultural competencies")
-        print("   💼 Professional applications and career readiness")
-        print("   📚 Content-based language instruction")
-
-        print("
-🎯 Ready for World Languages Instruction!"        print("   🏫 Comprehensive K-12 World Languages Programs")
-        print("   👨‍🏫 Professor-Level Expertise and Rigor")
-        print("   👶 Diverse Student Population Support")
-        print("   🌍 Global Citizenship Development")
-        print("   💼 Professional and Career Preparation")
-        print("   📱 Technology-Enhanced Language Learning")
+        for name, demo in DEMOS:
+            if not selected or name in selected:
+                demo()
+
+        if not selected:
+            # Final comprehensive summary
+            print_header("🎉 WORLD LANGUAGES SYSTEM DEMONSTRATION COMPLETE!")
+            sys.stdout.write(_SUMMARY)
 
     except KeyboardInterrupt:
         print("\n\n⏹️  Demo interrupted by user")